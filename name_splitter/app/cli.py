@@ -122,6 +122,10 @@ def _build_subcommand_parser() -> argparse.ArgumentParser:
         "--recursive", action="store_true",
         help="Recursively scan sub-directories for PNG files",
     )
+    sp_batch.add_argument(
+        "--workers", dest="workers", type=int, default=1,
+        help="Number of images processed in parallel (default: 1, 0 = CPU count)",
+    )
 
     return parser
 
@@ -242,7 +246,9 @@ def _run_batch_subcommand(args: argparse.Namespace) -> int:
               f"{getattr(ev, 'job_name', '')}")
 
     try:
-        result = run_batch(job_specs, on_progress=on_batch_progress)
+        result = run_batch(
+            job_specs, on_progress=on_batch_progress, max_workers=args.workers
+        )
         print(
             f"Batch complete: {result.successful_jobs} OK, "
             f"{result.failed_jobs} failed / {result.total_jobs} total"
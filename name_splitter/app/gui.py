@@ -35,8 +35,7 @@ from name_splitter.app.gui_state import GuiState
 from name_splitter.app.gui_handlers import GuiWidgets, GuiHandlers
 from name_splitter.app.gui_widgets import WidgetBuilder
 from name_splitter.app.gui_types import (
-    CommonFields, ImageFields, TemplateFields, UiElements, BatchFields,
-    PresetFields, RecentFields,
+    UiElements, RecentFields,
 )
 from name_splitter.app.app_settings import load_app_settings, save_app_settings
 
@@ -92,8 +91,7 @@ def main() -> None:
         image_fields = builder.create_image_split_fields()
         template_fields = builder.create_template_fields()
         ui_elements = builder.create_ui_elements()
-        batch_fields = builder.create_batch_fields()
-        preset_fields_dict = builder.create_preset_fields()
+        preset_fields_obj = builder.create_preset_fields()
         # A-2: recent file dropdowns
         recent_input_dd = builder.create_recent_dropdown(
             "最近の入力画像", app_settings.recent_inputs
@@ -108,51 +106,51 @@ def main() -> None:
             quick_run_btn.disabled = False
         
         # Extract frequently used widgets for convenience
-        config_field = common_fields["config_field"]
-        page_size_field = common_fields["page_size_field"]
-        orientation_field = common_fields["orientation_field"]
-        dpi_field = common_fields["dpi_field"]
-        custom_size_unit_field = common_fields["custom_size_unit_field"]
-        custom_width_field = common_fields["custom_width_field"]
-        custom_height_field = common_fields["custom_height_field"]
-        size_info_text = common_fields["size_info_text"]
-        rows_field = common_fields["rows_field"]
-        cols_field = common_fields["cols_field"]
-        order_field = common_fields["order_field"]
-        gutter_unit_field = common_fields["gutter_unit_field"]
-        gutter_field = common_fields["gutter_field"]
-        margin_unit_field = common_fields["margin_unit_field"]
-        margin_top_field = common_fields["margin_top_field"]
-        margin_bottom_field = common_fields["margin_bottom_field"]
-        margin_left_field = common_fields["margin_left_field"]
-        margin_right_field = common_fields["margin_right_field"]
+        config_field = common_fields.config_field
+        page_size_field = common_fields.page_size_field
+        orientation_field = common_fields.orientation_field
+        dpi_field = common_fields.dpi_field
+        custom_size_unit_field = common_fields.custom_size_unit_field
+        custom_width_field = common_fields.custom_width_field
+        custom_height_field = common_fields.custom_height_field
+        size_info_text = common_fields.size_info_text
+        rows_field = common_fields.rows_field
+        cols_field = common_fields.cols_field
+        order_field = common_fields.order_field
+        gutter_unit_field = common_fields.gutter_unit_field
+        gutter_field = common_fields.gutter_field
+        margin_unit_field = common_fields.margin_unit_field
+        margin_top_field = common_fields.margin_top_field
+        margin_bottom_field = common_fields.margin_bottom_field
+        margin_left_field = common_fields.margin_left_field
+        margin_right_field = common_fields.margin_right_field
         
-        input_field = image_fields["input_field"]
-        out_dir_field = image_fields["out_dir_field"]
-        test_page_field = image_fields["test_page_field"]
+        input_field = image_fields.input_field
+        out_dir_field = image_fields.out_dir_field
+        test_page_field = image_fields.test_page_field
         
-        template_out_field = template_fields["template_out_field"]
-        draw_finish_field = template_fields["draw_finish_field"]
-        finish_size_mode_field = template_fields["finish_size_mode_field"]
-        finish_width_field = template_fields["finish_width_field"]
-        finish_height_field = template_fields["finish_height_field"]
-        finish_offset_x_field = template_fields["finish_offset_x_field"]
-        finish_offset_y_field = template_fields["finish_offset_y_field"]
-        finish_color_field = template_fields["finish_color_field"]
-        finish_alpha_field = template_fields["finish_alpha_field"]
-        finish_line_width_field = template_fields["finish_line_width_field"]
-        draw_basic_field = template_fields["draw_basic_field"]
-        basic_size_mode_field = template_fields["basic_size_mode_field"]
-        basic_width_field = template_fields["basic_width_field"]
-        basic_height_field = template_fields["basic_height_field"]
-        basic_offset_x_field = template_fields["basic_offset_x_field"]
-        basic_offset_y_field = template_fields["basic_offset_y_field"]
-        basic_color_field = template_fields["basic_color_field"]
-        basic_alpha_field = template_fields["basic_alpha_field"]
-        basic_line_width_field = template_fields["basic_line_width_field"]
-        grid_color_field = common_fields["grid_color_field"]
-        grid_alpha_field = common_fields["grid_alpha_field"]
-        grid_width_field = common_fields["grid_width_field"]
+        template_out_field = template_fields.template_out_field
+        draw_finish_field = template_fields.draw_finish_field
+        finish_size_mode_field = template_fields.finish_size_mode_field
+        finish_width_field = template_fields.finish_width_field
+        finish_height_field = template_fields.finish_height_field
+        finish_offset_x_field = template_fields.finish_offset_x_field
+        finish_offset_y_field = template_fields.finish_offset_y_field
+        finish_color_field = template_fields.finish_color_field
+        finish_alpha_field = template_fields.finish_alpha_field
+        finish_line_width_field = template_fields.finish_line_width_field
+        draw_basic_field = template_fields.draw_basic_field
+        basic_size_mode_field = template_fields.basic_size_mode_field
+        basic_width_field = template_fields.basic_width_field
+        basic_height_field = template_fields.basic_height_field
+        basic_offset_x_field = template_fields.basic_offset_x_field
+        basic_offset_y_field = template_fields.basic_offset_y_field
+        basic_color_field = template_fields.basic_color_field
+        basic_alpha_field = template_fields.basic_alpha_field
+        basic_line_width_field = template_fields.basic_line_width_field
+        grid_color_field = common_fields.grid_color_field
+        grid_alpha_field = common_fields.grid_alpha_field
+        grid_width_field = common_fields.grid_width_field
         
         log_field = ui_elements["log_field"]
         progress_bar = ui_elements["progress_bar"]
@@ -168,8 +166,7 @@ def main() -> None:
         run_btn = ft.ElevatedButton("Run", icon=ft.Icons.PLAY_ARROW)
         cancel_btn = ft.OutlinedButton("Cancel", icon=ft.Icons.CANCEL, disabled=True)
 
-        # Build PresetFields and RecentFields typed groups
-        preset_fields_obj = PresetFields(**preset_fields_dict)
+        # Build RecentFields typed group
         recent_fields_obj = RecentFields(
             recent_input_dropdown=recent_input_dd,
             recent_config_dropdown=recent_config_dd,
@@ -177,9 +174,9 @@ def main() -> None:
 
         # Initialize GuiWidgets using grouped field dataclasses
         widgets = GuiWidgets(
-            common=CommonFields(**common_fields),
-            image=ImageFields(**image_fields),
-            template=TemplateFields(**template_fields),
+            common=common_fields,
+            image=image_fields,
+            template=template_fields,
             ui=UiElements(
                 **ui_elements,
                 run_btn=run_btn,
@@ -187,7 +184,8 @@ def main() -> None:
                 quick_run_btn=quick_run_btn,
                 recent=recent_fields_obj,
             ),
-            batch=BatchFields(**batch_fields),
+            # Why: Batch widgets are created when the Batch tab is first opened.
+            batch=None,
             preset=preset_fields_obj,
         )
         
@@ -195,13 +193,13 @@ def main() -> None:
 
         # A-2: helper to refresh a recent-files dropdown in-place
         def _refresh_recent_dd(dropdown: Any, paths: list[str]) -> None:
-            """Rebuild a recent-files dropdown options list from the given paths."""
+            """Refresh a recent-files dropdown's options from the given paths."""
             try:
-                dropdown.options = [ft.dropdown.Option(p) for p in paths]
-                try:
-                    dropdown.update()
-                except Exception:  # noqa: BLE001
-                    pass
+                if builder.update_recent_dropdown(dropdown, paths):
+                    try:
+                        dropdown.update()
+                    except Exception:  # noqa: BLE001
+                        pass
             except Exception:  # noqa: BLE001
                 pass
         
@@ -391,9 +389,9 @@ def main() -> None:
             _cb.on_change = make_blur_handler()
 
         # A-1: Preset events
-        preset_fields_dict["dropdown"].on_change = handlers.on_load_preset
-        preset_fields_dict["save_btn"].on_click = handlers.on_save_preset
-        preset_fields_dict["delete_btn"].on_click = handlers.on_delete_preset
+        preset_fields_obj.dropdown.on_change = handlers.on_load_preset
+        preset_fields_obj.save_btn.on_click = handlers.on_save_preset
+        preset_fields_obj.delete_btn.on_click = handlers.on_delete_preset
         # Populate preset dropdown with saved presets on startup
         handlers._refresh_preset_dropdown(app_settings)
 
@@ -468,24 +466,45 @@ def main() -> None:
             import_config=handlers.on_import_config,
             log_file_toggle=log_file_toggle,
         )
-        tab_image = builder.build_tab_image(
-            image_fields, run_btn, cancel_btn, pick_input, pick_out_dir,
-            open_output_folder=handlers.on_open_output_folder,
-            recent_input_dropdown=recent_input_dd,
-            quick_run_btn=quick_run_btn,
+        # Why: Only the Config tab (selected_index=0) is laid out for the
+        #      first paint. Image and Template fields stay eager (handlers,
+        #      shortcuts and size info read them at startup); only their
+        #      layout trees wait for the tab's first selection.
+        tab_image = builder.lazy_tab(
+            1,
+            lambda: builder.build_tab_image(
+                image_fields, run_btn, cancel_btn, pick_input, pick_out_dir,
+                open_output_folder=handlers.on_open_output_folder,
+                recent_input_dropdown=recent_input_dd,
+                quick_run_btn=quick_run_btn,
+            ),
         )
-        tab_template = builder.build_tab_template(
-            template_fields, tmpl_btn, pick_template_out
+        tab_template = builder.lazy_tab(
+            2,
+            lambda: builder.build_tab_template(
+                template_fields, tmpl_btn, pick_template_out
+            ),
         )
 
-        # Batch tab — wire run/cancel buttons to batch handlers
-        batch_fields["batch_run_btn"].on_click = handlers.on_run_batch
-        batch_fields["batch_cancel_btn"].on_click = handlers.on_cancel_batch
-        tab_batch = builder.build_tab_batch(
-            batch_fields,
-            pick_batch_dir=handlers._pick_batch_dir,
-            pick_batch_out_dir=handlers._pick_batch_out_dir,
-        )
+        def on_tab_change(e: Any) -> None:
+            builder.ensure_tab_built(int(e.data))
+            handlers.on_tab_change(e)
+
+        # Batch tab — fields and layout are built on first activation.
+        # Why: Batch handlers already guard on widgets.batch being None, so
+        #      nothing needs these widgets before the tab is opened.
+        def build_batch_tab() -> object:
+            batch_fields = builder.batch_fields
+            batch_fields.batch_run_btn.on_click = handlers.on_run_batch
+            batch_fields.batch_cancel_btn.on_click = handlers.on_cancel_batch
+            widgets.batch = batch_fields
+            return builder.build_tab_batch(
+                batch_fields,
+                pick_batch_dir=handlers._pick_batch_dir,
+                pick_batch_out_dir=handlers._pick_batch_out_dir,
+            )
+
+        tab_batch = builder.lazy_tab(3, build_batch_tab)
 
         # ============================================================== #
         #  レイアウト組み立て: Preview(左) | Settings(右)                  #
@@ -545,7 +564,7 @@ def main() -> None:
                         ft.Tabs(
                             length=5,
                             selected_index=0,
-                            on_change=handlers.on_tab_change,
+                            on_change=on_tab_change,
                             content=ft.Column([
                                 ft.TabBar(tabs=[
                                     ft.Tab(label="Config", icon=ft.Icons.SETTINGS),
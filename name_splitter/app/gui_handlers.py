@@ -10,7 +10,6 @@ How: GuiHandlers inherits GuiHandlersSizeMixin (size computations and UI
 """
 from __future__ import annotations
 
-import base64
 import os
 import subprocess
 import sys
@@ -123,15 +122,16 @@ class GuiHandlers(
     # ------------------------------------------------------------------ #
 
     def add_log(self, msg: str) -> None:
-        """Append a timestamped line to the log text field.
+        """Append a timestamped line to the log list.
 
         Why: All handlers share a single log area; centralising the format
              keeps timestamps consistent across the application.
         How: Prepends current time in HH:MM:SS format to the message and
-             appends to the existing field value.
+             appends it as a new row, so earlier lines are never resent.
         """
         ts = datetime.now().strftime("%H:%M:%S")
-        self.w.ui.log_field.value = f"{self.w.ui.log_field.value or ''}{ts} {msg}\n"
+        ui = self.w.ui
+        ui.log_field.controls.append(ui.log_line(f"{ts} {msg}"))
 
     def add_error_log(self, msg: str) -> None:
         """Append an error-prefixed timestamped line to the log.
@@ -285,9 +285,7 @@ class GuiHandlers(
                 png = build_template_preview_png(
                     w, h, grid_cfg, self.build_template_style(), dpi
                 )
-                self.w.ui.preview_image.src = (
-                    f"data:image/png;base64,{base64.b64encode(png).decode('ascii')}"
-                )
+                self.w.ui.preview_image.src = png
                 self.set_status("Template preview")
             else:
                 path = (self.w.image.input_field.value or "").strip()
@@ -322,9 +320,7 @@ class GuiHandlers(
                     cached_image=cached_image,
                     cached_scale=cached_scale,
                 )
-                self.w.ui.preview_image.src = (
-                    f"data:image/jpeg;base64,{base64.b64encode(jpeg_bytes).decode('ascii')}"
-                )
+                self.w.ui.preview_image.src = jpeg_bytes
                 self.set_status(msg)
             self.w.ui.preview_loading_ring.visible = False
             self.flush()
@@ -706,10 +702,10 @@ class GuiHandlers(
 
         Why: Clipboard access is asynchronous in Flet; a coroutine avoids
              blocking the UI thread.
-        How: Reads log_field.value and calls clipboard.set(); guards against
-             empty log and unavailable clipboard service.
+        How: Joins the log rows' text and calls clipboard.set(); guards
+             against empty log and unavailable clipboard service.
         """
-        text = (self.w.ui.log_field.value or "").strip()
+        text = "\n".join(row.value for row in self.w.ui.log_field.controls).strip()
         if not text:
             self.add_log("Log is empty")
             self.flush()
@@ -740,9 +736,9 @@ class GuiHandlers(
 
         Why: Users accumulate logs during iterative adjustments; a clear
              button prevents scrolling through outdated entries.
-        How: Empties the log_field value and resets status to Idle.
+        How: Removes all log rows and resets status to Idle.
         """
-        self.w.ui.log_field.value = ""
+        self.w.ui.log_field.controls.clear()
         self.set_status("Idle")
         self.flush()
 
@@ -6,8 +6,19 @@ dynamic nature.
 """
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
-from typing import Protocol, Any, Callable, Optional
+from typing import Any, Callable, Optional
+
+# Why: typing_extensions.Protocol creates classes faster than typing's on
+#      Python < 3.12. It is optional; fall back to typing when absent.
+if sys.version_info >= (3, 12):
+    from typing import Protocol
+else:
+    try:
+        from typing_extensions import Protocol
+    except ImportError:
+        from typing import Protocol  # type: ignore[assignment]
 
 
 # ============================================================== #
@@ -26,6 +37,7 @@ class FletTextField(Protocol):
     multiline: bool
     error_text: Optional[str]
     on_change: Optional[Callable[[Any], None]]
+    on_blur: Optional[Callable[[Any], None]]
 
 
 class FletDropdown(Protocol):
@@ -58,9 +70,16 @@ class FletProgressBar(Protocol):
     width: int
 
 
+class FletListView(Protocol):
+    """Protocol for Flet ListView widget."""
+    controls: list[Any]
+    auto_scroll: bool
+    spacing: int
+
+
 class FletImage(Protocol):
     """Protocol for Flet Image widget."""
-    src: str
+    src: str | bytes  # URL/base64 string or raw encoded image bytes
     width: int
     height: int
     fit: str
@@ -93,6 +112,7 @@ Checkbox = FletCheckbox
 # Display widgets
 Text = FletText
 ProgressBar = FletProgressBar
+ListView = FletListView
 Image = FletImage
 
 # Interactive widgets
@@ -113,7 +133,11 @@ Clipboard = Any
 #  Widget Field Groups (Phase 6: Data Structure Improvement)    #
 # ============================================================== #
 
-@dataclass
+# Why: Field groups are plain attribute bags that are never compared or
+#      printed; skipping __eq__/__repr__ generation and using __slots__
+#      keeps import cheap and instances small.
+
+@dataclass(slots=True, eq=False, repr=False)
 class CommonFields:
     """Common settings fields: config, page size, DPI, grid, margins."""
     
@@ -148,7 +172,7 @@ class CommonFields:
     margin_right_field: TextField
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class ImageFields:
     """Image split tab fields."""
     
@@ -162,7 +186,7 @@ class ImageFields:
     odd_even_field: Dropdown
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class TemplateFields:
     """Template generation tab fields."""
     
@@ -193,23 +217,24 @@ class TemplateFields:
     basic_color_swatch: Any  # Color preview container for basic frame color
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class UiElements:
     """Common UI elements: log, progress, status, preview."""
     
-    log_field: TextField
+    log_field: ListView  # One Text row per log line
     progress_bar: ProgressBar
     status_text: Text
     preview_image: Image
     preview_viewer: InteractiveViewer
     preview_loading_ring: Any  # ProgressRing shown during preview generation
+    log_line: Callable[[str], Any]  # Builds one log row control from a line
     run_btn: Button
     cancel_btn: Button
     quick_run_btn: Button | None = None
     recent: Any | None = None  # RecentFields — optional, avoids circular import
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class BatchFields:
     """Batch processing tab fields.
 
@@ -228,7 +253,7 @@ class BatchFields:
     batch_status_text: Text
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class PresetFields:
     """Preset management UI controls for the Config tab.
 
@@ -244,7 +269,7 @@ class PresetFields:
     delete_btn: Any    # ft.OutlinedButton — delete selected preset
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class RecentFields:
     """Recent-file dropdowns for quick input/config reuse.
 
@@ -5,16 +5,28 @@ Fletのウィジェットや外部状態に直接依存しません。
 """
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Callable, Optional
 
 from name_splitter.core.config import GridConfig
 from name_splitter.core.template import (
+    PAPER_SIZES_MM,
     TemplateStyle,
     compute_page_size_px as template_compute_page_size_px,
     parse_hex_color,
 )
 
+# Why: convert_unit_value runs on every unit toggle; a regex precheck is
+#      cheaper than entering float()'s exception path for non-numeric input.
+_NUMBER_RE = re.compile(r"^\s*[+-]?(?:\d+(?:\.\d*)?|\.\d+)\s*$")
+
+# Frame-size modes that map directly to a paper preset ("A4", "B5", ...)
+_PRESET_MODES = frozenset(PAPER_SIZES_MM)
+# Units understood by the px/mm conversion helpers
+_UNITS = frozenset({"px", "mm"})
+
 
 # ============================================================== #
 #  基本的なパーサー（純粋関数）                                      #
@@ -33,10 +45,15 @@ def parse_int(val: str, label: str) -> int:
     Raises:
         ValueError: 変換に失敗した場合
     """
-    try:
-        return int(val)
-    except ValueError as exc:
-        raise ValueError(f"{label} must be an integer") from exc
+    # Why: Typos such as "1,000" or "3.5" are common in free-form fields;
+    #      rejecting them up front avoids int()'s exception path.
+    # How: isdecimal() accepts exactly the digits int() does (including
+    #      full-width IME input) but not "²"-style superscripts.
+    text = val.strip()
+    digits = text[1:] if text[:1] in ("+", "-") else text
+    if digits.isdecimal():
+        return int(text)
+    raise ValueError(f"{label} must be an integer")
 
 
 def parse_float(val: str, label: str) -> float:
@@ -72,7 +89,9 @@ def mm_to_px(mm: float, dpi: int) -> int:
     Returns:
         ピクセル値（整数、0以上）
     """
-    return max(0, int(round(mm * dpi / 25.4)))
+    # Why: 25.4 mm == 254 / 10 inch, so "+127 then // 254" rounds exact
+    #      ties half-up without a round() call (round() rounds them to even).
+    return max(0, int((mm * dpi * 10 + 127) // 254))
 
 
 def px_to_mm(px: int, dpi: int) -> float:
@@ -90,6 +109,20 @@ def px_to_mm(px: int, dpi: int) -> float:
     return px * 25.4 / dpi
 
 
+def _px_to_px(px: float, dpi: int) -> int:
+    """px 値を整数ピクセルに丸める（DPI は未使用、mm_to_px と同じシグネチャ）。"""
+    return max(0, int(px))
+
+
+# Why: convert_margin_to_px runs five times per grid build; a dict lookup
+#      replaces the per-call unit string comparison. Unknown units fall
+#      back to px, as before.
+_UNIT_TO_PX: dict[str, Callable[[float, int], int]] = {
+    "mm": mm_to_px,
+    "px": _px_to_px,
+}
+
+
 def convert_margin_to_px(val_str: str, unit: str, dpi: int) -> int:
     """マージン値をピクセルに変換（単位を考慮）。
     
@@ -101,17 +134,27 @@ def convert_margin_to_px(val_str: str, unit: str, dpi: int) -> int:
     Returns:
         ピクセル値（整数、0以上）
     """
-    val = parse_float(val_str or "0", "Margin")
-    if unit == "mm":
-        return mm_to_px(val, dpi)
-    return max(0, int(val))
+    to_px = _UNIT_TO_PX.get(unit, _px_to_px)
+    return to_px(parse_float(val_str or "0", "Margin"), dpi)
 
 
 # ============================================================== #
 #  ページサイズ計算                                                #
 # ============================================================== #
 
-@dataclass
+@lru_cache(maxsize=64)
+def _preset_size_px(size_name: str, dpi: int, orientation: str) -> tuple[int, int]:
+    """プリセット用紙サイズをピクセルで取得（キャッシュ付き）。
+
+    Why: Preview/Run のたびに同じ (用紙, DPI, 向き) の組み合わせで
+         サイズを再計算していた。組み合わせは数十通りしかない。
+    How: template.compute_page_size_px を lru_cache で包む。
+         戻り値は不変のタプルなので共有して問題ない。
+    """
+    return template_compute_page_size_px(size_name, dpi, orientation)
+
+
+@dataclass(frozen=True, slots=True)
 class PageSizeParams:
     """ページサイズ計算に必要なパラメータ。
     
@@ -151,10 +194,10 @@ def compute_page_size_px(params: PageSizeParams, last_w: int = 0, last_h: int =
         if last_w > 0 and last_h > 0:
             return last_w, last_h
         # フォールバック: A4
-        return template_compute_page_size_px("A4", params.dpi, params.orientation)
+        return _preset_size_px("A4", params.dpi, params.orientation)
     
     # プリセットサイズ
-    return template_compute_page_size_px(params.page_size_name, params.dpi, params.orientation)
+    return _preset_size_px(params.page_size_name, params.dpi, params.orientation)
 
 
 def compute_canvas_size_px(grid: GridConfig, page_w_px: int, page_h_px: int) -> tuple[int, int]:
@@ -168,26 +211,18 @@ def compute_canvas_size_px(grid: GridConfig, page_w_px: int, page_h_px: int) ->
     Returns:
         (キャンバス幅px, キャンバス高さpx) のタプル
     """
-    canvas_w = (
-        grid.margin_left_px 
-        + grid.margin_right_px 
-        + grid.cols * page_w_px 
-        + (grid.cols - 1) * grid.gutter_px
-    )
-    canvas_h = (
-        grid.margin_top_px 
-        + grid.margin_bottom_px 
-        + grid.rows * page_h_px 
-        + (grid.rows - 1) * grid.gutter_px
+    cols, rows, gutter = grid.cols, grid.rows, grid.gutter_px
+    return (
+        grid.margin_left_px + grid.margin_right_px + cols * page_w_px + (cols - 1) * gutter,
+        grid.margin_top_px + grid.margin_bottom_px + rows * page_h_px + (rows - 1) * gutter,
     )
-    return canvas_w, canvas_h
 
 
 # ============================================================== #
 #  フレームサイズ計算（Template用）                                 #
 # ============================================================== #
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FrameSizeParams:
     """フレームサイズ計算に必要なパラメータ。"""
     mode: str  # "Use per-page size", "A4", "Custom mm", "Custom px" など
@@ -199,6 +234,44 @@ class FrameSizeParams:
     page_height_px: int  # Use per-page size時の参照値
 
 
+def _frame_px_to_mm(width_px: int, height_px: int, dpi: int) -> tuple[float, float]:
+    # Why: Both axes share one DPI, so compute the mm-per-px factor once.
+    if dpi <= 0:
+        raise ValueError("DPI must be positive")
+    mm_per_px = 25.4 / dpi
+    return width_px * mm_per_px, height_px * mm_per_px
+
+
+def _frame_size_per_page(params: FrameSizeParams) -> tuple[float, float]:
+    return _frame_px_to_mm(params.page_width_px, params.page_height_px, params.dpi)
+
+
+def _frame_size_preset(params: FrameSizeParams) -> tuple[float, float]:
+    wpx, hpx = _preset_size_px(params.mode, params.dpi, params.orientation)
+    return _frame_px_to_mm(wpx, hpx, params.dpi)
+
+
+def _frame_size_custom_px(params: FrameSizeParams) -> tuple[float, float]:
+    wpx = parse_int(params.width_value or "0", "Width px")
+    hpx = parse_int(params.height_value or "0", "Height px")
+    return _frame_px_to_mm(wpx, hpx, params.dpi)
+
+
+def _frame_size_custom_mm(params: FrameSizeParams) -> tuple[float, float]:
+    return parse_float(params.width_value or "0", "Width mm"), parse_float(params.height_value or "0", "Height mm")
+
+
+# Why: One dict lookup replaces the chain of mode string comparisons.
+# How: Paper presets share one handler; unknown modes fall back to
+#      "Custom mm" in compute_frame_size_mm, as before.
+_FRAME_MODE_HANDLERS: dict[str, Callable[[FrameSizeParams], tuple[float, float]]] = {
+    "Use per-page size": _frame_size_per_page,
+    "Custom px": _frame_size_custom_px,
+    "Custom mm": _frame_size_custom_mm,
+    **{mode: _frame_size_preset for mode in _PRESET_MODES},
+}
+
+
 def compute_frame_size_mm(params: FrameSizeParams) -> tuple[float, float]:
     """フレームサイズをミリメートルで計算。
     
@@ -208,29 +281,15 @@ def compute_frame_size_mm(params: FrameSizeParams) -> tuple[float, float]:
     Returns:
         (幅mm, 高さmm) のタプル
     """
-    mode = params.mode or "Use per-page size"
-    
-    if mode == "Use per-page size":
-        return px_to_mm(params.page_width_px, params.dpi), px_to_mm(params.page_height_px, params.dpi)
-    
-    if mode in {"A4", "A5", "B4", "B5"}:
-        wpx, hpx = template_compute_page_size_px(mode, params.dpi, params.orientation)
-        return px_to_mm(wpx, params.dpi), px_to_mm(hpx, params.dpi)
-    
-    if mode == "Custom px":
-        wpx = parse_int(params.width_value or "0", "Width px")
-        hpx = parse_int(params.height_value or "0", "Height px")
-        return px_to_mm(wpx, params.dpi), px_to_mm(hpx, params.dpi)
-    
-    # "Custom mm"
-    return parse_float(params.width_value or "0", "Width mm"), parse_float(params.height_value or "0", "Height mm")
+    handler = _FRAME_MODE_HANDLERS.get(params.mode or "Use per-page size", _frame_size_custom_mm)
+    return handler(params)
 
 
 # ============================================================== #
 #  GridConfig & TemplateStyle ビルダー                           #
 # ============================================================== #
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GridConfigParams:
     """GridConfig構築に必要なパラメータ。"""
     rows: str
@@ -251,24 +310,36 @@ class GridConfigParams:
     page_size_unit: str
 
 
+@lru_cache(maxsize=8)
 def build_grid_config(params: GridConfigParams) -> GridConfig:
     """GridConfigを構築。
     
+    Why: Preview を連打すると同じ入力で何度も呼ばれる。
+    How: params は frozen（ハッシュ可能）、戻り値の GridConfig も frozen
+         なので lru_cache で結果を共有する。
+    
     Args:
         params: グリッド設定パラメータ
         
     Returns:
         構築されたGridConfig
     """
-    rows = parse_int(params.rows or "0", "Rows")
-    cols = parse_int(params.cols or "0", "Cols")
-    dpi = parse_int(params.dpi or "300", "DPI")
+    # Why: Local names avoid repeated global lookups on the UI thread.
+    to_int, to_float = parse_int, parse_float
     
-    m_top = convert_margin_to_px(params.margin_top, params.margin_unit, dpi)
-    m_bottom = convert_margin_to_px(params.margin_bottom, params.margin_unit, dpi)
-    m_left = convert_margin_to_px(params.margin_left, params.margin_unit, dpi)
-    m_right = convert_margin_to_px(params.margin_right, params.margin_unit, dpi)
-    gutter = convert_margin_to_px(params.gutter, params.gutter_unit, dpi)
+    rows = to_int(params.rows or "0", "Rows")
+    cols = to_int(params.cols or "0", "Cols")
+    dpi = to_int(params.dpi or "300", "DPI")
+    
+    # The four margins share one unit: resolve the converter once and
+    # convert them in a single pass (same rules as convert_margin_to_px).
+    margin_to_px = _UNIT_TO_PX.get(params.margin_unit, _px_to_px)
+    m_top, m_bottom, m_left, m_right = [
+        margin_to_px(to_float(value or "0", "Margin"), dpi)
+        for value in (params.margin_top, params.margin_bottom, params.margin_left, params.margin_right)
+    ]
+    gutter_to_px = _UNIT_TO_PX.get(params.gutter_unit, _px_to_px)
+    gutter = gutter_to_px(to_float(params.gutter or "0", "Margin"), dpi)
     
     return GridConfig(
         rows=rows,
@@ -291,7 +362,7 @@ def build_grid_config(params: GridConfigParams) -> GridConfig:
     )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TemplateStyleParams:
     """TemplateStyle構築に必要なパラメータ。"""
     grid_color: str
@@ -321,63 +392,141 @@ class TemplateStyleParams:
     page_height_px: int
 
 
+_HEX_RGB_RE = re.compile(r"#[0-9A-Fa-f]{6}")
+
+
+def _decode_hex_color(value: str, alpha: int) -> tuple[int, int, int, int]:
+    """#RRGGBB 文字列を RGBA タプルに変換（カラーピッカー形式の高速パス）。
+
+    Why: GUI の色フィールドはほぼ常に "#RRGGBB" 形式。汎用パーサーの
+         strip / 3 桁展開 / 3 回の int() を毎回通す必要はない。
+    How: 7 文字の #RRGGBB に完全一致すれば 1 回の int(…, 16) と
+         ビットシフトで分解。それ以外は parse_hex_color に委ねるため
+         エラーメッセージと 3 桁表記の扱いは変わらない。
+    """
+    if _HEX_RGB_RE.fullmatch(value):
+        rgb = int(value[1:], 16)
+        return (rgb >> 16, (rgb >> 8) & 0xFF, rgb & 0xFF, max(0, min(255, int(alpha))))
+    return parse_hex_color(value, alpha)
+
+
+# Why: Template colours rarely change between previews; the decoded tuple
+#      is immutable, so cached results can be shared.
+_cached_hex_color = lru_cache(maxsize=128)(_decode_hex_color)
+
+
+# Why: build_template_style parses many numeric fields with labelled
+#      errors; tables keep each label next to its field and let one loop
+#      do the work instead of scattered parse_* calls.
+# How: (TemplateStyleParams attribute, parser, label used in error text).
+_NumericFields = tuple[tuple[str, Callable[[str, str], Any], str], ...]
+
+_TEMPLATE_NUMERIC_FIELDS: _NumericFields = (
+    ("grid_alpha", parse_int, "Grid alpha"),
+    ("finish_alpha", parse_int, "Finish alpha"),
+    ("basic_alpha", parse_int, "Basic alpha"),
+    ("grid_width", parse_int, "Grid width"),
+)
+
+# Per-frame fields, parsed only when that frame is drawn
+_FRAME_NUMERIC_FIELDS: dict[str, _NumericFields] = {
+    "finish": (
+        ("finish_line_width", parse_int, "Finish line width"),
+        ("finish_offset_x", parse_float, "Finish offset X"),
+        ("finish_offset_y", parse_float, "Finish offset Y"),
+    ),
+    "basic": (
+        ("basic_line_width", parse_int, "Basic line width"),
+        ("basic_offset_x", parse_float, "Basic offset X"),
+        ("basic_offset_y", parse_float, "Basic offset Y"),
+    ),
+}
+
+# (line width px, width mm, height mm, offset x mm, offset y mm) of a frame
+# that is not drawn; the renderer skips it, so the values are never used.
+_DISABLED_FRAME: tuple[int, float, float, float, float] = (0, 0.0, 0.0, 0.0, 0.0)
+
+
+def _parse_numeric_fields(params: TemplateStyleParams, fields: _NumericFields) -> dict[str, Any]:
+    return {
+        name: parse(getattr(params, name) or "0", label)
+        for name, parse, label in fields
+    }
+
+
+def _build_frame_values(
+    params: TemplateStyleParams, prefix: str
+) -> tuple[int, float, float, float, float]:
+    """有効なフレーム（finish / basic）の線幅・サイズ・オフセットを計算。
+
+    Why: 無効なフレームの値は描画に使われないため、有効な場合だけ
+         パースとサイズ計算を行いたい。
+    How: prefix ("finish" / "basic") から TemplateStyleParams の属性名を
+         組み立て、数値フィールドとフレームサイズをまとめて求める。
+    """
+    nums = _parse_numeric_fields(params, _FRAME_NUMERIC_FIELDS[prefix])
+    frame_params = FrameSizeParams(
+        mode=getattr(params, f"{prefix}_size_mode") or "Use per-page size",
+        dpi=params.dpi,
+        orientation=params.orientation,
+        width_value=getattr(params, f"{prefix}_width"),
+        height_value=getattr(params, f"{prefix}_height"),
+        page_width_px=params.page_width_px,
+        page_height_px=params.page_height_px,
+    )
+    width_mm, height_mm = compute_frame_size_mm(frame_params)
+    return (
+        nums[f"{prefix}_line_width"],
+        width_mm,
+        height_mm,
+        nums[f"{prefix}_offset_x"],
+        nums[f"{prefix}_offset_y"],
+    )
+
+
+@lru_cache(maxsize=8)
 def build_template_style(params: TemplateStyleParams) -> TemplateStyle:
     """TemplateStyleを構築。
     
+    Why: build_grid_config と同様、同じ入力での再構築を避ける。
+    How: frozen な params をキーに、frozen な TemplateStyle をキャッシュ。
+    
     Args:
         params: テンプレートスタイルパラメータ
         
     Returns:
         構築されたTemplateStyle
     """
-    ga = parse_int(params.grid_alpha or "0", "Grid alpha")
-    fa = parse_int(params.finish_alpha or "0", "Finish alpha")
-    ba = parse_int(params.basic_alpha or "0", "Basic alpha")
+    nums = _parse_numeric_fields(params, _TEMPLATE_NUMERIC_FIELDS)
     
-    g_col = parse_hex_color(params.grid_color or "#FF5030", ga)
-    f_col = parse_hex_color(params.finish_color or "#FFFFFF", fa)
-    b_col = parse_hex_color(params.basic_color or "#00AAFF", ba)
+    g_col = _cached_hex_color(params.grid_color or "#FF5030", nums["grid_alpha"])
+    f_col = _cached_hex_color(params.finish_color or "#FFFFFF", nums["finish_alpha"])
+    b_col = _cached_hex_color(params.basic_color or "#00AAFF", nums["basic_alpha"])
     
-    # Finish frame size
-    finish_params = FrameSizeParams(
-        mode=params.finish_size_mode or "Use per-page size",
-        dpi=params.dpi,
-        orientation=params.orientation,
-        width_value=params.finish_width,
-        height_value=params.finish_height,
-        page_width_px=params.page_width_px,
-        page_height_px=params.page_height_px,
+    # Disabled frames skip their field parsing and size computation
+    f_line, fwmm, fhmm, fx, fy = (
+        _build_frame_values(params, "finish") if params.draw_finish else _DISABLED_FRAME
     )
-    fwmm, fhmm = compute_frame_size_mm(finish_params)
-    
-    # Basic frame size
-    basic_params = FrameSizeParams(
-        mode=params.basic_size_mode or "Use per-page size",
-        dpi=params.dpi,
-        orientation=params.orientation,
-        width_value=params.basic_width,
-        height_value=params.basic_height,
-        page_width_px=params.page_width_px,
-        page_height_px=params.page_height_px,
+    b_line, bwmm, bhmm, bx, by = (
+        _build_frame_values(params, "basic") if params.draw_basic else _DISABLED_FRAME
     )
-    bwmm, bhmm = compute_frame_size_mm(basic_params)
     
     return TemplateStyle(
         grid_color=g_col,
-        grid_width=parse_int(params.grid_width or "0", "Grid width"),
+        grid_width=nums["grid_width"],
         finish_color=f_col,
-        finish_width=parse_int(params.finish_line_width or "0", "Finish line width"),
+        finish_width=f_line,
         finish_width_mm=fwmm,
         finish_height_mm=fhmm,
-        finish_offset_x_mm=parse_float(params.finish_offset_x or "0", "Finish offset X"),
-        finish_offset_y_mm=parse_float(params.finish_offset_y or "0", "Finish offset Y"),
+        finish_offset_x_mm=fx,
+        finish_offset_y_mm=fy,
         draw_finish=params.draw_finish,
         basic_color=b_col,
-        basic_width=parse_int(params.basic_line_width or "0", "Basic line width"),
+        basic_width=b_line,
         basic_width_mm=bwmm,
         basic_height_mm=bhmm,
-        basic_offset_x_mm=parse_float(params.basic_offset_x or "0", "Basic offset X"),
-        basic_offset_y_mm=parse_float(params.basic_offset_y or "0", "Basic offset Y"),
+        basic_offset_x_mm=bx,
+        basic_offset_y_mm=by,
         draw_basic=params.draw_basic,
     )
 
@@ -398,17 +547,18 @@ def convert_unit_value(value: str, from_unit: str, to_unit: str, dpi: int) -> st
     Returns:
         変換後の値（文字列、適切にフォーマット）
     """
-    if from_unit == to_unit:
+    if from_unit == to_unit or from_unit not in _UNITS or to_unit not in _UNITS:
+        return value
+    if not _NUMBER_RE.match(value):
         return value
     
-    try:
-        val = float(value)
-        if from_unit == "px" and to_unit == "mm":
-            return f"{px_to_mm(int(val), dpi):.2f}"
-        elif from_unit == "mm" and to_unit == "px":
-            return str(mm_to_px(val, dpi))
-    except (ValueError, ZeroDivisionError):
-        pass
+    val = float(value)
+    if from_unit == "px" and to_unit == "mm":
+        if dpi <= 0:
+            return value
+        return f"{px_to_mm(int(val), dpi):.2f}"
+    if from_unit == "mm" and to_unit == "px":
+        return str(mm_to_px(val, dpi))
     
     return value
 
@@ -9,16 +9,167 @@ How: WidgetBuilder inherits WidgetLayoutMixin (gui_widgets_layout.py)
 """
 from __future__ import annotations
 
-from typing import Any
+import base64
+from typing import Any, Callable, TypeVar
 
+from name_splitter.app.gui_types import (
+    BatchFields,
+    CommonFields,
+    ImageFields,
+    PresetFields,
+    TemplateFields,
+)
 from name_splitter.app.gui_widgets_layout import WidgetLayoutMixin
 
+_T = TypeVar("_T")
+
 
 # TRANSPARENT_PNG_BASE64 for preview image
 TRANSPARENT_PNG_BASE64 = (
     "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR4nGNgYAAAAAMA"
     "ASsJTYQAAAAASUVORK5CYII="
 )
+# Why: Flet's Image.src accepts raw bytes; decoding once at import skips the
+#      data-URL build and the client-side URI/base64 parse.
+_TRANSPARENT_PNG_BYTES = base64.b64decode(TRANSPARENT_PNG_BASE64)
+
+# Dropdown option keys shared by several fields.
+# Why: Flet Option objects are controls bound to one parent, so only the
+#      immutable key tuples are shared; Options are built fresh per dropdown.
+_PAGE_SIZE_KEYS: tuple[str, ...] = ("A4", "B4", "A5", "B5", "Custom")
+_UNIT_KEYS: tuple[str, ...] = ("px", "mm")
+_FRAME_SIZE_MODE_KEYS: tuple[str, ...] = (
+    "Use per-page size", "A4", "B4", "A5", "B5", "Custom mm", "Custom px",
+)
+# (key, label) pairs for dropdowns whose label differs from the key.
+_ORIENTATION_OPTIONS: tuple[tuple[str, str], ...] = (
+    ("portrait", "縦 (portrait)"),
+    ("landscape", "横 (landscape)"),
+)
+_ORDER_OPTIONS: tuple[tuple[str, str], ...] = (
+    ("rtl_ttb", "右→左 ↓"),
+    ("ltr_ttb", "左→右 ↓"),
+)
+_OUTPUT_FORMAT_OPTIONS: tuple[tuple[str, str], ...] = (
+    ("png", "PNG (images)"),
+    ("pdf", "PDF (single file)"),
+)
+_ODD_EVEN_OPTIONS: tuple[tuple[str, str], ...] = (
+    ("all", "全ページ"),
+    ("odd", "奇数ページのみ"),
+    ("even", "偶数ページのみ"),
+)
+
+# TextField spec tables: (field name, TextField kwargs).
+# Why: Most fields differ only in their kwargs; describing them as data keeps
+#      the builders short and the defaults easy to scan.
+# How: "keyboard_type" holds a ft.KeyboardType member name and is resolved
+#      by WidgetBuilder._text_fields at build time.
+_TextSpecs = tuple[tuple[str, dict[str, Any]], ...]
+
+_COMMON_TEXT_SPECS: _TextSpecs = (
+    ("config_field", {"label": "Config (YAML/JSON, optional)", "expand": True}),
+    ("dpi_field", {
+        "label": "DPI", "value": "300", "width": 80,
+        "hint_text": "例: 600", "keyboard_type": "NUMBER",
+    }),
+    ("custom_width_field", {
+        "label": "Width", "value": "", "width": 100, "keyboard_type": "NUMBER",
+    }),
+    ("custom_height_field", {
+        "label": "Height", "value": "", "width": 100, "keyboard_type": "NUMBER",
+    }),
+    ("rows_field", {
+        "label": "Rows", "value": "4", "width": 80, "keyboard_type": "NUMBER",
+    }),
+    ("cols_field", {
+        "label": "Cols", "value": "4", "width": 80, "keyboard_type": "NUMBER",
+    }),
+    ("gutter_field", {
+        "label": "Gutter", "value": "0", "width": 90, "keyboard_type": "NUMBER",
+    }),
+    ("grid_color_field", {"label": "Grid color", "value": "#FF5030", "width": 110}),
+    ("grid_alpha_field", {
+        "label": "Alpha", "value": "170", "width": 90,
+        "tooltip": "不透明度（0=透明、255=不透明）",
+    }),
+    ("grid_width_field", {"label": "Width px", "value": "1", "width": 90}),
+    *(
+        (f"margin_{side}_field", {
+            "label": side.capitalize(), "value": "0", "width": 80,
+            "keyboard_type": "NUMBER",
+        })
+        for side in ("top", "bottom", "left", "right")
+    ),
+)
+
+_IMAGE_TEXT_SPECS: _TextSpecs = (
+    ("input_field", {
+        "label": "入力画像を選択 (PNG)",
+        "expand": True,
+        "hint_text": "画像ファイルをここにパス入力 または「選択」ボタンをクリック",
+    }),
+    ("out_dir_field", {"label": "Output directory (optional)", "expand": True}),
+    ("test_page_field", {"label": "Test page (1-based, optional)", "width": 180}),
+    ("output_dpi_field", {
+        "label": "出力DPI (0=リサイズなし)",
+        "value": "0",
+        "width": 180,
+        "tooltip": "分割後のページを指定DPIにリサイズ（例: 350）。0で無効。",
+    }),
+    ("page_number_start_field", {
+        "label": "開始ページ番号",
+        "value": "1",
+        "width": 140,
+        "tooltip": "出力ファイル名の開始番号（例: 3で page_003 から開始）",
+    }),
+    ("skip_pages_field", {
+        "label": "スキップページ (カンマ区切り)",
+        "value": "",
+        "width": 200,
+        "tooltip": "出力しないページ番号（例: 1,2 で表紙と裏表紙をスキップ）",
+    }),
+)
+
+_TEMPLATE_TEXT_SPECS: _TextSpecs = (
+    ("template_out_field", {"label": "Template output PNG", "expand": True}),
+)
+
+_BATCH_TEXT_SPECS: _TextSpecs = (
+    ("batch_dir_field", {
+        "label": "入力ディレクトリ",
+        "expand": True,
+        "hint_text": "PNG ファイルが入っているフォルダを指定",
+    }),
+    ("batch_out_dir_field", {
+        "label": "出力ディレクトリ（省略可）",
+        "expand": True,
+        "hint_text": "省略時は各画像の隣に出力",
+    }),
+)
+
+
+def _frame_text_specs(prefix: str, color: str) -> _TextSpecs:
+    """Return the TextField specs for one template frame ("finish"/"basic")."""
+    return (
+        (f"{prefix}_width_field", {"label": "Width", "value": "", "width": 110}),
+        (f"{prefix}_height_field", {"label": "Height", "value": "", "width": 110}),
+        (f"{prefix}_offset_x_field", {"label": "Offset X mm", "value": "0", "width": 110}),
+        (f"{prefix}_offset_y_field", {"label": "Offset Y mm", "value": "0", "width": 110}),
+        (f"{prefix}_color_field", {"label": "Color", "value": color, "width": 100}),
+        (f"{prefix}_alpha_field", {"label": "Alpha", "value": "200", "width": 90}),
+        (f"{prefix}_line_width_field", {"label": "Line px", "value": "2", "width": 90}),
+    )
+
+
+# Template frame prefix -> (title, default colour, TextField specs).
+_FRAME_DEFAULTS: dict[str, tuple[str, str, _TextSpecs]] = {
+    prefix: (title, color, _frame_text_specs(prefix, color))
+    for prefix, title, color in (
+        ("finish", "Finish", "#FFFFFF"),
+        ("basic", "Basic", "#00AAFF"),
+    )
+}
 
 
 class WidgetBuilder(WidgetLayoutMixin):
@@ -27,10 +178,16 @@ class WidgetBuilder(WidgetLayoutMixin):
     Why: Separating widget construction from gui.py keeps the entry-point
          concise and makes each widget's default values easy to locate.
     How: Inherits WidgetLayoutMixin for layout-assembly methods. create_*
-         methods return plain dicts so gui.py can unpack them into typed
-         dataclasses (CommonFields, ImageFields, etc.).
+         methods return the typed field groups (CommonFields, ImageFields,
+         etc.) directly; create_ui_elements returns a dict because gui.py
+         adds the run/cancel buttons before building UiElements.
     """
 
+    __slots__ = (
+        "ft", "_field_cache", "_pending_tabs", "_icons", "_colors", "_kb_number",
+        "_pad_compact", "_pad_tab", "_preview_margin", "_swatch_border",
+    )
+
     def __init__(self, ft: Any) -> None:
         """Initialize WidgetBuilder with the Flet module.
 
@@ -43,330 +200,312 @@ class WidgetBuilder(WidgetLayoutMixin):
             ft: The flet module (imported as 'import flet as ft')
         """
         self.ft = ft
-    
-    def create_common_fields(self) -> dict[str, Any]:
+        self._field_cache: dict[str, Any] = {}
+        self._pending_tabs: dict[int, tuple[Any, Callable[[], Any]]] = {}
+        # Why: Resolve the Icons/Colors enums (and the pre-0.80 lowercase
+        #      fallback) once instead of in every create_*/build_* call.
+        self._icons = ft.Icons if hasattr(ft, "Icons") else ft.icons
+        self._colors = ft.Colors if hasattr(ft, "Colors") else ft.colors
+        # Why: Every numeric spec field shares this one enum member.
+        self._kb_number = ft.KeyboardType.NUMBER
+        # Why: Only two paddings, one margin and one swatch border are ever
+        #      used; Flet's Padding/Margin/Border are value types, so one
+        #      instance can back every control.
+        self._pad_compact = ft.Padding(8, 4, 8, 4)
+        self._pad_tab = ft.Padding(8, 6, 8, 6)
+        self._preview_margin = ft.Margin.all(100)
+        self._swatch_border = ft.border.all(1, self._colors.OUTLINE)
+
+    def lazy_tab(self, index: int, build: Callable[[], Any]) -> Any:
+        """Return a placeholder tab whose layout is built on first activation.
+
+        Why: Tabs the user never opens should not cost widget construction
+             at startup.
+        How: Registers *build* under the tab *index* and returns an empty
+             expanding Container; ensure_tab_built() later fills it in.
+
+        Args:
+            index: Tab index in the TabBar
+            build: Zero-arg callable returning the tab's layout control
+
+        Returns:
+            ft.Container placeholder to place in the TabBarView
+        """
+        placeholder = self.ft.Container(expand=True)
+        self._pending_tabs[index] = (placeholder, build)
+        return placeholder
+
+    def ensure_tab_built(self, index: int) -> bool:
+        """Build the deferred layout for tab *index* if still pending.
+
+        Returns:
+            True if the tab was built by this call, False otherwise
+        """
+        pending = self._pending_tabs.pop(index, None)
+        if pending is None:
+            return False
+        placeholder, build = pending
+        placeholder.content = build()
+        return True
+
+    def _cached_fields(self, key: str, build: Callable[[], _T]) -> _T:
+        """Return the widget group for *key*, building it on first request.
+
+        Why: Constructing a field group allocates dozens of Flet controls;
+             asking the same builder again (tab re-open, rewiring) should
+             not rebuild them.
+        How: Per-instance dict keyed by group name; *build* runs only on
+             a cache miss.
+        """
+        fields = self._field_cache.get(key)
+        if fields is None:
+            fields = self._field_cache[key] = build()
+        return fields  # type: ignore[no-any-return]
+
+    # Lazy accessors — each group is built on first access, then cached.
+    @property
+    def common_fields(self) -> CommonFields:
+        return self.create_common_fields()
+
+    @property
+    def image_split_fields(self) -> ImageFields:
+        return self.create_image_split_fields()
+
+    @property
+    def template_fields(self) -> TemplateFields:
+        return self.create_template_fields()
+
+    @property
+    def ui_elements(self) -> dict[str, Any]:
+        return self.create_ui_elements()
+
+    @property
+    def batch_fields(self) -> BatchFields:
+        return self.create_batch_fields()
+
+    @property
+    def preset_fields(self) -> PresetFields:
+        return self.create_preset_fields()
+
+    def create_common_fields(self) -> CommonFields:
         """Create common fields: config, page size, DPI, grid, margin.
         
         Returns:
-            Dictionary with all common field widgets
+            CommonFields with all common field widgets
         """
-        ft = self.ft
-        
-        fields = {}
-        
-        # -- Config file --
-        fields["config_field"] = ft.TextField(
-            label="Config (YAML/JSON, optional)", expand=True
-        )
-        
-        # -- Page size & DPI --
-        fields["page_size_field"] = ft.Dropdown(
-            label="Page size",
-            options=[
-                ft.dropdown.Option("A4"),
-                ft.dropdown.Option("B4"),
-                ft.dropdown.Option("A5"),
-                ft.dropdown.Option("B5"),
-                ft.dropdown.Option("Custom"),
-            ],
-            value="A4",
-            width=135,
-        )
-        fields["orientation_field"] = ft.Dropdown(
-            label="Orientation",
-            options=[
-                ft.dropdown.Option(key="portrait", text="縦 (portrait)"),
-                ft.dropdown.Option(key="landscape", text="横 (landscape)"),
-            ],
-            value="portrait",
-            width=155,
-        )
-        fields["dpi_field"] = ft.TextField(
-            label="DPI",
-            value="300",
-            width=80,
-            hint_text="例: 600",
-            keyboard_type=ft.KeyboardType.NUMBER,
-        )
-        fields["custom_size_unit_field"] = ft.Dropdown(
-            label="Size unit",
-            options=[
-                ft.dropdown.Option("px"),
-                ft.dropdown.Option("mm"),
-            ],
-            value="px",
-            width=100,
-        )
-        fields["custom_width_field"] = ft.TextField(
-            label="Width", value="", width=100, keyboard_type=ft.KeyboardType.NUMBER
-        )
-        fields["custom_height_field"] = ft.TextField(
-            label="Height", value="", width=100, keyboard_type=ft.KeyboardType.NUMBER
-        )
-        fields["size_info_text"] = ft.Text("", size=11, italic=True)
-        
-        # -- Grid settings --
-        fields["rows_field"] = ft.TextField(
-            label="Rows", value="4", width=80, keyboard_type=ft.KeyboardType.NUMBER
-        )
-        fields["cols_field"] = ft.TextField(
-            label="Cols", value="4", width=80, keyboard_type=ft.KeyboardType.NUMBER
-        )
-        fields["order_field"] = ft.Dropdown(
-            label="Order",
-            options=[
-                ft.dropdown.Option(key="rtl_ttb", text="右→左 ↓"),
-                ft.dropdown.Option(key="ltr_ttb", text="左→右 ↓"),
-            ],
-            value="rtl_ttb",
-            width=145,
-            tooltip="右→左: 日本の漫画形式\n左→右: 海外コミック形式",
-        )
-        fields["gutter_unit_field"] = ft.Dropdown(
-            label="Gutter unit",
-            options=[
-                ft.dropdown.Option("px"),
-                ft.dropdown.Option("mm"),
-            ],
-            value="px",
-            width=110,
-            tooltip="コマとコマの間の隙間（間隔）",
-        )
-        fields["gutter_field"] = ft.TextField(
-            label="Gutter", value="0", width=90, keyboard_type=ft.KeyboardType.NUMBER
-        )
-        fields["grid_color_field"] = ft.TextField(
-            label="Grid color", value="#FF5030", width=110
-        )
-        fields["grid_alpha_field"] = ft.TextField(
-            label="Alpha", value="170", width=90,
-            tooltip="不透明度（0=透明、255=不透明）",
-        )
-        fields["grid_width_field"] = ft.TextField(label="Width px", value="1", width=90)
-        outline = ft.Colors.OUTLINE if hasattr(ft, "Colors") else ft.colors.OUTLINE
-        fields["grid_color_swatch"] = ft.Container(
-            width=24, height=24, border_radius=4,
-            bgcolor="#FF5030",
-            border=ft.border.all(1, outline),
-        )
-        
-        # -- Margin (4 directions + unit) --
-        fields["margin_unit_field"] = ft.Dropdown(
-            label="Margin unit",
-            options=[
-                ft.dropdown.Option("px"),
-                ft.dropdown.Option("mm"),
-            ],
-            value="px",
-            width=110,
-        )
-        fields["margin_top_field"] = ft.TextField(
-            label="Top", value="0", width=80, keyboard_type=ft.KeyboardType.NUMBER
-        )
-        fields["margin_bottom_field"] = ft.TextField(
-            label="Bottom", value="0", width=80, keyboard_type=ft.KeyboardType.NUMBER
-        )
-        fields["margin_left_field"] = ft.TextField(
-            label="Left", value="0", width=80, keyboard_type=ft.KeyboardType.NUMBER
-        )
-        fields["margin_right_field"] = ft.TextField(
-            label="Right", value="0", width=80, keyboard_type=ft.KeyboardType.NUMBER
-        )
-        
-        return fields
-    
-    def create_image_split_fields(self) -> dict[str, Any]:
+        return self._cached_fields("common", self._build_common_fields)
+
+    def create_image_split_fields(self) -> ImageFields:
         """Create Image Split tab fields.
         
         Returns:
-            Dictionary with Image Split field widgets
+            ImageFields with Image Split field widgets
         """
-        ft = self.ft
-        
-        fields = {}
-        fields["input_field"] = ft.TextField(
-            label="入力画像を選択 (PNG)",
-            expand=True,
-            hint_text="画像ファイルをここにパス入力 または「選択」ボタンをクリック",
-        )
-        fields["out_dir_field"] = ft.TextField(
-            label="Output directory (optional)", expand=True
-        )
-        fields["test_page_field"] = ft.TextField(
-            label="Test page (1-based, optional)", width=180
-        )
-        fields["output_format_field"] = ft.Dropdown(
-            label="Output format",
-            options=[
-                ft.dropdown.Option(key="png", text="PNG (images)"),
-                ft.dropdown.Option(key="pdf", text="PDF (single file)"),
-            ],
-            value="png",
-            width=180,
-            tooltip="PNG: 個別画像ファイル\nPDF: 1つのPDFにまとめて出力",
-        )
-        fields["output_dpi_field"] = ft.TextField(
-            label="出力DPI (0=リサイズなし)",
-            value="0",
-            width=180,
-            tooltip="分割後のページを指定DPIにリサイズ（例: 350）。0で無効。",
-        )
-        fields["page_number_start_field"] = ft.TextField(
-            label="開始ページ番号",
-            value="1",
-            width=140,
-            tooltip="出力ファイル名の開始番号（例: 3で page_003 から開始）",
-        )
-        fields["skip_pages_field"] = ft.TextField(
-            label="スキップページ (カンマ区切り)",
-            value="",
-            width=200,
-            tooltip="出力しないページ番号（例: 1,2 で表紙と裏表紙をスキップ）",
-        )
-        fields["odd_even_field"] = ft.Dropdown(
-            label="出力ページ",
-            options=[
-                ft.dropdown.Option(key="all", text="全ページ"),
-                ft.dropdown.Option(key="odd", text="奇数ページのみ"),
-                ft.dropdown.Option(key="even", text="偶数ページのみ"),
-            ],
-            value="all",
-            width=160,
-        )
-        
-        return fields
+        return self._cached_fields("image_split", self._build_image_split_fields)
 
-    def create_template_fields(self) -> dict[str, Any]:
+    def create_template_fields(self) -> TemplateFields:
         """Create Template tab fields (Finish, Basic, Grid visual).
         
         Returns:
-            Dictionary with Template field widgets
+            TemplateFields with Template field widgets
         """
-        ft = self.ft
-        
-        fields = {}
-        
-        # Template output
-        fields["template_out_field"] = ft.TextField(
-            label="Template output PNG", expand=True
-        )
+        return self._cached_fields("template", self._build_template_fields)
+
+    def create_ui_elements(self) -> dict[str, Any]:
+        """Create common UI elements: log, progress, status, preview.
         
-        # -- Finish frame --
-        fields["draw_finish_field"] = ft.Checkbox(
-            label="Draw finish frame", value=True
-        )
-        fields["finish_size_mode_field"] = ft.Dropdown(
-            label="Finish size",
-            options=[
-                ft.dropdown.Option("Use per-page size"),
-                ft.dropdown.Option("A4"),
-                ft.dropdown.Option("B4"),
-                ft.dropdown.Option("A5"),
-                ft.dropdown.Option("B5"),
-                ft.dropdown.Option("Custom mm"),
-                ft.dropdown.Option("Custom px"),
-            ],
-            value="Use per-page size",
-            width=160,
-        )
-        fields["finish_width_field"] = ft.TextField(label="Width", value="", width=110)
-        fields["finish_height_field"] = ft.TextField(label="Height", value="", width=110)
-        fields["finish_offset_x_field"] = ft.TextField(
-            label="Offset X mm", value="0", width=110
-        )
-        fields["finish_offset_y_field"] = ft.TextField(
-            label="Offset Y mm", value="0", width=110
-        )
-        fields["finish_color_field"] = ft.TextField(
-            label="Color", value="#FFFFFF", width=100
-        )
-        fields["finish_alpha_field"] = ft.TextField(label="Alpha", value="200", width=90)
-        fields["finish_line_width_field"] = ft.TextField(
-            label="Line px", value="2", width=90
-        )
-        outline = ft.Colors.OUTLINE if hasattr(ft, "Colors") else ft.colors.OUTLINE
-        fields["finish_color_swatch"] = ft.Container(
+        Returns:
+            Dictionary with UI element widgets
+        """
+        return self._cached_fields("ui", self._build_ui_elements)
+
+    def create_batch_fields(self) -> BatchFields:
+        """Create Batch tab fields: input/output dir, recursive flag, run/cancel, status.
+
+        Returns:
+            BatchFields with all batch field widgets.
+        """
+        return self._cached_fields("batch", self._build_batch_fields)
+
+    def create_preset_fields(self) -> PresetFields:
+        """Create preset management widgets: dropdown, save button, delete button.
+
+        Returns:
+            PresetFields with the preset widget references.
+        """
+        return self._cached_fields("preset", self._build_preset_fields)
+
+    def _color_swatch(self, color: str) -> Any:
+        """Create the small colour preview box shown next to a colour field."""
+        return self.ft.Container(
             width=24, height=24, border_radius=4,
-            bgcolor="#FFFFFF",
-            border=ft.border.all(1, outline),
+            bgcolor=color,
+            border=self._swatch_border,
         )
+
+    def _log_line(self, line: str) -> Any:
+        """Create one selectable log row for the log ListView."""
+        return self.ft.Text(line, selectable=True, size=12)
+
+    def _key_options(self, keys: tuple[str, ...]) -> list[Any]:
+        """Build fresh dropdown Options whose key and label are both *keys*."""
+        Opt = self.ft.dropdown.Option
+        return [Opt(k) for k in keys]
+
+    def _labelled_options(self, pairs: tuple[tuple[str, str], ...]) -> list[Any]:
+        """Build fresh dropdown Options from (key, label) *pairs*."""
+        Opt = self.ft.dropdown.Option
+        return [Opt(key=key, text=text) for key, text in pairs]
+
+    def _text_fields(self, specs: _TextSpecs) -> dict[str, Any]:
+        """Materialize TextFields from a spec table, keyed by field name."""
+        ft = self.ft
+        TextField = ft.TextField
+        number = self._kb_number
+        fields: dict[str, Any] = {}
+        for name, kwargs in specs:
+            keyboard_type = kwargs.get("keyboard_type")
+            if keyboard_type is not None:
+                resolved = (
+                    number if keyboard_type == "NUMBER"
+                    else getattr(ft.KeyboardType, keyboard_type)
+                )
+                kwargs = {**kwargs, "keyboard_type": resolved}
+            fields[name] = TextField(**kwargs)
+        return fields
+
+    def _build_common_fields(self) -> CommonFields:
+        ft = self.ft
         
-        # -- Basic frame --
-        fields["draw_basic_field"] = ft.Checkbox(
-            label="Draw basic frame", value=True
-        )
-        fields["basic_size_mode_field"] = ft.Dropdown(
-            label="Basic size",
-            options=[
-                ft.dropdown.Option("Use per-page size"),
-                ft.dropdown.Option("A4"),
-                ft.dropdown.Option("B4"),
-                ft.dropdown.Option("A5"),
-                ft.dropdown.Option("B5"),
-                ft.dropdown.Option("Custom mm"),
-                ft.dropdown.Option("Custom px"),
-            ],
-            value="Use per-page size",
-            width=160,
-        )
-        fields["basic_width_field"] = ft.TextField(label="Width", value="", width=110)
-        fields["basic_height_field"] = ft.TextField(label="Height", value="", width=110)
-        fields["basic_offset_x_field"] = ft.TextField(
-            label="Offset X mm", value="0", width=110
+        return CommonFields(
+            **self._text_fields(_COMMON_TEXT_SPECS),
+            # -- Page size & DPI --
+            page_size_field=ft.Dropdown(
+                label="Page size",
+                options=self._key_options(_PAGE_SIZE_KEYS),
+                value="A4",
+                width=135,
+            ),
+            orientation_field=ft.Dropdown(
+                label="Orientation",
+                options=self._labelled_options(_ORIENTATION_OPTIONS),
+                value="portrait",
+                width=155,
+            ),
+            custom_size_unit_field=ft.Dropdown(
+                label="Size unit",
+                options=self._key_options(_UNIT_KEYS),
+                value="px",
+                width=100,
+            ),
+            size_info_text=ft.Text("", size=11, italic=True),
+            # -- Grid settings --
+            order_field=ft.Dropdown(
+                label="Order",
+                options=self._labelled_options(_ORDER_OPTIONS),
+                value="rtl_ttb",
+                width=145,
+                tooltip="右→左: 日本の漫画形式\n左→右: 海外コミック形式",
+            ),
+            gutter_unit_field=ft.Dropdown(
+                label="Gutter unit",
+                options=self._key_options(_UNIT_KEYS),
+                value="px",
+                width=110,
+                tooltip="コマとコマの間の隙間（間隔）",
+            ),
+            grid_color_swatch=self._color_swatch("#FF5030"),
+            # -- Margin unit --
+            margin_unit_field=ft.Dropdown(
+                label="Margin unit",
+                options=self._key_options(_UNIT_KEYS),
+                value="px",
+                width=110,
+            ),
         )
-        fields["basic_offset_y_field"] = ft.TextField(
-            label="Offset Y mm", value="0", width=110
-        )
-        fields["basic_color_field"] = ft.TextField(
-            label="Color", value="#00AAFF", width=100
-        )
-        fields["basic_alpha_field"] = ft.TextField(label="Alpha", value="200", width=90)
-        fields["basic_line_width_field"] = ft.TextField(
-            label="Line px", value="2", width=90
-        )
-        outline = ft.Colors.OUTLINE if hasattr(ft, "Colors") else ft.colors.OUTLINE
-        fields["basic_color_swatch"] = ft.Container(
-            width=24, height=24, border_radius=4,
-            bgcolor="#00AAFF",
-            border=ft.border.all(1, outline),
-        )
-        
-        return fields
     
-    def create_ui_elements(self) -> dict[str, Any]:
-        """Create common UI elements: log, progress, status, preview.
+    def _build_image_split_fields(self) -> ImageFields:
+        ft = self.ft
         
-        Returns:
-            Dictionary with UI element widgets
+        return ImageFields(
+            **self._text_fields(_IMAGE_TEXT_SPECS),
+            output_format_field=ft.Dropdown(
+                label="Output format",
+                options=self._labelled_options(_OUTPUT_FORMAT_OPTIONS),
+                value="png",
+                width=180,
+                tooltip="PNG: 個別画像ファイル\nPDF: 1つのPDFにまとめて出力",
+            ),
+            odd_even_field=ft.Dropdown(
+                label="出力ページ",
+                options=self._labelled_options(_ODD_EVEN_OPTIONS),
+                value="all",
+                width=160,
+            ),
+        )
+
+    def _make_frame_fields(self, prefix: str) -> dict[str, Any]:
+        """Create the widgets of one template frame ("finish" or "basic").
+
+        Why: Finish and Basic frames share every control and differ only in
+             labels and the default colour.
+        How: Looks up title/colour/specs in _FRAME_DEFAULTS and builds the
+             checkbox, size-mode dropdown, TextFields and colour swatch.
         """
         ft = self.ft
-        
-        elements = {}
-        elements["log_field"] = ft.TextField(
-            multiline=True, read_only=True, expand=True, value=""
+        title, color, specs = _FRAME_DEFAULTS[prefix]
+        return {
+            f"draw_{prefix}_field": ft.Checkbox(
+                label=f"Draw {prefix} frame", value=True
+            ),
+            f"{prefix}_size_mode_field": ft.Dropdown(
+                label=f"{title} size",
+                options=self._key_options(_FRAME_SIZE_MODE_KEYS),
+                value="Use per-page size",
+                width=160,
+            ),
+            **self._text_fields(specs),
+            f"{prefix}_color_swatch": self._color_swatch(color),
+        }
+
+    def _build_template_fields(self) -> TemplateFields:
+        return TemplateFields(
+            # Template output
+            **self._text_fields(_TEMPLATE_TEXT_SPECS),
+            **self._make_frame_fields("finish"),
+            **self._make_frame_fields("basic"),
         )
-        elements["progress_bar"] = ft.ProgressBar(width=350, value=0)
-        elements["status_text"] = ft.Text("Idle")
+    
+    def _build_ui_elements(self) -> dict[str, Any]:
+        ft = self.ft
         
-        elements["preview_image"] = ft.Image(
-            src=f"data:image/png;base64,{TRANSPARENT_PNG_BASE64}",
+        # Why: preview_viewer wraps preview_image, so bind it first.
+        preview_image = ft.Image(
+            src=_TRANSPARENT_PNG_BYTES,
             width=550,
             height=550,
             fit="contain",
         )
-        elements["preview_viewer"] = ft.InteractiveViewer(
-            content=elements["preview_image"],
-            min_scale=0.1,
-            max_scale=5.0,
-            boundary_margin=ft.Margin.all(100),
-        )
-        elements["preview_loading_ring"] = ft.ProgressRing(
-            width=48, height=48, visible=False,
-        )
-        
-        return elements
+        return {
+            # Why: One Text row per line keeps each append O(1) on the wire;
+            #      a growing TextField value is resent in full on every line.
+            "log_field": ft.ListView(expand=True, auto_scroll=True, spacing=0),
+            "log_line": self._log_line,
+            "progress_bar": ft.ProgressBar(width=350, value=0),
+            "status_text": ft.Text("Idle"),
+            "preview_image": preview_image,
+            "preview_viewer": ft.InteractiveViewer(
+                content=preview_image,
+                min_scale=0.1,
+                max_scale=5.0,
+                boundary_margin=self._preview_margin,
+            ),
+            "preview_loading_ring": ft.ProgressRing(
+                width=48, height=48, visible=False,
+            ),
+        }
 
-    def create_batch_fields(self) -> dict[str, Any]:
+    def _build_batch_fields(self) -> BatchFields:
         """Create Batch tab fields: input/output dir, recursive flag, run/cancel, status.
 
         Why: Batch processing requires a dedicated set of controls distinct from
@@ -377,71 +516,61 @@ class WidgetBuilder(WidgetLayoutMixin):
              widget for per-job progress display.
 
         Returns:
-            Dictionary with all batch field widgets keyed by field name.
+            BatchFields with all batch field widgets.
         """
         ft = self.ft
 
-        fields: dict[str, Any] = {}
-        fields["batch_dir_field"] = ft.TextField(
-            label="入力ディレクトリ",
-            expand=True,
-            hint_text="PNG ファイルが入っているフォルダを指定",
-        )
-        fields["batch_out_dir_field"] = ft.TextField(
-            label="出力ディレクトリ（省略可）",
-            expand=True,
-            hint_text="省略時は各画像の隣に出力",
-        )
-        fields["batch_recursive_field"] = ft.Checkbox(
-            label="サブフォルダを再帰検索",
-            value=False,
-            tooltip="ON: サブフォルダ内の PNG も対象にする",
-        )
-        fields["batch_run_btn"] = ft.ElevatedButton(
-            "Batch Run",
-            icon=ft.Icons.PLAY_ARROW,
+        return BatchFields(
+            **self._text_fields(_BATCH_TEXT_SPECS),
+            batch_recursive_field=ft.Checkbox(
+                label="サブフォルダを再帰検索",
+                value=False,
+                tooltip="ON: サブフォルダ内の PNG も対象にする",
+            ),
+            batch_run_btn=ft.ElevatedButton(
+                "Batch Run",
+                icon=self._icons.PLAY_ARROW,
+            ),
+            batch_cancel_btn=ft.OutlinedButton(
+                "Cancel",
+                icon=self._icons.CANCEL,
+                disabled=True,
+            ),
+            batch_status_text=ft.Text("Idle", size=12, italic=True),
         )
-        fields["batch_cancel_btn"] = ft.OutlinedButton(
-            "Cancel",
-            icon=ft.Icons.CANCEL,
-            disabled=True,
-        )
-        fields["batch_status_text"] = ft.Text("Idle", size=12, italic=True)
 
-        return fields
-
-    def create_preset_fields(self) -> dict[str, Any]:
+    def _build_preset_fields(self) -> PresetFields:
         """Create preset management widgets: dropdown, save button, delete button.
 
         Why: Presets require three co-located controls. Centralising their
              creation here keeps gui.py and the layout mixin free of widget
              instantiation details.
-        How: Returns a dict with 'dropdown', 'save_btn', and 'delete_btn'
-             keyed by the PresetFields field names.
+        How: Returns PresetFields holding 'dropdown', 'save_btn', and
+             'delete_btn'.
 
         Returns:
-            Dictionary with preset widget references keyed by field name.
+            PresetFields with the preset widget references.
         """
         ft = self.ft
 
-        fields: dict[str, Any] = {}
-        fields["dropdown"] = ft.Dropdown(
-            label="プリセット",
-            options=[],
-            width=220,
-            hint_text="保存済みプリセットを選択",
+        return PresetFields(
+            dropdown=ft.Dropdown(
+                label="プリセット",
+                options=[],
+                width=220,
+                hint_text="保存済みプリセットを選択",
+            ),
+            save_btn=ft.ElevatedButton(
+                "Save",
+                icon=self._icons.BOOKMARK_ADD,
+                tooltip="現在の設定をプリセットとして保存",
+            ),
+            delete_btn=ft.OutlinedButton(
+                "Delete",
+                icon=self._icons.DELETE_OUTLINE,
+                tooltip="選択中のプリセットを削除",
+            ),
         )
-        fields["save_btn"] = ft.ElevatedButton(
-            "Save",
-            icon=ft.Icons.BOOKMARK_ADD,
-            tooltip="現在の設定をプリセットとして保存",
-        )
-        fields["delete_btn"] = ft.OutlinedButton(
-            "Delete",
-            icon=ft.Icons.DELETE_OUTLINE,
-            tooltip="選択中のプリセットを削除",
-        )
-        return fields
 
     def create_recent_dropdown(self, label: str, options: list[str]) -> Any:
         """Create a dropdown widget pre-populated with recently used file paths.
@@ -466,6 +595,32 @@ class WidgetBuilder(WidgetLayoutMixin):
             hint_text="最近使ったファイル",
         )
 
+    def update_recent_dropdown(self, dropdown: Any, paths: list[str]) -> bool:
+        """Refresh a recent-files dropdown's options in place.
+
+        Why: Re-picking a file that is already most recent leaves the list
+             unchanged; rebuilding N Options and pushing an update for that
+             is wasted work.
+        How: Compares the current option keys with *paths* and, only when
+             they differ, replaces the contents of the existing options list
+             so the Dropdown control itself is reused.
+
+        Args:
+            dropdown: Dropdown created by create_recent_dropdown
+            paths: Recent file path strings, most-recent first
+
+        Returns:
+            True if the options changed and the dropdown needs update()
+        """
+        options = dropdown.options
+        if options is None:
+            options = dropdown.options = []
+        elif [getattr(o, "key", None) for o in options] == paths:
+            return False
+        Opt = self.ft.dropdown.Option
+        options[:] = [Opt(p) for p in paths]
+        return True
+
     def create_quick_run_button(self) -> Any:
         """Create the Quick Run button that repeats the last successful run.
 
@@ -481,7 +636,7 @@ class WidgetBuilder(WidgetLayoutMixin):
         ft = self.ft
         return ft.ElevatedButton(
             "Quick Run",
-            icon=ft.Icons.REPLAY,
+            icon=self._icons.REPLAY,
             tooltip="前回の設定で再実行",
             disabled=True,
         )
@@ -14,6 +14,10 @@ from typing import TYPE_CHECKING, Any, Callable
 
 if TYPE_CHECKING:
     from name_splitter.app.gui_types import (
+        BatchFields,
+        CommonFields,
+        ImageFields,
+        TemplateFields,
         TextField,
         Dropdown,
         Checkbox,
@@ -27,17 +31,58 @@ class WidgetLayoutMixin:
     Why: Layout construction code (Row/Column nesting, Container padding,
          icon labels) is lengthy but conceptually separate from widget
          instantiation. Grouping it here makes both files easier to skim.
-    How: Each build_* method receives pre-built widget dicts/objects and
+    How: Each build_* method receives pre-built widget groups/objects and
          assembles a Container tree. The mixin only calls self.ft (Flet
-         module) for layout primitives — no widget instantiation.
+         module) for layout primitives — no widget instantiation. The
+         build_tab_* methods bind the ft classes they use to locals up
+         front so the nested tree below resolves them without attribute
+         lookups.
     """
 
+    # Why: Empty so WidgetBuilder's __slots__ actually removes the instance dict.
+    __slots__ = ()
+
     if TYPE_CHECKING:
         ft: Any  # Flet module — set in WidgetBuilder.__init__
+        _icons: Any  # ft.Icons — resolved once in WidgetBuilder.__init__
+        _colors: Any  # ft.Colors — resolved once in WidgetBuilder.__init__
+        _pad_compact: Any  # ft.Padding(8, 4, 8, 4) — shared, set in WidgetBuilder.__init__
+        _pad_tab: Any  # ft.Padding(8, 6, 8, 6) — shared, set in WidgetBuilder.__init__
+
+    def _section_header(self, icon: Any, label: str, tooltip: str | None = None) -> object:
+        """Build an "icon + bold label [+ info icon]" section header Row.
+
+        Why: Every settings section opens with the same header shape; one
+             helper keeps the tabs short and the header styling consistent.
+        How: Adds an INFO_OUTLINE icon carrying the tooltip only when one
+             is given.
+
+        Args:
+            icon: ft.Icons value shown before the label
+            label: Section title
+            tooltip: Optional hint shown on the trailing info icon
+
+        Returns:
+            ft.Row with spacing=4
+        """
+        ft = self.ft
+        children = [
+            ft.Icon(icon, size=16),
+            ft.Text(label, weight=ft.FontWeight.BOLD, size=12),
+        ]
+        if tooltip:
+            children.append(
+                ft.Icon(
+                    self._icons.INFO_OUTLINE, size=14,
+                    color=self._colors.OUTLINE,
+                    tooltip=tooltip,
+                ),
+            )
+        return ft.Row(children, spacing=4)
 
     def build_tab_config(
         self,
-        fields: dict,
+        fields: CommonFields,
         pick_config: Callable,
         reset_config: Callable | None = None,
         save_config: Callable | None = None,
@@ -58,7 +103,7 @@ class WidgetLayoutMixin:
              appended when provided.
 
         Args:
-            fields: Dict of all common field widgets keyed by field name
+            fields: CommonFields with all common field widgets
             pick_config: Async FilePicker callback for config file selection
             reset_config: Optional callback to reset all settings to defaults
             save_config: Optional callback to save current settings to YAML
@@ -69,26 +114,35 @@ class WidgetLayoutMixin:
             ft.Container with the assembled common settings layout
         """
         ft = self.ft
+        Row = ft.Row
+        Column = ft.Column
+        Container = ft.Container
+        Icon = ft.Icon
+        Icons = self._icons
+        IconButton = ft.IconButton
+        Colors = self._colors
+        Divider = ft.Divider
+        header = self._section_header
 
         config_buttons = [
-            ft.IconButton(
-                icon=ft.Icons.FOLDER_OPEN,
+            IconButton(
+                icon=Icons.FOLDER_OPEN,
                 tooltip="Select config file",
                 on_click=pick_config,
             ),
         ]
         if reset_config is not None:
             config_buttons.append(
-                ft.IconButton(
-                    icon=ft.Icons.RESTART_ALT,
+                IconButton(
+                    icon=Icons.RESTART_ALT,
                     tooltip="Reset to defaults",
                     on_click=reset_config,
                 ),
             )
         if save_config is not None:
             config_buttons.append(
-                ft.IconButton(
-                    icon=ft.Icons.SAVE,
+                IconButton(
+                    icon=Icons.SAVE,
                     tooltip="Save current settings to config file",
                     on_click=save_config,
                 ),
@@ -97,12 +151,9 @@ class WidgetLayoutMixin:
         # Build the base column items
         col_items: list[Any] = [
             # Config file row
-            ft.Row([
-                ft.Icon(ft.Icons.DESCRIPTION, size=16),
-                ft.Text("Config file", weight=ft.FontWeight.BOLD, size=12)
-            ], spacing=4),
-            ft.Row([
-                fields["config_field"],
+            header(Icons.DESCRIPTION, "Config file"),
+            Row([
+                fields.config_field,
                 *config_buttons,
             ]),
         ]
@@ -110,89 +161,73 @@ class WidgetLayoutMixin:
         # Recent config dropdown (A-2)
         if recent_config_dropdown is not None:
             col_items.append(
-                ft.Row([
-                    ft.Icon(ft.Icons.HISTORY, size=14, color=ft.Colors.OUTLINE),
+                Row([
+                    Icon(Icons.HISTORY, size=14, color=Colors.OUTLINE),
                     recent_config_dropdown,
                 ], spacing=4),
             )
 
         col_items += [
-            ft.Divider(height=2),
+            Divider(height=2),
             # Page size & DPI
-            ft.Row([
-                ft.Icon(ft.Icons.STRAIGHTEN, size=16),
-                ft.Text("Page size & DPI", weight=ft.FontWeight.BOLD, size=12),
-                ft.Icon(
-                    ft.Icons.INFO_OUTLINE, size=14,
-                    color=ft.Colors.OUTLINE,
-                    tooltip="DPI: 1インチあたりのドット数。印刷解像度に合わせてください",
-                ),
-            ], spacing=4),
-            ft.Row([
-                fields["page_size_field"],
-                fields["orientation_field"],
-                fields["dpi_field"]
+            header(
+                Icons.STRAIGHTEN, "Page size & DPI",
+                "DPI: 1インチあたりのドット数。印刷解像度に合わせてください",
+            ),
+            Row([
+                fields.page_size_field,
+                fields.orientation_field,
+                fields.dpi_field
             ], wrap=True),
-            ft.Row([
-                fields["custom_size_unit_field"],
-                fields["custom_width_field"],
-                fields["custom_height_field"]
+            Row([
+                fields.custom_size_unit_field,
+                fields.custom_width_field,
+                fields.custom_height_field
             ], wrap=True),
-            ft.Container(
-                content=fields["size_info_text"],
-                bgcolor=ft.Colors.SURFACE_CONTAINER,
+            Container(
+                content=fields.size_info_text,
+                bgcolor=Colors.SURFACE_CONTAINER,
                 border_radius=6,
-                padding=ft.Padding(8, 4, 8, 4),
+                padding=self._pad_compact,
             ),
-            ft.Divider(height=2),
+            Divider(height=2),
             # Grid settings
-            ft.Row([
-                ft.Icon(ft.Icons.GRID_VIEW, size=16),
-                ft.Text("Grid settings", weight=ft.FontWeight.BOLD, size=12),
-            ], spacing=4),
-            ft.Row([
-                fields["rows_field"],
-                fields["cols_field"],
-                fields["order_field"],
+            header(Icons.GRID_VIEW, "Grid settings"),
+            Row([
+                fields.rows_field,
+                fields.cols_field,
+                fields.order_field,
             ], wrap=True),
-            ft.Row([
-                fields["gutter_unit_field"],
-                fields["gutter_field"]
+            Row([
+                fields.gutter_unit_field,
+                fields.gutter_field
             ], wrap=True),
-            ft.Row([
-                fields["grid_color_field"],
-                fields["grid_color_swatch"],
-                fields["grid_alpha_field"],
-                fields["grid_width_field"]
+            Row([
+                fields.grid_color_field,
+                fields.grid_color_swatch,
+                fields.grid_alpha_field,
+                fields.grid_width_field
             ], wrap=True),
-            ft.Divider(height=2),
-            ft.Row([
-                ft.Icon(ft.Icons.CROP_FREE, size=16),
-                ft.Text("Margins", weight=ft.FontWeight.BOLD, size=12),
-                ft.Icon(
-                    ft.Icons.INFO_OUTLINE, size=14,
-                    color=ft.Colors.OUTLINE,
-                    tooltip="ページ端から有効領域までの余白",
-                ),
-            ], spacing=4),
-            ft.Row([
-                fields["margin_unit_field"],
-                fields["margin_top_field"],
-                fields["margin_bottom_field"],
-                fields["margin_left_field"],
-                fields["margin_right_field"],
+            Divider(height=2),
+            header(
+                Icons.CROP_FREE, "Margins",
+                "ページ端から有効領域までの余白",
+            ),
+            Row([
+                fields.margin_unit_field,
+                fields.margin_top_field,
+                fields.margin_bottom_field,
+                fields.margin_left_field,
+                fields.margin_right_field,
             ], wrap=True),
         ]
 
         # Preset section (A-1)
         if preset_fields is not None:
             col_items += [
-                ft.Divider(height=2),
-                ft.Row([
-                    ft.Icon(ft.Icons.BOOKMARK, size=16),
-                    ft.Text("Presets", weight=ft.FontWeight.BOLD, size=12),
-                ], spacing=4),
-                ft.Row([
+                Divider(height=2),
+                header(Icons.BOOKMARK, "Presets"),
+                Row([
                     preset_fields.dropdown,
                     preset_fields.save_btn,
                     preset_fields.delete_btn,
@@ -204,43 +239,37 @@ class WidgetLayoutMixin:
             ie_row: list[Any] = []
             if import_config is not None:
                 ie_row.append(ft.ElevatedButton(
-                    "インポート", icon=ft.Icons.FILE_UPLOAD,
+                    "インポート", icon=Icons.FILE_UPLOAD,
                     on_click=import_config,
                 ))
             if export_config is not None:
                 ie_row.append(ft.ElevatedButton(
-                    "エクスポート", icon=ft.Icons.FILE_DOWNLOAD,
+                    "エクスポート", icon=Icons.FILE_DOWNLOAD,
                     on_click=export_config,
                 ))
             col_items += [
-                ft.Divider(height=2),
-                ft.Row([
-                    ft.Icon(ft.Icons.SWAP_HORIZ, size=16),
-                    ft.Text("設定の共有", weight=ft.FontWeight.BOLD, size=12),
-                ], spacing=4),
-                ft.Row(ie_row, spacing=6),
+                Divider(height=2),
+                header(Icons.SWAP_HORIZ, "設定の共有"),
+                Row(ie_row, spacing=6),
             ]
 
         # C-3: Log file toggle
         if log_file_toggle is not None:
             col_items += [
-                ft.Divider(height=2),
-                ft.Row([
-                    ft.Icon(ft.Icons.TEXT_SNIPPET, size=16),
-                    ft.Text("ログ設定", weight=ft.FontWeight.BOLD, size=12),
-                ], spacing=4),
-                ft.Row([log_file_toggle], spacing=4),
+                Divider(height=2),
+                header(Icons.TEXT_SNIPPET, "ログ設定"),
+                Row([log_file_toggle], spacing=4),
             ]
 
-        return ft.Container(
-            content=ft.Column(col_items, spacing=8, scroll=ft.ScrollMode.AUTO),
-            padding=ft.Padding(8, 4, 8, 4),
+        return Container(
+            content=Column(col_items, spacing=8, scroll=ft.ScrollMode.AUTO),
+            padding=self._pad_compact,
             expand=True,
         )
 
     def build_tab_image(
         self,
-        fields: dict,
+        fields: ImageFields,
         run_btn: object,
         cancel_btn: object,
         pick_input: Callable,
@@ -259,7 +288,7 @@ class WidgetLayoutMixin:
              are included when provided.
 
         Args:
-            fields: Dict of image-split field widgets keyed by field name
+            fields: ImageFields with the image-split field widgets
             run_btn: ElevatedButton widget for job execution
             cancel_btn: OutlinedButton widget for job cancellation
             pick_input: Async FilePicker callback for input image selection
@@ -272,28 +301,37 @@ class WidgetLayoutMixin:
             ft.Container with the Image Split tab layout
         """
         ft = self.ft
+        Row = ft.Row
+        Column = ft.Column
+        Container = ft.Container
+        Icon = ft.Icon
+        Icons = self._icons
+        IconButton = ft.IconButton
+        Colors = self._colors
+        Divider = ft.Divider
+        header = self._section_header
 
         out_dir_buttons = [
-            ft.IconButton(
-                icon=ft.Icons.FOLDER,
+            IconButton(
+                icon=Icons.FOLDER,
                 tooltip="Select output dir",
                 on_click=pick_out_dir,
             ),
         ]
         if open_output_folder is not None:
             out_dir_buttons.append(
-                ft.IconButton(
-                    icon=ft.Icons.OPEN_IN_NEW,
+                IconButton(
+                    icon=Icons.OPEN_IN_NEW,
                     tooltip="Open output folder",
                     on_click=open_output_folder,
                 ),
             )
 
         col_items: list[Any] = [
-            ft.Row([
-                fields["input_field"],
-                ft.IconButton(
-                    icon=ft.Icons.FOLDER_OPEN,
+            Row([
+                fields.input_field,
+                IconButton(
+                    icon=Icons.FOLDER_OPEN,
                     tooltip="Select image",
                     on_click=pick_input,
                 ),
@@ -303,55 +341,49 @@ class WidgetLayoutMixin:
         # Recent input dropdown (A-2)
         if recent_input_dropdown is not None:
             col_items.append(
-                ft.Row([
-                    ft.Icon(ft.Icons.HISTORY, size=14, color=ft.Colors.OUTLINE),
+                Row([
+                    Icon(Icons.HISTORY, size=14, color=Colors.OUTLINE),
                     recent_input_dropdown,
                 ], spacing=4),
             )
 
         col_items += [
-            ft.Row([
-                fields["out_dir_field"],
+            Row([
+                fields.out_dir_field,
                 *out_dir_buttons,
-                fields["test_page_field"],
+                fields.test_page_field,
             ]),
-            ft.Divider(height=2),
+            Divider(height=2),
             # Output format selection
-            ft.Row([
-                ft.Icon(ft.Icons.OUTPUT, size=16),
-                ft.Text("Output", weight=ft.FontWeight.BOLD, size=12),
-            ], spacing=4),
-            ft.Row([fields["output_format_field"]]),
+            header(Icons.OUTPUT, "Output"),
+            Row([fields.output_format_field]),
             # B-1: Output DPI control
-            ft.Row([fields["output_dpi_field"]], spacing=6),
-            ft.Divider(height=2),
+            Row([fields.output_dpi_field], spacing=6),
+            Divider(height=2),
             # B-2: Page number customization
-            ft.Row([
-                ft.Icon(ft.Icons.FORMAT_LIST_NUMBERED, size=16),
-                ft.Text("ページ番号設定", weight=ft.FontWeight.BOLD, size=12),
-            ], spacing=4),
-            ft.Row([
-                fields["page_number_start_field"],
-                fields["skip_pages_field"],
-                fields["odd_even_field"],
+            header(Icons.FORMAT_LIST_NUMBERED, "ページ番号設定"),
+            Row([
+                fields.page_number_start_field,
+                fields.skip_pages_field,
+                fields.odd_even_field,
             ], spacing=6),
-            ft.Divider(height=2),
+            Divider(height=2),
         ]
 
         # Run buttons row: Run, Cancel, Quick Run (A-3)
         run_row_items: list[Any] = [run_btn, cancel_btn]
         if quick_run_btn is not None:
             run_row_items.append(quick_run_btn)
-        col_items.append(ft.Row(run_row_items, spacing=6))
+        col_items.append(Row(run_row_items, spacing=6))
 
-        return ft.Container(
-            content=ft.Column(col_items, spacing=6, scroll=ft.ScrollMode.AUTO),
-            padding=ft.Padding(8, 6, 8, 6),
+        return Container(
+            content=Column(col_items, spacing=6, scroll=ft.ScrollMode.AUTO),
+            padding=self._pad_tab,
         )
 
     def build_tab_template(
         self,
-        fields: dict,
+        fields: TemplateFields,
         tmpl_btn: object,
         pick_template_out: Callable,
     ) -> object:
@@ -365,7 +397,7 @@ class WidgetLayoutMixin:
              generate button. All controls are placed in a scrollable Column.
 
         Args:
-            fields: Dict of template field widgets keyed by field name
+            fields: TemplateFields with the template field widgets
             tmpl_btn: ElevatedButton widget for template generation
             pick_template_out: Async FilePicker callback for output path
 
@@ -373,87 +405,96 @@ class WidgetLayoutMixin:
             ft.Container with the Template tab layout
         """
         ft = self.ft
-
-        return ft.Container(
-            content=ft.Column([
-                # Finish frame accordion
-                ft.ExpansionPanelList(
-                    controls=[
-                        ft.ExpansionPanel(
-                            header=ft.Row([
-                                fields["draw_finish_field"],
-                                ft.Text("Finish frame", weight=ft.FontWeight.BOLD, size=12)
-                            ], spacing=4),
-                            content=ft.Column([
-                                ft.Row([
-                                    fields["finish_size_mode_field"],
-                                    fields["finish_width_field"],
-                                    fields["finish_height_field"]
-                                ], wrap=True),
-                                ft.Row([
-                                    fields["finish_offset_x_field"],
-                                    fields["finish_offset_y_field"],
-                                    fields["finish_color_field"],
-                                    fields["finish_color_swatch"],
-                                    fields["finish_alpha_field"],
-                                    fields["finish_line_width_field"]
-                                ], wrap=True),
-                            ], spacing=4),
-                            expanded=False,
-                            can_tap_header=True,
-                        ),
-                    ],
-                    elevation=0,
-                    spacing=0,
-                ),
-                # Basic frame accordion
-                ft.ExpansionPanelList(
-                    controls=[
-                        ft.ExpansionPanel(
-                            header=ft.Row([
-                                fields["draw_basic_field"],
-                                ft.Text("Basic frame", weight=ft.FontWeight.BOLD, size=12)
-                            ], spacing=4),
-                            content=ft.Column([
-                                ft.Row([
-                                    fields["basic_size_mode_field"],
-                                    fields["basic_width_field"],
-                                    fields["basic_height_field"]
-                                ], wrap=True),
-                                ft.Row([
-                                    fields["basic_offset_x_field"],
-                                    fields["basic_offset_y_field"],
-                                    fields["basic_color_field"],
-                                    fields["basic_color_swatch"],
-                                    fields["basic_alpha_field"],
-                                    fields["basic_line_width_field"]
-                                ], wrap=True),
-                            ], spacing=4),
-                            expanded=False,
-                            can_tap_header=True,
-                        ),
-                    ],
-                    elevation=0,
-                    spacing=0,
-                ),
-                ft.Divider(height=4),
+        Row = ft.Row
+        Column = ft.Column
+        Container = ft.Container
+        Icons = self._icons
+        IconButton = ft.IconButton
+        Divider = ft.Divider
+
+        return Container(
+            content=Column([
+                # Finish / Basic frame accordions
+                self._make_frame_panel(fields, "finish", "Finish frame"),
+                self._make_frame_panel(fields, "basic", "Basic frame"),
+                Divider(height=4),
                 # Template output path
-                ft.Row([
-                    fields["template_out_field"],
-                    ft.IconButton(
-                        icon=ft.Icons.SAVE,
+                Row([
+                    fields.template_out_field,
+                    IconButton(
+                        icon=Icons.SAVE,
                         tooltip="Save template PNG",
                         on_click=pick_template_out,
                     ),
                 ]),
-                ft.Row([tmpl_btn]),
+                Row([tmpl_btn]),
             ], spacing=4, scroll=ft.ScrollMode.AUTO),
-            padding=ft.Padding(8, 6, 8, 6),
+            padding=self._pad_tab,
+        )
+
+    def _make_frame_panel(self, fields: TemplateFields, prefix: str, title: str) -> object:
+        """Build the collapsible accordion for one template frame.
+
+        Why: Both frame panels start collapsed and most sessions never open
+             them, so their body Rows need not exist at first paint.
+        How: The panel starts without content; the list's on_change builds
+             the body Column on the first toggle. Field widgets themselves
+             are created elsewhere and only get placed here.
+
+        Args:
+            fields: TemplateFields with the template field widgets
+            prefix: Frame field prefix ("finish" or "basic")
+            title: Header label shown next to the enable checkbox
+
+        Returns:
+            ft.ExpansionPanelList holding a single collapsed panel
+        """
+        ft = self.ft
+        Row = ft.Row
+
+        def build_body() -> object:
+            return ft.Column([
+                Row([
+                    getattr(fields, f"{prefix}_size_mode_field"),
+                    getattr(fields, f"{prefix}_width_field"),
+                    getattr(fields, f"{prefix}_height_field")
+                ], wrap=True),
+                Row([
+                    getattr(fields, f"{prefix}_offset_x_field"),
+                    getattr(fields, f"{prefix}_offset_y_field"),
+                    getattr(fields, f"{prefix}_color_field"),
+                    getattr(fields, f"{prefix}_color_swatch"),
+                    getattr(fields, f"{prefix}_alpha_field"),
+                    getattr(fields, f"{prefix}_line_width_field")
+                ], wrap=True),
+            ], spacing=4)
+
+        panel = ft.ExpansionPanel(
+            header=Row([
+                getattr(fields, f"draw_{prefix}_field"),
+                ft.Text(title, weight=ft.FontWeight.BOLD, size=12)
+            ], spacing=4),
+            content=None,
+            expanded=False,
+            can_tap_header=True,
+        )
+
+        def on_change(_: Any) -> None:
+            # Why: Flet re-sends the panel after the event, so filling in
+            #      content here is enough for it to appear as it expands.
+            if panel.content is None:
+                panel.content = build_body()
+
+        return ft.ExpansionPanelList(
+            controls=[panel],
+            elevation=0,
+            spacing=0,
+            on_change=on_change,
         )
 
     def build_tab_batch(
         self,
-        fields: dict,
+        fields: BatchFields,
         pick_batch_dir: Callable,
         pick_batch_out_dir: Callable,
     ) -> object:
@@ -466,7 +507,7 @@ class WidgetLayoutMixin:
              All in a scrollable, padded Container matching other tab styles.
 
         Args:
-            fields: Dict of batch field widgets keyed by field name
+            fields: BatchFields with the batch field widgets
             pick_batch_dir: Callback to open input directory picker
             pick_batch_out_dir: Callback to open output directory picker
 
@@ -474,52 +515,55 @@ class WidgetLayoutMixin:
             ft.Container with the Batch tab layout
         """
         ft = self.ft
-
-        return ft.Container(
-            content=ft.Column([
+        Row = ft.Row
+        Column = ft.Column
+        Container = ft.Container
+        Icon = ft.Icon
+        Icons = self._icons
+        IconButton = ft.IconButton
+        Colors = self._colors
+        Divider = ft.Divider
+        header = self._section_header
+
+        return Container(
+            content=Column([
                 # Input directory row
-                ft.Row([
-                    ft.Icon(ft.Icons.FOLDER_OPEN, size=16),
-                    ft.Text("入力ディレクトリ", weight=ft.FontWeight.BOLD, size=12),
-                ], spacing=4),
-                ft.Row([
-                    fields["batch_dir_field"],
-                    ft.IconButton(
-                        icon=ft.Icons.FOLDER,
+                header(Icons.FOLDER_OPEN, "入力ディレクトリ"),
+                Row([
+                    fields.batch_dir_field,
+                    IconButton(
+                        icon=Icons.FOLDER,
                         tooltip="入力ディレクトリを選択",
                         on_click=pick_batch_dir,
                     ),
                 ]),
-                ft.Divider(height=2),
+                Divider(height=2),
                 # Output directory row
-                ft.Row([
-                    ft.Icon(ft.Icons.OUTPUT, size=16),
-                    ft.Text("出力ディレクトリ", weight=ft.FontWeight.BOLD, size=12),
-                ], spacing=4),
-                ft.Row([
-                    fields["batch_out_dir_field"],
-                    ft.IconButton(
-                        icon=ft.Icons.FOLDER,
+                header(Icons.OUTPUT, "出力ディレクトリ"),
+                Row([
+                    fields.batch_out_dir_field,
+                    IconButton(
+                        icon=Icons.FOLDER,
                         tooltip="出力ディレクトリを選択",
                         on_click=pick_batch_out_dir,
                     ),
                 ]),
-                ft.Divider(height=2),
+                Divider(height=2),
                 # Options
-                ft.Row([fields["batch_recursive_field"]]),
-                ft.Divider(height=2),
+                Row([fields.batch_recursive_field]),
+                Divider(height=2),
                 # Run / Cancel
-                ft.Row([
-                    fields["batch_run_btn"],
-                    fields["batch_cancel_btn"],
+                Row([
+                    fields.batch_run_btn,
+                    fields.batch_cancel_btn,
                 ], spacing=8),
                 # Progress display
-                ft.Row([
-                    ft.Icon(ft.Icons.INFO_OUTLINE, size=14, color=ft.Colors.OUTLINE),
-                    fields["batch_status_text"],
+                Row([
+                    Icon(Icons.INFO_OUTLINE, size=14, color=Colors.OUTLINE),
+                    fields.batch_status_text,
                 ], spacing=4),
             ], spacing=8, scroll=ft.ScrollMode.AUTO),
-            padding=ft.Padding(8, 6, 8, 6),
+            padding=self._pad_tab,
         )
 
 
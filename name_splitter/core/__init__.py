@@ -1,8 +1,43 @@
-from .config import Config, load_config, load_default_config, validate_config
-from .errors import ConfigError, ImageReadError, LimitExceededError, PsdReadError
-from .job import CancelToken, JobResult, ProgressEvent, run_job
-from .image_read import ImageDocument, ImageInfo, read_image, read_image_document
-from .pdf_export import export_pdf
+"""name_splitter.core パッケージ
+
+Why: パッケージ import 時に job / image_read / pdf_export を読み込むと
+     PIL や PDF 出力の依存まで連鎖 import され、Config だけが欲しい
+     呼び出し側（CLI の引数解析、GUI 起動）の起動時間が伸びる。
+How: PEP 562 の module __getattr__ で、公開名に初めてアクセスしたときに
+     対応するサブモジュールを import し、結果をモジュール globals に保存する。
+"""
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .config import Config, load_config, load_default_config, validate_config
+    from .errors import ConfigError, ImageReadError, LimitExceededError, PsdReadError
+    from .job import CancelToken, JobResult, ProgressEvent, run_job
+    from .image_read import ImageDocument, ImageInfo, read_image, read_image_document
+    from .pdf_export import export_pdf
+
+# 公開名 → 定義元サブモジュール
+_LAZY: dict[str, str] = {
+    "Config": ".config",
+    "load_config": ".config",
+    "load_default_config": ".config",
+    "validate_config": ".config",
+    "ConfigError": ".errors",
+    "ImageReadError": ".errors",
+    "LimitExceededError": ".errors",
+    "PsdReadError": ".errors",
+    "CancelToken": ".job",
+    "JobResult": ".job",
+    "ProgressEvent": ".job",
+    "run_job": ".job",
+    "ImageDocument": ".image_read",
+    "ImageInfo": ".image_read",
+    "read_image": ".image_read",
+    "read_image_document": ".image_read",
+    "export_pdf": ".pdf_export",
+}
 
 __all__ = [
     "CancelToken",
@@ -23,3 +58,17 @@ __all__ = [
     "run_job",
     "validate_config",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,32 @@
+"""JSON 読み書きの共通ヘルパ
+
+Why: 設定ファイルの読み込みと plan.json の書き出しが別々に json を使うと、
+     高速な orjson の有無による分岐が呼び出し側ごとに重複する。
+How: orjson があればそれを、なければ標準 json を使う loads/dumps を一か所に置く。
+     どちらもバイト列でやり取りし、ファイルはバイナリモードで読み書きする。
+"""
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    # 任意依存: JSON の高速な解析・直列化
+    import orjson as _orjson
+except ImportError:
+    _orjson = None  # type: ignore[assignment]
+
+
+def loads(data: bytes) -> Any:
+    # バイト列を直接解析
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, *, indent: bool = False) -> bytes:
+    # UTF-8 のバイト列に直列化（非 ASCII はエスケープしない）。indent=True で 2 スペース字下げ
+    if _orjson is not None:
+        return _orjson.dumps(obj, option=_orjson.OPT_INDENT_2 if indent else 0)
+    text = json.dumps(obj, ensure_ascii=False, indent=2 if indent else None)
+    return text.encode("utf-8")
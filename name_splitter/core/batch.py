@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import os
+import stat
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Iterator
 
-from .config import Config
+from .config import Config, load_config
+from .config import clear_config_cache as _clear_loaded_configs
 from .errors import ConfigError, ImageReadError, LimitExceededError
 from .job import CancelToken, JobResult, ProgressEvent, run_job
 
@@ -44,13 +49,56 @@ class BatchResult:
     results: list[BatchJobResult]
 
 
+def _iter_png_paths(root: str, recursive: bool) -> Iterator[str]:
+    """os.scandir で PNG ファイルのパス文字列を列挙
+
+    Why: Path.glob は中間エントリごとに Path を生成し stat し直すため、
+         大きなツリーでは DirEntry の d_type を使う scandir の方が速い。
+    How: ディレクトリのスタックを手動で回し、シンボリックリンクは辿らない。
+         拡張子は大文字小文字を区別しない（Windows の glob と同じ挙動）。
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name[-4:].lower() == ".png":
+                    yield entry.path
+                elif recursive and entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+
+
+def _path_sort_key(path: str) -> list[str]:
+    # Path の比較順（normcase した構成要素ごとの比較）と同じ順序になるキー
+    return os.path.normcase(path).split(os.sep)
+
+
 def find_images_in_directory(directory: Path, recursive: bool = False) -> list[Path]:
-    """ディレクトリ内のPNG画像を検索"""
-    if recursive:
-        images = list(directory.glob("**/*.png"))
-    else:
-        images = list(directory.glob("*.png"))
-    return sorted(images)
+    """ディレクトリ内のPNG画像を検索
+
+    文字列のまま構成要素キーで整列してから Path に変換する
+    （Path.__lt__ による比較より速く、順序は同じ）。
+    """
+    found = sorted(_iter_png_paths(os.fspath(directory), recursive), key=_path_sort_key)
+    return [Path(p) for p in found]
+
+
+@lru_cache(maxsize=64)
+def _list_dir(parent: str, mtime_ns: int) -> frozenset[str]:
+    """ディレクトリ内のファイル名集合を返す（mtime 付きでキャッシュ）
+
+    Why: 画像ごとに候補2件を exists() するとディレクトリ内の画像数 × 2 回の
+         stat が走る。1回の scandir で名前集合を作れば後は集合引きで済む。
+    How: キーに親ディレクトリの st_mtime_ns を含め、ファイル追加・削除で
+         自動的に無効化する。名前は normcase して OS の大文字小文字規則に合わせる。
+    """
+    with os.scandir(parent) as entries:
+        return frozenset(os.path.normcase(entry.name) for entry in entries)
+
+
+def clear_config_cache() -> None:
+    """設定ファイル検索のキャッシュを破棄（テスト用）"""
+    _list_dir.cache_clear()
+    _clear_loaded_configs()
 
 
 def find_config_for_image(image_path: Path, default_config: Config) -> Config:
@@ -61,115 +109,261 @@ def find_config_for_image(image_path: Path, default_config: Config) -> Config:
     2. <image_name>.yaml (例: page001.png → page001.yaml)
     3. デフォルト設定
     """
+    parent = os.fspath(image_path.parent)
+    try:
+        names = _list_dir(parent, os.stat(parent).st_mtime_ns)
+    except OSError:
+        return default_config
+
     # 同名の設定ファイル（_config.yaml）
-    config_path = image_path.with_suffix("").with_suffix(".yaml")
-    alt_config_path = image_path.parent / f"{image_path.stem}_config.yaml"
-    
-    for path in [alt_config_path, config_path]:
-        if path.exists():
-            try:
-                from .config import load_config
-                return load_config(path)
-            except ConfigError:
-                # 設定ファイルが不正な場合はデフォルトにフォールバック
-                pass
+    config_name = image_path.with_suffix("").with_suffix(".yaml").name
+    alt_config_name = f"{image_path.stem}_config.yaml"
+
+    for name in (alt_config_name, config_name):
+        if os.path.normcase(name) not in names:
+            continue
+        try:
+            # 同じ設定ファイルを共有する画像群では load_config のキャッシュが効く
+            return load_config(os.path.join(parent, name))
+        except ConfigError:
+            # 設定ファイルが不正な場合はデフォルトにフォールバック
+            pass
     
     return default_config
 
 
-def run_batch(
+_JOB_ERRORS = (ConfigError, LimitExceededError, ImageReadError, ValueError, RuntimeError)
+
+
+def _cancelled_result(spec: BatchJobSpec) -> BatchJobResult:
+    # キャンセルにより実行されなかったジョブの結果
+    return BatchJobResult(
+        input_image=spec.input_image,
+        success=False,
+        error=RuntimeError("Batch cancelled"),
+    )
+
+
+def _run_one(spec: BatchJobSpec) -> BatchJobResult:
+    """ワーカープロセスで1ジョブを実行（pickle 可能なトップレベル関数）"""
+    try:
+        result = run_job(
+            str(spec.input_image),
+            spec.config,
+            out_dir=str(spec.out_dir) if spec.out_dir else None,
+        )
+    except _JOB_ERRORS as exc:
+        return BatchJobResult(input_image=spec.input_image, success=False, error=exc)
+    return BatchJobResult(input_image=spec.input_image, success=True, result=result)
+
+
+def _resolve_workers(max_workers: int | None, total_jobs: int) -> int:
+    # None/0 以下は CPU 数、ジョブ数を上限とする
+    if max_workers is None or max_workers <= 0:
+        max_workers = os.cpu_count() or 1
+    return max(1, min(max_workers, total_jobs))
+
+
+def _run_batch_parallel(
+    job_specs: list[BatchJobSpec],
+    workers: int,
+    on_progress: Callable[[BatchProgress], None] | None,
+    cancel_token: CancelToken | None,
+) -> tuple[list[BatchJobResult], int]:
+    """ProcessPoolExecutor でジョブを並列実行し、入力順の結果リストと成功数を返す
+
+    Why: 各ジョブは独立した画像処理で共有状態がないため、
+         プロセス並列でコア数に比例した高速化が得られる。
+    How: 完了したジョブごとに BatchProgress（current_job=完了数）を通知する。
+         CancelToken はプロセス間で共有できないため、完了待ちの合間に
+         メインプロセスで確認し、未着手のジョブを取り消す。
+         実行中のジョブは完了まで待ち、その結果はそのまま採用する。
+    """
+    total_jobs = len(job_specs)
+    results: list[BatchJobResult | None] = [None] * total_jobs
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: dict[Future[BatchJobResult], int] = {
+            executor.submit(_run_one, spec): index
+            for index, spec in enumerate(job_specs)
+        }
+        completed = 0
+        successful = 0
+        while pending:
+            done, _ = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = pending.pop(future)
+                if future.cancelled():
+                    continue
+                job_result = results[index] = future.result()
+                completed += 1
+                successful += job_result.success
+                if on_progress:
+                    on_progress(
+                        BatchProgress(
+                            current_job=completed,
+                            total_jobs=total_jobs,
+                            job_name=job_specs[index].input_image.name,
+                        )
+                    )
+            if cancel_token and cancel_token.cancelled:
+                for future in pending:
+                    future.cancel()
+    ordered = [
+        result if result is not None else _cancelled_result(spec)
+        for spec, result in zip(job_specs, results)
+    ]
+    return ordered, successful
+
+
+class _JobProgressAdapter:
+    """ジョブ単位の ProgressEvent を BatchProgress に変換して通知する
+
+    Why: ジョブごとにクロージャを定義すると関数オブジェクトとセルが毎回生成される。
+    How: バッチ全体で1つだけ生成し、現在のジョブ番号と名前を属性で差し替える。
+    """
+
+    __slots__ = ("current_job", "total_jobs", "job_name", "on_progress")
+
+    def __init__(
+        self, total_jobs: int, on_progress: Callable[[BatchProgress], None]
+    ) -> None:
+        self.current_job = 0
+        self.total_jobs = total_jobs
+        self.job_name = ""
+        self.on_progress = on_progress
+
+    def __call__(self, event: ProgressEvent) -> None:
+        self.on_progress(
+            BatchProgress(
+                current_job=self.current_job,
+                total_jobs=self.total_jobs,
+                job_name=self.job_name,
+                job_progress=event,
+            )
+        )
+
+
+def iter_batch(
     job_specs: list[BatchJobSpec],
     *,
     on_progress: Callable[[BatchProgress], None] | None = None,
     cancel_token: CancelToken | None = None,
-) -> BatchResult:
-    """バッチ処理を実行
-    
+) -> Iterator[BatchJobResult]:
+    """バッチ処理を逐次実行し、ジョブ結果を完了順（=入力順）に yield する
+
+    Why: 全結果をリストに保持せずに済むため、CSV 出力や進捗表示だけを行う
+         呼び出し側は件数によらず一定のメモリで処理できる。
+    How: run_batch の逐次ループそのもの。BatchResult は返さないので、
+         件数集計が必要な場合は呼び出し側で数える。
+         キャンセル後は残りのジョブを失敗結果として yield する。
+
     Args:
         job_specs: ジョブ仕様のリスト
         on_progress: 進捗コールバック
         cancel_token: キャンセルトークン
-        
-    Returns:
-        バッチ実行結果
     """
-    results: list[BatchJobResult] = []
     total_jobs = len(job_specs)
+    # ループ内で参照する値をローカルに束縛（None 判定は is で行う）
+    token = cancel_token
+    progress_cls = BatchProgress
+    adapter = (
+        _JobProgressAdapter(total_jobs, on_progress) if on_progress is not None else None
+    )
     
     for index, spec in enumerate(job_specs, start=1):
         # キャンセルチェック
-        if cancel_token and cancel_token.cancelled:
+        if token is not None and token.cancelled:
             # 残りのジョブを失敗として記録
-            for remaining_spec in job_specs[index - 1:]:
-                results.append(
-                    BatchJobResult(
-                        input_image=remaining_spec.input_image,
-                        success=False,
-                        error=RuntimeError("Batch cancelled"),
-                    )
-                )
-            break
+            for rest in job_specs[index - 1:]:
+                yield _cancelled_result(rest)
+            return
         
-        # バッチ進捗通知
-        if on_progress:
-            on_progress(
-                BatchProgress(
+        # バッチ進捗通知（ジョブ内の進捗は adapter 経由で通知）
+        if adapter is not None:
+            adapter.current_job = index
+            adapter.job_name = spec.input_image.name
+            adapter.on_progress(
+                progress_cls(
                     current_job=index,
                     total_jobs=total_jobs,
-                    job_name=spec.input_image.name,
+                    job_name=adapter.job_name,
                     job_progress=None,
                 )
             )
         
-        # ジョブ進捗コールバック
-        def job_progress_callback(event: ProgressEvent) -> None:
-            if on_progress:
-                on_progress(
-                    BatchProgress(
-                        current_job=index,
-                        total_jobs=total_jobs,
-                        job_name=spec.input_image.name,
-                        job_progress=event,
-                    )
-                )
-        
         # ジョブ実行
         try:
             result = run_job(
                 str(spec.input_image),
                 spec.config,
                 out_dir=str(spec.out_dir) if spec.out_dir else None,
-                on_progress=job_progress_callback,
-                cancel_token=cancel_token,
+                on_progress=adapter,
+                cancel_token=token,
             )
-            results.append(
-                BatchJobResult(
-                    input_image=spec.input_image,
-                    success=True,
-                    result=result,
-                )
+        except _JOB_ERRORS as exc:
+            yield BatchJobResult(
+                input_image=spec.input_image,
+                success=False,
+                error=exc,
             )
-        except (ConfigError, LimitExceededError, ImageReadError, ValueError, RuntimeError) as exc:
-            results.append(
-                BatchJobResult(
-                    input_image=spec.input_image,
-                    success=False,
-                    error=exc,
-                )
+        else:
+            yield BatchJobResult(
+                input_image=spec.input_image,
+                success=True,
+                result=result,
             )
+
+
+def run_batch(
+    job_specs: list[BatchJobSpec],
+    *,
+    on_progress: Callable[[BatchProgress], None] | None = None,
+    cancel_token: CancelToken | None = None,
+    max_workers: int | None = 1,
+) -> BatchResult:
+    """バッチ処理を実行
     
-    # 結果集計
-    successful_jobs = sum(1 for r in results if r.success)
-    failed_jobs = sum(1 for r in results if not r.success)
+    Args:
+        job_specs: ジョブ仕様のリスト
+        on_progress: 進捗コールバック
+        cancel_token: キャンセルトークン
+        max_workers: 並列ワーカープロセス数（1: 逐次実行、None/0: CPU 数）。
+            並列実行時はジョブ単位の進捗のみ通知し（job_progress=None）、
+            キャンセルは未着手のジョブにのみ作用する。
+        
+    Returns:
+        バッチ実行結果（results は入力順）
+    """
+    total_jobs = len(job_specs)
+    workers = _resolve_workers(max_workers, total_jobs)
+    if workers > 1:
+        results, successful = _run_batch_parallel(
+            job_specs, workers, on_progress, cancel_token
+        )
+    else:
+        results = []
+        successful = 0
+        append = results.append
+        for job_result in iter_batch(
+            job_specs, on_progress=on_progress, cancel_token=cancel_token
+        ):
+            append(job_result)
+            successful += job_result.success
     
+    # 結果集計（キャンセル分も含め、成功以外はすべて失敗）
     return BatchResult(
         total_jobs=total_jobs,
-        successful_jobs=successful_jobs,
-        failed_jobs=failed_jobs,
+        successful_jobs=successful,
+        failed_jobs=total_jobs - successful,
         results=results,
     )
 
 
+def _use_default_config(image_path: Path, default_config: Config) -> Config:
+    # auto_config=False 時の設定解決（常にデフォルト設定）
+    return default_config
+
+
 def prepare_batch_jobs(
     paths: list[Path],
     default_config: Config,
@@ -189,19 +383,30 @@ def prepare_batch_jobs(
         ジョブ仕様のリスト
     """
     job_specs: list[BatchJobSpec] = []
+    # auto_config の分岐を画像ごとに評価しないよう、ループ前に関数を選ぶ
+    resolve_config: Callable[[Path, Config], Config] = (
+        find_config_for_image if auto_config else _use_default_config
+    )
     
     for path in paths:
-        if path.is_dir():
+        # is_dir() と is_file() の2回ではなく、1回の stat で種別を判定
+        try:
+            mode = os.stat(path).st_mode
+        except OSError:
+            continue
+        if stat.S_ISDIR(mode):
             # ディレクトリの場合: 内部の画像を検索
             images = find_images_in_directory(path, recursive=recursive)
             for image in images:
-                config = find_config_for_image(image, default_config) if auto_config else default_config
                 # 出力先はデフォルト（画像パスから自動決定）
-                job_specs.append(BatchJobSpec(input_image=image, config=config))
-        elif path.is_file() and path.suffix.lower() == ".png":
+                job_specs.append(
+                    BatchJobSpec(input_image=image, config=resolve_config(image, default_config))
+                )
+        elif stat.S_ISREG(mode) and path.suffix.lower() == ".png":
             # PNG画像の場合
-            config = find_config_for_image(path, default_config) if auto_config else default_config
-            job_specs.append(BatchJobSpec(input_image=path, config=config))
+            job_specs.append(
+                BatchJobSpec(input_image=path, config=resolve_config(path, default_config))
+            )
     
     return job_specs
 
@@ -213,6 +418,7 @@ __all__ = [
     "BatchResult",
     "find_images_in_directory",
     "find_config_for_image",
+    "iter_batch",
     "run_batch",
     "prepare_batch_jobs",
 ]
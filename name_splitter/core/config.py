@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Callable, Iterable
 
+from . import _json
 from .errors import ConfigError
 
 ALLOWED_GRID_ORDERS = {"rtl_ttb", "ltr_ttb"}
@@ -11,13 +14,19 @@ ALLOWED_ON_EXCEED = {"error"}
 ALLOWED_OUTPUT_LAYOUTS = {"pages", "layers"}
 ALLOWED_CONTAINERS = {"png", "pdf"}
 
+# load_config の解析結果キャッシュ: (解決済みパス, st_mtime_ns, st_size) -> Config
+_CONFIG_CACHE_MAX = 64
+_config_cache: OrderedDict[tuple[Path, int, int], Config] = OrderedDict()
+_config_cache_lock = threading.Lock()
+_DEFAULT_CONFIG_PATH = Path(__file__).resolve().parents[2] / "resources" / "default_config.yaml"
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class InputConfig:
     image_path: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GridConfig:
     rows: int = 4
     cols: int = 4
@@ -38,21 +47,21 @@ class GridConfig:
     page_size_unit: str = "px"  # px or mm for custom size
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MergeRule:
     group_name: str | None = None
     layer_name: str | None = None
     output_layer: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MergeConfig:
     group_rules: tuple[MergeRule, ...] = field(default_factory=tuple)
     layer_rules: tuple[MergeRule, ...] = field(default_factory=tuple)
     include_hidden_layers: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OutputConfig:
     out_dir: str = ""
     page_basename: str = "page_{page:03d}"
@@ -66,13 +75,13 @@ class OutputConfig:
     odd_even: str = "all"  # "all", "odd", "even"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LimitsConfig:
     max_dim_px: int = 30000
     on_exceed: str = "error"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Config:
     version: int = 1
     input: InputConfig = field(default_factory=InputConfig)
@@ -90,45 +99,77 @@ def _require_mapping(value: Any, label: str) -> dict[str, Any]:
     return value
 
 
+def _make_rule(index: int, item: Any, label: str) -> MergeRule:
+    # 1件分の検証と MergeRule 生成を一度に行う
+    if not isinstance(item, dict):
+        raise ConfigError(f"{label}[{index}] must be a mapping")
+    get = item.get
+    output_layer = str(get("output_layer", "")).strip()
+    if not output_layer:
+        raise ConfigError(f"{label}[{index}].output_layer is required")
+    group_name = get("group_name")
+    layer_name = get("layer_name")
+    if group_name is None and layer_name is None:
+        raise ConfigError(f"{label}[{index}] requires group_name or layer_name")
+    return MergeRule(
+        group_name=None if group_name is None else str(group_name),
+        layer_name=None if layer_name is None else str(layer_name),
+        output_layer=output_layer,
+    )
+
+
 def _parse_rules(values: Iterable[dict[str, Any]] | None, label: str) -> tuple[MergeRule, ...]:
     if values is None:
-        return tuple()
-    rules: list[MergeRule] = []
-    for index, item in enumerate(values):
-        if not isinstance(item, dict):
-            raise ConfigError(f"{label}[{index}] must be a mapping")
-        output_layer = str(item.get("output_layer", "")).strip()
-        if not output_layer:
-            raise ConfigError(f"{label}[{index}].output_layer is required")
-        group_name = item.get("group_name")
-        layer_name = item.get("layer_name")
-        if group_name is None and layer_name is None:
-            raise ConfigError(f"{label}[{index}] requires group_name or layer_name")
-        rules.append(
-            MergeRule(
-                group_name=str(group_name) if group_name is not None else None,
-                layer_name=str(layer_name) if layer_name is not None else None,
-                output_layer=output_layer,
-            )
-        )
-    return tuple(rules)
+        return ()
+    return tuple([_make_rule(index, item, label) for index, item in enumerate(values)])
 
 
 def load_config(path: str | Path) -> Config:
-    config_path = Path(path)
-    if not config_path.exists():
-        raise ConfigError(f"Config not found: {config_path}")
-    
+    """設定ファイルを読み込む
+
+    Why: GUI/CLI/バッチは同じファイルを何度も読み直すが、YAML 解析は重い。
+    How: (解決済みパス, mtime, サイズ) をキーに解析済み Config を LRU で保持する。
+         Config は frozen なので共有しても安全。ファイルが更新されればキーが変わる。
+    """
+    config_path = Path(path).resolve()
+    try:
+        st = config_path.stat()
+    except OSError:
+        raise ConfigError(f"Config not found: {Path(path)}") from None
+    key = (config_path, st.st_mtime_ns, st.st_size)
+    with _config_cache_lock:
+        cached = _config_cache.get(key)
+        if cached is not None:
+            _config_cache.move_to_end(key)
+            return cached
+
+    config = _parse_config_file(config_path)
+    with _config_cache_lock:
+        _config_cache[key] = config
+        if len(_config_cache) > _CONFIG_CACHE_MAX:
+            _config_cache.popitem(last=False)
+    return config
+
+
+def clear_config_cache() -> None:
+    """load_config のキャッシュを破棄（テスト用）"""
+    with _config_cache_lock:
+        _config_cache.clear()
+
+
+def _parse_config_file(config_path: Path) -> Config:
+    # 設定ファイルを解析して検証済みの Config を作る
     suffix = config_path.suffix.lower()
     if suffix in {".yaml", ".yml"}:
         try:
             import yaml  # type: ignore
         except ImportError as exc:
             raise ConfigError("PyYAML is required to load YAML config files") from exc
-        raw = yaml.safe_load(config_path.read_text(encoding="utf-8"))
+        # libyaml 付きの PyYAML なら C 実装の SafeLoader を使う
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        raw = yaml.load(config_path.read_text(encoding="utf-8"), Loader=loader)
     elif suffix == ".json":
-        import json
-        raw = json.loads(config_path.read_text(encoding="utf-8"))
+        raw = _json.loads(config_path.read_bytes())
     else:
         raise ConfigError(f"Unsupported config file format: {suffix}. Use .yaml, .yml, or .json")
     
@@ -205,40 +246,60 @@ def load_config(path: str | Path) -> Config:
 
 
 def load_default_config() -> Config:
-    default_path = Path(__file__).resolve().parents[2] / "resources" / "default_config.yaml"
-    return load_config(default_path)
+    return load_config(_DEFAULT_CONFIG_PATH)
+
+
+# (判定, エラーメッセージ) の検証表。上から順に評価し、最初の違反を報告する。
+# メッセージは str.format(cfg=cfg) で展開される。
+_VALIDATION_RULES: tuple[tuple[Callable[[Config], bool], str], ...] = (
+    (lambda c: c.version == 1, "Unsupported config version: {cfg.version}"),
+    (lambda c: c.grid.rows > 0 and c.grid.cols > 0, "grid.rows and grid.cols must be positive"),
+    (
+        lambda c: c.grid.margin_px >= 0 and c.grid.gutter_px >= 0,
+        "grid.margin_px and grid.gutter_px must be >= 0",
+    ),
+    (
+        lambda c: c.grid.margin_top_px >= 0 and c.grid.margin_bottom_px >= 0,
+        "grid.margin_top_px and grid.margin_bottom_px must be >= 0",
+    ),
+    (
+        lambda c: c.grid.margin_left_px >= 0 and c.grid.margin_right_px >= 0,
+        "grid.margin_left_px and grid.margin_right_px must be >= 0",
+    ),
+    (lambda c: c.grid.dpi > 0, "grid.dpi must be positive"),
+    (
+        lambda c: c.grid.page_width_px >= 0 and c.grid.page_height_px >= 0,
+        "grid.page_width_px and grid.page_height_px must be >= 0",
+    ),
+    (
+        lambda c: c.grid.order in ALLOWED_GRID_ORDERS,
+        f"grid.order must be one of {sorted(ALLOWED_GRID_ORDERS)}",
+    ),
+    (lambda c: c.limits.max_dim_px > 0, "limits.max_dim_px must be positive"),
+    (
+        lambda c: c.limits.on_exceed in ALLOWED_ON_EXCEED,
+        f"limits.on_exceed must be one of {sorted(ALLOWED_ON_EXCEED)}",
+    ),
+    (lambda c: bool(c.output.layer_stack), "output.layer_stack must not be empty"),
+    (
+        lambda c: c.output.layout in ALLOWED_OUTPUT_LAYOUTS,
+        f"output.layout must be one of {sorted(ALLOWED_OUTPUT_LAYOUTS)}",
+    ),
+    (
+        lambda c: c.output.container in ALLOWED_CONTAINERS,
+        f"output.container must be one of {sorted(ALLOWED_CONTAINERS)}",
+    ),
+    (lambda c: c.output.output_dpi >= 0, "output.output_dpi must be >= 0 (0 = no resize)"),
+    (lambda c: c.output.page_number_start >= 1, "output.page_number_start must be >= 1"),
+    (
+        lambda c: c.output.odd_even in {"all", "odd", "even"},
+        "output.odd_even must be 'all', 'odd', or 'even'",
+    ),
+)
 
 
 def validate_config(cfg: Config) -> None:
-    if cfg.version != 1:
-        raise ConfigError(f"Unsupported config version: {cfg.version}")
-    if cfg.grid.rows <= 0 or cfg.grid.cols <= 0:
-        raise ConfigError("grid.rows and grid.cols must be positive")
-    if cfg.grid.margin_px < 0 or cfg.grid.gutter_px < 0:
-        raise ConfigError("grid.margin_px and grid.gutter_px must be >= 0")
-    if cfg.grid.margin_top_px < 0 or cfg.grid.margin_bottom_px < 0:
-        raise ConfigError("grid.margin_top_px and grid.margin_bottom_px must be >= 0")
-    if cfg.grid.margin_left_px < 0 or cfg.grid.margin_right_px < 0:
-        raise ConfigError("grid.margin_left_px and grid.margin_right_px must be >= 0")
-    if cfg.grid.dpi <= 0:
-        raise ConfigError("grid.dpi must be positive")
-    if cfg.grid.page_width_px < 0 or cfg.grid.page_height_px < 0:
-        raise ConfigError("grid.page_width_px and grid.page_height_px must be >= 0")
-    if cfg.grid.order not in ALLOWED_GRID_ORDERS:
-        raise ConfigError(f"grid.order must be one of {sorted(ALLOWED_GRID_ORDERS)}")
-    if cfg.limits.max_dim_px <= 0:
-        raise ConfigError("limits.max_dim_px must be positive")
-    if cfg.limits.on_exceed not in ALLOWED_ON_EXCEED:
-        raise ConfigError(f"limits.on_exceed must be one of {sorted(ALLOWED_ON_EXCEED)}")
-    if not cfg.output.layer_stack:
-        raise ConfigError("output.layer_stack must not be empty")
-    if cfg.output.layout not in ALLOWED_OUTPUT_LAYOUTS:
-        raise ConfigError(f"output.layout must be one of {sorted(ALLOWED_OUTPUT_LAYOUTS)}")
-    if cfg.output.container not in ALLOWED_CONTAINERS:
-        raise ConfigError(f"output.container must be one of {sorted(ALLOWED_CONTAINERS)}")
-    if cfg.output.output_dpi < 0:
-        raise ConfigError("output.output_dpi must be >= 0 (0 = no resize)")
-    if cfg.output.page_number_start < 1:
-        raise ConfigError("output.page_number_start must be >= 1")
-    if cfg.output.odd_even not in {"all", "odd", "even"}:
-        raise ConfigError("output.odd_even must be 'all', 'odd', or 'even'")
+    # 検証表を順に評価し、最初に満たさない規則のメッセージで ConfigError を送出
+    for is_valid, message in _VALIDATION_RULES:
+        if not is_valid(cfg):
+            raise ConfigError(message.format(cfg=cfg))
@@ -10,5 +10,5 @@ class ImageReadError(RuntimeError):
     """Raised when the input image cannot be read."""
 
 
-class PsdReadError(ImageReadError):
-    """Backward-compatible alias for ImageReadError."""
+# Backward-compatible alias: except PsdReadError still catches image read failures.
+PsdReadError = ImageReadError
@@ -6,33 +6,58 @@ from typing import Iterable, Tuple
 
 from .errors import ImageReadError
 
+try:
+    # 呼び出しごとの import を避けるため、モジュール読み込み時に一度だけ解決する
+    from PIL import Image as _PIL_Image
+except ImportError:
+    _PIL_Image = None  # type: ignore[assignment]
+
 RGBA = Tuple[int, int, int, int]
 
 
 @dataclass
 class ImageData:
-    # RGBAピクセルを保持する最小画像表現
+    """RGBAピクセルを保持する最小画像表現
+
+    Why: ピクセルごとのタプルを入れ子リストで持つと1ピクセルあたり
+         数十バイトの Python オブジェクトになり、生成・走査も遅い。
+    How: 行優先・1ピクセル4バイト(RGBA)の平坦な bytearray で保持する。
+         Pillow とは tobytes / frombytes でそのまま受け渡せる。
+    """
+
     width: int
     height: int
-    pixels: list[list[RGBA]]
+    data: bytearray
 
     @classmethod
     def blank(cls, width: int, height: int, color: RGBA = (0, 0, 0, 0)) -> "ImageData":
         # 指定色で塗りつぶした空画像を作成
-        pixels = [[color for _ in range(width)] for _ in range(height)]
-        return cls(width=width, height=height, pixels=pixels)
+        return cls(width=width, height=height, data=bytearray(bytes(color) * (width * height)))
+
+    @classmethod
+    def from_rows(cls, rows: list[list[RGBA]]) -> "ImageData":
+        # 行ごとのRGBAタプルのリストから作成（テスト・小画像向け）
+        width = len(rows[0]) if rows else 0
+        data = bytearray(value for row in rows for pixel in row for value in pixel)
+        return cls(width=width, height=len(rows), data=data)
 
     @classmethod
     def from_pil(cls, image) -> "ImageData":
         # PIL画像をRGBAのImageDataに変換
+        # 既に RGBA なら convert による全画素コピーを省き、直接バイト列を取り出す
         try:
-            converted = image.convert("RGBA")
+            converted = image if image.mode == "RGBA" else image.convert("RGBA")
+            data = bytearray(converted.tobytes())
         except (OSError, ValueError, AttributeError) as exc:
             raise ImageReadError("Failed to convert image to RGBA") from exc
         width, height = converted.size
-        data = list(converted.getdata())
-        pixels = [data[row * width : (row + 1) * width] for row in range(height)]
-        return cls(width=width, height=height, pixels=pixels)
+        return cls(width=width, height=height, data=data)
+
+    def pixel(self, x: int, y: int) -> RGBA:
+        # (x, y) のピクセル値を取得
+        data = self.data
+        index = (y * self.width + x) * 4
+        return (data[index], data[index + 1], data[index + 2], data[index + 3])
 
     def crop(self, x0: int, y0: int, x1: int, y1: int) -> "ImageData":
         # 指定矩形で切り出す
@@ -42,45 +67,116 @@ class ImageData:
         y1 = max(0, min(self.height, y1))
         width = max(0, x1 - x0)
         height = max(0, y1 - y0)
-        pixels = [row[x0:x1] for row in self.pixels[y0:y1]]
         if width == 0 or height == 0:
-            pixels = [[(0, 0, 0, 0)] * width for _ in range(height)]
-        return ImageData(width=width, height=height, pixels=pixels)
+            return ImageData(width=width, height=height, data=bytearray())
+        stride = self.width * 4
+        if width == self.width:
+            # 全幅なら連続領域を1回でコピー
+            return ImageData(
+                width=width, height=height, data=self.data[y0 * stride : y1 * stride]
+            )
+        row_bytes = width * 4
+        first = y0 * stride + x0 * 4
+        with memoryview(self.data) as view:
+            data = bytearray().join(
+                view[start : start + row_bytes]
+                for start in range(first, first + height * stride, stride)
+            )
+        return ImageData(width=width, height=height, data=data)
 
     def composite_over(self, overlay: "ImageData", offset_x: int, offset_y: int) -> None:
-        # オーバーレイ画像をアルファ合成して重ねる
-        for y in range(overlay.height):
-            dest_y = offset_y + y
-            if dest_y < 0 or dest_y >= self.height:
-                continue
-            row = self.pixels[dest_y]
-            overlay_row = overlay.pixels[y]
-            for x in range(overlay.width):
-                dest_x = offset_x + x
-                if dest_x < 0 or dest_x >= self.width:
-                    continue
-                src_r, src_g, src_b, src_a = overlay_row[x]
-                if src_a == 0:
-                    continue
-                dst_r, dst_g, dst_b, dst_a = row[dest_x]
-                inv_a = 255 - src_a
-                out_a = src_a + (dst_a * inv_a + 127) // 255
-                if out_a == 0:
-                    row[dest_x] = (0, 0, 0, 0)
-                    continue
-                out_r = (src_r * src_a * 255 + dst_r * dst_a * inv_a + out_a * 127) // (
-                    out_a * 255
-                )
-                out_g = (src_g * src_a * 255 + dst_g * dst_a * inv_a + out_a * 127) // (
-                    out_a * 255
-                )
-                out_b = (src_b * src_a * 255 + dst_b * dst_a * inv_a + out_a * 127) // (
-                    out_a * 255
-                )
-                row[dest_x] = (out_r, out_g, out_b, out_a)
+        """オーバーレイ画像をアルファ合成して重ねる
+
+        Why: ピクセルごとの Python ループは大きな画像で数千万回の反復になる。
+        How: 重なり矩形を一度だけ求め、その範囲を Pillow の alpha_composite
+             （C 実装の "over" 合成）で処理して書き戻す。オーバーレイが
+             完全不透明ならそのままコピーし、完全透明なら何もしない。
+             src_a == 0 の画素は合成先を保ち、アルファ値は従来の式と一致する。
+             半透明画素の RGB は丸め方の違いで数階調ずれることがある。
+        """
+        clip = _clip_overlay(self.width, self.height, overlay, offset_x, offset_y)
+        if clip is None:
+            return
+        dx0, dy0, src = clip
+        src_image = src.to_pil()
+        alpha_min, alpha_max = src_image.getextrema()[3]
+        if alpha_max == 0:
+            # 完全透明: 合成先は変わらない
+            return
+        if alpha_min == 255:
+            # 完全不透明: 合成結果はオーバーレイそのものなので行コピーのみ
+            self._write_rect(dx0, dy0, src.width, src.height, src.data)
+            return
+        canvas = self.crop(dx0, dy0, dx0 + src.width, dy0 + src.height).to_pil()
+        canvas.alpha_composite(src_image)
+        self._write_rect(dx0, dy0, src.width, src.height, canvas.tobytes())
+
+    def _write_rect(
+        self, x0: int, y0: int, width: int, height: int, rect: bytes | bytearray
+    ) -> None:
+        # 矩形 (x0, y0, width, height) の行データを書き戻す（範囲は呼び出し側で保証）
+        stride = self.width * 4
+        row_bytes = width * 4
+        start = y0 * stride + x0 * 4
+        if width == self.width:
+            self.data[start : start + height * stride] = rect
+            return
+        data = self.data
+        with memoryview(rect) as view:
+            for offset in range(0, height * row_bytes, row_bytes):
+                data[start : start + row_bytes] = view[offset : offset + row_bytes]
+                start += stride
+
+    def to_pil(self):
+        """Return a Pillow RGBA image holding a copy of the pixels.
+
+        Why: save/resize hand pixels to Pillow; passing the raw buffer
+             avoids building one Python tuple per pixel for putdata().
+        How: Image.frombytes decodes straight from the bytearray (buffer
+             protocol), so the only copy is the one into Pillow's storage.
+        """
+        if _PIL_Image is None:
+            raise RuntimeError("Pillow is required for image conversion")
+        size = (self.width, self.height)
+        if not self.data:
+            return _PIL_Image.new("RGBA", size)
+        return _PIL_Image.frombytes("RGBA", size, self.data)
+
+    def crop_pil(
+        self, x0: int, y0: int, x1: int, y1: int, size: tuple[int, int] | None = None
+    ):
+        """Return the given rectangle as a Pillow RGBA image.
+
+        Why: Grid cells are cut from the page only to be resized and saved,
+             so crop() + to_pil() copied every cell two or three times in Python.
+        How: Wraps the buffer in a read-only Image.frombuffer view (no copy)
+             and lets Pillow's C crop copy just the cell rectangle once.
+             When size is given, the cell is then resized with LANCZOS.
+        """
+        if _PIL_Image is None:
+            raise RuntimeError("Pillow is required for image conversion")
+        x0 = max(0, min(self.width, x0))
+        x1 = max(x0, min(self.width, x1))
+        y0 = max(0, min(self.height, y0))
+        y1 = max(y0, min(self.height, y1))
+        if not self.data:
+            return _PIL_Image.new("RGBA", (x1 - x0, y1 - y0))
+        view = _PIL_Image.frombuffer(
+            "RGBA",
+            (self.width, self.height),
+            self.data,  # type: ignore[arg-type]
+            "raw",
+            "RGBA",
+            0,
+            1,
+        )
+        cell = view.crop((x0, y0, x1, y1))
+        if size is not None and size != cell.size:
+            cell = cell.resize(size, _PIL_Image.Resampling.LANCZOS)
+        return cell
 
     def save(self, path: Path, *, dpi: int = 0) -> None:
-        """Save image to file. PPM uses built-in writer; PNG uses Pillow.
+        """Save image to file. PPM uses built-in binary (P6) writer; PNG uses Pillow.
 
         Why: DPI metadata in output PNGs enables correct physical sizing
              in print workflows and PDF embedding.
@@ -90,16 +186,7 @@ class ImageData:
         if ext == "ppm":
             _save_ppm(self, path)
             return
-        try:
-            from PIL import Image
-        except ImportError as exc:
-            raise RuntimeError("Pillow is required to save PNG files") from exc
-        image = Image.new("RGBA", (self.width, self.height))
-        image.putdata([pixel for row in self.pixels for pixel in row])
-        save_kwargs: dict[str, object] = {}
-        if dpi > 0:
-            save_kwargs["dpi"] = (dpi, dpi)
-        image.save(str(path), **save_kwargs)  # type: ignore[arg-type]
+        save_pil_image(self.to_pil(), path, dpi=dpi)
 
     def resize(self, new_width: int, new_height: int) -> "ImageData":
         """Resize image using Pillow LANCZOS resampling.
@@ -112,37 +199,80 @@ class ImageData:
             return ImageData.blank(max(1, new_width), max(1, new_height))
         if new_width == self.width and new_height == self.height:
             return self
-        try:
-            from PIL import Image
-            from PIL.Image import Resampling
-        except ImportError as exc:
-            raise RuntimeError("Pillow is required for image resize") from exc
-        pil_img = Image.new("RGBA", (self.width, self.height))
-        pil_img.putdata([pixel for row in self.pixels for pixel in row])
-        resized = pil_img.resize((new_width, new_height), Resampling.LANCZOS)
+        if _PIL_Image is None:
+            raise RuntimeError("Pillow is required for image resize")
+        resized = self.to_pil().resize(
+            (new_width, new_height), _PIL_Image.Resampling.LANCZOS
+        )
         return ImageData.from_pil(resized)
 
 
+def save_pil_image(image, path: Path, *, dpi: int = 0) -> None:
+    # Pillow 画像を ImageData.save と同じ規則（PPM は組み込み P6、dpi 指定）で保存
+    if path.suffix.lower() == ".ppm":
+        _save_ppm(ImageData.from_pil(image), path)
+        return
+    save_kwargs: dict[str, object] = {}
+    if dpi > 0:
+        save_kwargs["dpi"] = (dpi, dpi)
+    image.save(str(path), **save_kwargs)  # type: ignore[arg-type]
+
+
+def _clip_overlay(
+    width: int, height: int, overlay: ImageData, offset_x: int, offset_y: int
+) -> tuple[int, int, ImageData] | None:
+    # 合成先 (width x height) に収まる部分の配置先左上と切り出したオーバーレイを返す
+    dx0 = max(0, offset_x)
+    dy0 = max(0, offset_y)
+    dx1 = min(width, offset_x + overlay.width)
+    dy1 = min(height, offset_y + overlay.height)
+    if dx0 >= dx1 or dy0 >= dy1:
+        return None
+    sx0 = dx0 - offset_x
+    sy0 = dy0 - offset_y
+    if sx0 == 0 and sy0 == 0 and dx1 - dx0 == overlay.width and dy1 - dy0 == overlay.height:
+        return dx0, dy0, overlay
+    return dx0, dy0, overlay.crop(sx0, sy0, sx0 + dx1 - dx0, sy0 + dy1 - dy0)
+
+
 def composite_layers(
     canvas_size: tuple[int, int],
     layers: Iterable[tuple[ImageData, tuple[int, int]]],
 ) -> ImageData:
-    # 複数レイヤーを順に合成して1枚にする
-    canvas = ImageData.blank(canvas_size[0], canvas_size[1])
+    """複数レイヤーを順に合成して1枚にする
+
+    Why: composite_over を層ごとに呼ぶと、そのたびにキャンバスの該当範囲を
+         切り出して書き戻すため、層の数だけキャンバスを往復コピーする。
+    How: キャンバスは Pillow 画像として最後まで保持し、各層は事前にクリップした
+         矩形だけを合成する。完全不透明な層は paste（行コピー）、完全透明な層は
+         スキップし、ImageData への変換は最後に1回だけ行う。
+    """
+    width, height = canvas_size
+    canvas = ImageData.blank(width, height).to_pil()
     for image, (x0, y0) in layers:
-        canvas.composite_over(image, x0, y0)
-    return canvas
+        clip = _clip_overlay(width, height, image, x0, y0)
+        if clip is None:
+            continue
+        dx0, dy0, src = clip
+        src_image = src.to_pil()
+        alpha_min, alpha_max = src_image.getextrema()[3]
+        if alpha_max == 0:
+            continue
+        if alpha_min == 255:
+            canvas.paste(src_image, (dx0, dy0))
+        else:
+            canvas.alpha_composite(src_image, dest=(dx0, dy0))
+    return ImageData.from_pil(canvas)
 
 
 def _save_ppm(image: ImageData, path: Path) -> None:
-    # 簡易PPM(P3)として保存
-    with path.open("w", encoding="utf-8") as handle:
-        handle.write("P3\n")
-        handle.write(f"{image.width} {image.height}\n")
-        handle.write("255\n")
-        for row in image.pixels:
-            line_parts = []
-            for r, g, b, _a in row:
-                line_parts.append(f"{r} {g} {b}")
-            handle.write(" ".join(line_parts))
-            handle.write("\n")
+    # バイナリPPM(P6)として保存
+    # アルファを落とした RGB 列を拡張スライスでまとめて作り、1回で書き出す
+    data = image.data
+    rgb = bytearray(len(data) // 4 * 3)
+    rgb[0::3] = data[0::4]
+    rgb[1::3] = data[1::4]
+    rgb[2::3] = data[2::4]
+    with path.open("wb") as handle:
+        handle.write(f"P6\n{image.width} {image.height}\n255\n".encode("ascii"))
+        handle.write(rgb)
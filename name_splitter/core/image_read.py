@@ -4,24 +4,24 @@ from dataclasses import dataclass
 from pathlib import Path
 
 from .errors import ImageReadError
-from .image_ops import ImageData
+from .image_ops import ImageData, _PIL_Image
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ImageInfo:
     # 入力画像のサイズ
     width: int
     height: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LayerPixels:
     # レイヤーの配置矩形とピクセル情報
     bbox: tuple[int, int, int, int]
     image: ImageData
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LayerNode:
     # レイヤー/グループの構造情報（互換維持用）
     name: str
@@ -31,7 +31,7 @@ class LayerNode:
     pixels: LayerPixels | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ImageDocument:
     info: ImageInfo
     image: ImageData
@@ -42,12 +42,10 @@ def read_image(path: str | Path) -> ImageInfo:
     image_path = Path(path)
     if not image_path.exists():
         raise ImageReadError(f"Image not found: {image_path}")
+    if _PIL_Image is None:
+        raise ImageReadError("Pillow is required to read image files")
     try:
-        from PIL import Image
-    except ImportError as exc:
-        raise ImageReadError("Pillow is required to read image files") from exc
-    try:
-        with Image.open(image_path) as image:
+        with _PIL_Image.open(image_path) as image:
             width, height = image.size
     except (OSError, ValueError, SyntaxError) as exc:
         raise ImageReadError(f"Failed to read image: {image_path}") from exc
@@ -59,12 +57,10 @@ def read_image_document(path: str | Path) -> ImageDocument:
     image_path = Path(path)
     if not image_path.exists():
         raise ImageReadError(f"Image not found: {image_path}")
+    if _PIL_Image is None:
+        raise ImageReadError("Pillow is required to read image files")
     try:
-        from PIL import Image
-    except ImportError as exc:
-        raise ImageReadError("Pillow is required to read image files") from exc
-    try:
-        with Image.open(image_path) as image:
+        with _PIL_Image.open(image_path) as image:
             image_data = ImageData.from_pil(image)
             width, height = image_data.width, image_data.height
     except (OSError, ValueError, SyntaxError) as exc:
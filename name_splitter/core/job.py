@@ -13,8 +13,11 @@ from .image_read import ImageInfo, read_image_document
 from .pdf_export import export_pdf
 from .render import RenderPlan, RenderedPage, render_pages, write_plan
 
+# render_pages の進捗通知の最短間隔（秒）。1% 刻みと最終ページは常に通知する
+_PAGE_REPORT_INTERVAL = 0.1
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ProgressEvent:
     """Progress notification event.
 
@@ -45,7 +48,7 @@ class CancelToken:
         return self._cancelled
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JobResult:
     """Job execution result.
 
@@ -76,7 +79,10 @@ def run_job(
 
         Why: GUI needs speed/ETA for user feedback during render_pages.
         How: Computes elapsed, speed, and ETA from monotonic clock.
+             Skips the timing math entirely when nobody is listening.
         """
+        if on_progress is None:
+            return
         elapsed = time.monotonic() - _job_start
         speed = 0.0
         eta: float | None = None
@@ -84,13 +90,12 @@ def run_job(
             speed = done / max(elapsed, 0.001)
             remaining = total - done
             eta = remaining / speed if speed > 0 and remaining > 0 else 0.0
-        if on_progress:
-            on_progress(ProgressEvent(
-                phase=phase, done=done, total=total, message=message,
-                elapsed_seconds=elapsed,
-                pages_per_second=speed,
-                eta_seconds=eta,
-            ))
+        on_progress(ProgressEvent(
+            phase=phase, done=done, total=total, message=message,
+            elapsed_seconds=elapsed,
+            pages_per_second=speed,
+            eta_seconds=eta,
+        ))
 
     def check_cancel() -> None:
         # キャンセルされていれば中断
@@ -105,7 +110,9 @@ def run_job(
 
     _enforce_limits(image_info, cfg)
 
-    primary_layer = cfg.output.layer_stack[0] if cfg.output.layer_stack else "flat"
+    output_cfg = cfg.output
+    # 単一画像をそのまま出すため、出力は先頭レイヤー（PDF もこのレイヤーを使う）
+    primary_layer = output_cfg.layer_stack[0] if output_cfg.layer_stack else "flat"
     merge_result = MergeResult(
         outputs={primary_layer: []},
         unmatched=[],
@@ -121,8 +128,8 @@ def run_job(
     selected_pages = _select_pages(
         len(cells),
         test_page,
-        skip=cfg.output.skip_pages,
-        odd_even=cfg.output.odd_even,
+        skip=output_cfg.skip_pages,
+        odd_even=output_cfg.odd_even,
     )
 
     output_dir = _resolve_out_dir(input_image, cfg, out_dir)
@@ -133,7 +140,21 @@ def run_job(
 
     report("render_pages", 0, len(selected_pages), "Rendering pages")
 
+    # Why: Many small pages render faster than a UI can usefully refresh,
+    #      and each report builds a ProgressEvent plus a GUI log line.
+    # How: Report a page only if the interval has elapsed, it lands on a 1%
+    #      step, or it is the last page.
+    page_step = max(1, len(selected_pages) // 100)
+    last_page_report = time.monotonic()
+
     def on_render_page(rendered: RenderedPage, done: int, total: int) -> None:
+        nonlocal last_page_report
+        if on_progress is None:
+            return
+        now = time.monotonic()
+        if done != total and done % page_step and now - last_page_report < _PAGE_REPORT_INTERVAL:
+            return
+        last_page_report = now
         report("render_pages", done, total, f"Rendered page {rendered.page_index + 1}")
 
     rendered_pages = render_pages(
@@ -151,22 +172,23 @@ def run_job(
     # Why: Users may want a single PDF containing all rendered pages
     # How: When container is "pdf", call export_pdf after page rendering
     pdf_path: Path | None = None
-    if cfg.output.container == "pdf":
+    if output_cfg.container == "pdf":
         report("export_pdf", 0, 1, "Generating PDF")
         pdf_filename = Path(input_image).stem + ".pdf"
         pdf_path = output_dir / pdf_filename
-        primary_layer = cfg.output.layer_stack[0] if cfg.output.layer_stack else "flat"
         # Why: PDF should use target DPI (after resize), not source DPI
-        target_dpi = cfg.output.output_dpi if cfg.output.output_dpi > 0 else cfg.grid.dpi
+        output_dpi = output_cfg.output_dpi
+        target_dpi = output_dpi if output_dpi > 0 else cfg.grid.dpi
         export_pdf(
             rendered_pages,
             pdf_path,
             layer_name=primary_layer,
             dpi=target_dpi,
         )
-        resolved_pdf = pdf_path.resolve()
-        pdf_size = resolved_pdf.stat().st_size
-        report("export_pdf", 1, 1, f"PDF exported: {resolved_pdf} ({pdf_size:,} bytes)")
+        # export_pdf has already verified the file; one stat for the size, and
+        # absolute() (no syscall) instead of resolve() for the message
+        pdf_size = pdf_path.stat().st_size
+        report("export_pdf", 1, 1, f"PDF exported: {pdf_path.absolute()} ({pdf_size:,} bytes)")
         check_cancel()
 
     elapsed = time.monotonic() - _job_start
@@ -204,11 +226,12 @@ def _select_pages(
         skip_set = {s - 1 for s in skip if 1 <= s <= total_pages}
         pages = [p for p in pages if p not in skip_set]
 
-    # Filter odd/even (based on 1-based position in remaining pages)
+    # Filter odd/even (based on 1-based position in remaining pages):
+    # 1-based odd positions are 0-based indices 0, 2, 4, ... → a stride slice
     if odd_even == "odd":
-        pages = [p for i, p in enumerate(pages) if (i + 1) % 2 == 1]
+        pages = pages[::2]
     elif odd_even == "even":
-        pages = [p for i, p in enumerate(pages) if (i + 1) % 2 == 0]
+        pages = pages[1::2]
 
     return pages
 
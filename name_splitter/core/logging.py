@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import atexit
 import logging
+import queue
 import sys
+from collections import deque
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import TextIO
 
+# 実際の書き込みを担うバックグラウンドリスナー（setup_logging ごとに差し替え）
+_listener: QueueListener | None = None
+
 
 def setup_logging(
     *,
@@ -14,7 +21,12 @@ def setup_logging(
     console: bool = True,
 ) -> logging.Logger:
     """ロギング環境をセットアップ
-    
+
+    Why: ファイル/コンソールへの同期書き込みは、ログを出したスレッド
+         （レンダリング処理）をディスク I/O 待ちで止めてしまう。
+    How: ロガーには QueueHandler だけを付け、整形と書き込みは
+         QueueListener のバックグラウンドスレッドで行う。
+
     Args:
         log_file: ログファイルのパス（Noneの場合はファイル出力なし）
         log_level: ログレベル（DEBUG/INFO/WARNING/ERROR）
@@ -23,11 +35,13 @@ def setup_logging(
     Returns:
         設定済みのロガー
     """
+    global _listener
     # ルートロガーを取得
     logger = logging.getLogger("csp_name_splitter")
     logger.setLevel(getattr(logging, log_level.upper(), logging.INFO))
     
-    # 既存のハンドラをクリア
+    # 既存のハンドラと前回のリスナーを片付ける
+    shutdown_logging()
     logger.handlers.clear()
     
     # フォーマッタを作成
@@ -36,23 +50,45 @@ def setup_logging(
         datefmt="%Y-%m-%d %H:%M:%S",
     )
     
+    handlers: list[logging.Handler] = []
+
     # ファイルハンドラを追加
     if log_file:
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
         file_handler = logging.FileHandler(log_path, encoding="utf-8")
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
     
     # コンソールハンドラを追加
     if console:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
+
+    if handlers:
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        logger.addHandler(QueueHandler(log_queue))
+        _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
     
     return logger
 
 
+def shutdown_logging() -> None:
+    """バックグラウンドリスナーを停止し、溜まったログを書き出してハンドラを閉じる"""
+    global _listener
+    listener, _listener = _listener, None
+    if listener is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+atexit.register(shutdown_logging)
+
+
 def get_logger() -> logging.Logger:
     """設定済みロガーを取得"""
     return logging.getLogger("csp_name_splitter")
@@ -84,7 +120,8 @@ class LogCapture:
     
     def __init__(self, max_lines: int = 1000) -> None:
         self.max_lines = max_lines
-        self.lines: list[str] = []
+        # maxlen 付き deque: 上限超過時は先頭行が O(1) で捨てられる
+        self.lines: deque[str] = deque(maxlen=max_lines)
         self.handler = logging.StreamHandler(self)
         self.handler.setFormatter(
             logging.Formatter(
@@ -97,8 +134,6 @@ class LogCapture:
         """メッセージを記録"""
         if message.strip():
             self.lines.append(message.rstrip())
-            if len(self.lines) > self.max_lines:
-                self.lines.pop(0)
     
     def flush(self) -> None:
         """フラッシュ（何もしない）"""
@@ -130,4 +165,5 @@ __all__ = [
     "get_default_log_path",
     "get_logger",
     "setup_logging",
+    "shutdown_logging",
 ]
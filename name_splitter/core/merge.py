@@ -38,26 +38,28 @@ def apply_merge_rules(
 
     layer_rules = list(cfg.layer_rules)
     group_rules = list(cfg.group_rules)
+    group_rule_map = _rule_map(group_rules)
+    layer_rule_map = _rule_map(layer_rules)
 
-    for ref in _iter_layer_refs(layers, include_hidden=cfg.include_hidden_layers):
-        if ref.kind == "group":
-            rule = _match_rule(ref.name, group_rules)
-        else:
-            rule = _match_rule(ref.name, layer_rules)
+    matched_names: set[str] = set()
+
+    all_refs = _iter_layer_refs(layers, include_hidden=cfg.include_hidden_layers)
+    for ref in all_refs:
+        rule = (group_rule_map if ref.kind == "group" else layer_rule_map).get(ref.name)
         if rule is None:
             unmatched.append(ref)
             continue
         outputs.setdefault(rule.output_layer, []).append(ref)
+        matched_names.add(ref.name)
 
     warnings: list[str] = []
-    warnings.extend(_warn_unused_rules("merge.group_rules", group_rules, outputs))
-    warnings.extend(_warn_unused_rules("merge.layer_rules", layer_rules, outputs))
+    warnings.extend(_warn_unused_rules("merge.group_rules", group_rules, matched_names))
+    warnings.extend(_warn_unused_rules("merge.layer_rules", layer_rules, matched_names))
 
     output_images = {}
     if canvas_size is not None:
-        output_images = _build_output_images(
-            layers, outputs, canvas_size=canvas_size, include_hidden=cfg.include_hidden_layers
-        )
+        # ツリーは上で一度だけ走査済みなので、その参照列を合成にも使う
+        output_images = _build_output_images(all_refs, outputs, canvas_size=canvas_size)
 
     return MergeResult(
         outputs=outputs, output_images=output_images, unmatched=unmatched, warnings=warnings
@@ -65,12 +67,19 @@ def apply_merge_rules(
 
 
 def _iter_layer_refs(layers: tuple[LayerNode, ...], include_hidden: bool) -> list[LayerRef]:
-    # レイヤーツリーをフラットな参照列に変換
-    refs: list[LayerRef] = []
+    """Flatten the layer tree into refs in depth-first pre-order.
 
-    def walk(node: LayerNode, path: tuple[str, ...]) -> None:
+    Why: Recursing through a nested closure costs a Python frame per node and
+         can hit the recursion limit on deeply nested groups.
+    How: Walk with an explicit stack. Children are pushed in reverse so they
+         pop in their original order; hidden nodes prune their subtree.
+    """
+    refs: list[LayerRef] = []
+    stack: list[tuple[LayerNode, tuple[str, ...]]] = [(layer, ()) for layer in reversed(layers)]
+    while stack:
+        node, path = stack.pop()
         if not include_hidden and not node.visible:
-            return
+            continue
         current_path = path + (node.name,)
         refs.append(
             LayerRef(
@@ -81,79 +90,65 @@ def _iter_layer_refs(layers: tuple[LayerNode, ...], include_hidden: bool) -> lis
                 pixels=node.pixels,
             )
         )
-        for child in node.children:
-            walk(child, current_path)
-
-    for layer in layers:
-        walk(layer, ())
+        if node.children:
+            stack.extend((child, current_path) for child in reversed(node.children))
     return refs
 
 
-def _match_rule(name: str, rules: list[MergeRule]) -> MergeRule | None:
-    """Find a matching rule by name.
+def _rule_map(rules: list[MergeRule]) -> dict[str | None, MergeRule]:
+    """Index rules by the name they match.
 
-    Why: Each layer/group name must be tested against all configured rules
-         to determine which output layer it belongs to.
-    How: Linear scan comparing the rule's group_name or layer_name against
-         the given name. Returns the first match or None.
+    Why: Scanning every rule for every layer/group is O(layers × rules),
+         while matching is an exact name comparison.
+    How: Map the rule's group_name (or layer_name) to the rule. setdefault
+         keeps the first rule for a name, so earlier rules still win.
     """
+    rule_map: dict[str | None, MergeRule] = {}
     for rule in rules:
         target = rule.group_name if rule.group_name is not None else rule.layer_name
-        if target == name:
-            return rule
-    return None
+        rule_map.setdefault(target, rule)
+    return rule_map
 
 
-def _warn_unused_rules(label: str, rules, outputs: dict[str, list[LayerRef]]) -> list[str]:
-    # 未使用ルールを警告として集計
+def _warn_unused_rules(label: str, rules, matched_names: set[str]) -> list[str]:
+    # 未使用ルールを警告として集計（matched_names はいずれかのルールに一致した名前）
     warnings: list[str] = []
-    matched_layers = {ref.name for refs in outputs.values() for ref in refs}
     for rule in rules:
         target = rule.group_name if rule.group_name is not None else rule.layer_name
-        if target not in matched_layers:
+        if target not in matched_names:
             warnings.append(f"{label}: no match for {target}")
     return warnings
 
 
 def _build_output_images(
-    layers: tuple[LayerNode, ...],
+    all_refs: list[LayerRef],
     outputs: dict[str, list[LayerRef]],
     *,
     canvas_size: tuple[int, int],
-    include_hidden: bool,
 ) -> dict[str, ImageData]:
     # ルールに一致したレイヤーを合成して出力レイヤー画像を作成
     output_images: dict[str, ImageData] = {}
-    leaf_refs = [
-        ref
-        for ref in _iter_layer_refs(layers, include_hidden=include_hidden)
-        if ref.kind == "layer" and ref.pixels is not None
-    ]
+    leaf_refs = [ref for ref in all_refs if ref.kind == "layer" and ref.pixels is not None]
+    # 各リーフの祖先パス集合は出力レイヤーに依らないので一度だけ作る
+    leaf_ancestors = {
+        ref.path: frozenset(ref.path[:index] for index in range(1, len(ref.path)))
+        for ref in leaf_refs
+    }
     for output_name, refs in outputs.items():
         layer_paths = {ref.path for ref in refs if ref.kind == "layer"}
         group_paths = {ref.path for ref in refs if ref.kind == "group"}
         composite_sources: list[tuple[ImageData, tuple[int, int]]] = []
         seen_paths: set[tuple[str, ...]] = set()
         for leaf_ref in leaf_refs:
-            if leaf_ref.path in layer_paths:
-                pass
-            else:
-                if not _has_ancestor(leaf_ref.path, group_paths):
-                    continue
-            if leaf_ref.path in seen_paths or leaf_ref.pixels is None:
+            path = leaf_ref.path
+            if path not in layer_paths and group_paths.isdisjoint(leaf_ancestors[path]):
+                continue
+            if path in seen_paths or leaf_ref.pixels is None:
                 continue
-            seen_paths.add(leaf_ref.path)
+            seen_paths.add(path)
             pixels = leaf_ref.pixels
             x0, y0, _x1, _y1 = pixels.bbox
             composite_sources.append((pixels.image, (x0, y0)))
         if composite_sources:
             output_images[output_name] = composite_layers(canvas_size, composite_sources)
     return output_images
-
-
-def _has_ancestor(path: tuple[str, ...], group_paths: set[tuple[str, ...]]) -> bool:
-    # グループパスの子孫かどうかを判定
-    for index in range(1, len(path)):
-        if path[:index] in group_paths:
-            return True
-    return False
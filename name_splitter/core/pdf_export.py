@@ -2,17 +2,24 @@
 
 Why: Users need a single PDF file containing all split pages for
      printing, sharing, or archiving, rather than many separate PNGs.
-How: Uses Pillow's PDF save capability to merge page images into a
-     multi-page PDF. Each page image is converted to RGB (PDF does not
-     support RGBA) and appended in order.
+How: Each page image is converted to RGB (PDF does not support RGBA),
+     JPEG-encoded with Pillow and streamed into a minimal multi-page PDF
+     (one DCTDecode image XObject per page) in order.
 """
 from __future__ import annotations
 
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from io import BytesIO
+from itertools import islice
 from pathlib import Path
-from typing import Sequence
+from typing import BinaryIO, Sequence
 
 from .render import RenderedPage
 
+# Upper bound on page images decoded concurrently ahead of the PDF writer
+_PREFETCH_WORKERS = 4
+
 
 def export_pdf(
     rendered_pages: Sequence[RenderedPage],
@@ -27,8 +34,10 @@ def export_pdf(
     Why: Splitting produces many individual image files; a single PDF is
          more convenient for print workflows and document sharing.
     How: Opens each page's target layer image with Pillow, converts RGBA
-         to RGB (white background), then saves as multi-page PDF using
-         Pillow's ``save_all`` + ``append_images`` feature.
+         to RGB (white background) and JPEG-encodes it on a small thread
+         pool, then appends the encoded page to the PDF file in order.
+         Only a window of _PREFETCH_WORKERS pages is decoded at a time,
+         so memory does not grow with the page count.
 
     Args:
         rendered_pages: Ordered list of rendered page results.
@@ -45,30 +54,20 @@ def export_pdf(
         FileNotFoundError: If a page image file does not exist.
     """
     try:
-        from PIL import Image
+        from PIL import Image  # noqa: F401
     except ImportError as exc:
         raise RuntimeError("Pillow is required for PDF export") from exc
 
-    rgb_images: list[Image.Image] = []
+    image_paths: list[Path] = []
     for page in rendered_pages:
         image_path = page.layer_paths.get(layer_name)
         if image_path is None:
             continue
         if not image_path.exists():
             raise FileNotFoundError(f"Page image not found: {image_path}")
-        img = Image.open(image_path)
-        # Why: PDF format does not support alpha channel
-        # How: Composite onto white background to convert RGBA → RGB
-        if img.mode == "RGBA":
-            background = Image.new("RGB", img.size, (255, 255, 255))
-            background.paste(img, mask=img.split()[3])
-            rgb_images.append(background)
-        elif img.mode != "RGB":
-            rgb_images.append(img.convert("RGB"))
-        else:
-            rgb_images.append(img)
-
-    if not rgb_images:
+        image_paths.append(image_path)
+
+    if not image_paths:
         raise RuntimeError(
             f"No valid page images found for layer '{layer_name}'. "
             "Ensure pages have been rendered before exporting PDF."
@@ -76,28 +75,141 @@ def export_pdf(
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    first_page = rgb_images[0]
-    remaining_pages = rgb_images[1:]
-
-    first_page.save(
-        str(output_path),
-        format="PDF",
-        resolution=dpi,
-        save_all=True,
-        append_images=remaining_pages,
-    )
-
-    # Why: Pillow save may silently succeed without writing (e.g. disk full)
-    # How: Verify output file exists and is non-empty after save
-    resolved = output_path.resolve()
-    if not resolved.exists():
-        raise RuntimeError(
-            f"PDF export completed without error but file was not created: {resolved}"
+    # Why: Holding every decoded page until the end costs N × W × H × 3
+    #      bytes; pages are independent, so they can be written one by one.
+    # How: Keep at most _PREFETCH_WORKERS pages in flight on the pool and
+    #      write each encoded page as soon as its turn comes, in order.
+    workers = min(_PREFETCH_WORKERS, len(image_paths))
+    remaining = iter(image_paths)
+    with ThreadPoolExecutor(max_workers=workers) as executor, output_path.open("wb") as handle:
+        pending: deque[Future[tuple[int, int, bytes]]] = deque(
+            executor.submit(_encode_page, path, jpeg_quality)
+            for path in islice(remaining, workers)
         )
-    file_size = resolved.stat().st_size
+        writer = _PdfWriter(handle)
+        while pending:
+            width, height, jpeg = pending.popleft().result()
+            next_path = next(remaining, None)
+            if next_path is not None:
+                pending.append(executor.submit(_encode_page, next_path, jpeg_quality))
+            writer.add_page(width, height, jpeg, dpi)
+        writer.close()
+
+    # Why: A write may silently succeed without data reaching disk (e.g. disk full)
+    # How: Verify output file exists and is non-empty after writing, with a
+    #      single stat(); the path is only resolved to build an error message.
+    try:
+        file_size = output_path.stat().st_size
+    except FileNotFoundError:
+        raise RuntimeError(
+            "PDF export completed without error but file was not created: "
+            f"{output_path.resolve()}"
+        ) from None
     if file_size == 0:
         raise RuntimeError(
-            f"PDF export created an empty file (0 bytes): {resolved}"
+            f"PDF export created an empty file (0 bytes): {output_path.resolve()}"
         )
 
     return output_path
+
+
+def _load_rgb_page(image_path: Path):
+    """Decode one page image and return it as a loaded RGB image."""
+    from PIL import Image
+
+    img = Image.open(image_path)
+    # Why: PDF format does not support alpha channel
+    # How: Composite onto white background to convert RGBA → RGB. An RGBA
+    #      image used as its own mask supplies its alpha band directly, so
+    #      no band is split out or copied.
+    if img.mode == "RGBA":
+        background = Image.new("RGB", img.size, (255, 255, 255))
+        background.paste(img, mask=img)
+        return background
+    if img.mode != "RGB":
+        return img.convert("RGB")
+    return img
+
+
+def _encode_page(image_path: Path, jpeg_quality: int) -> tuple[int, int, bytes]:
+    """Load one page as RGB and return (width, height, JPEG bytes)."""
+    image = _load_rgb_page(image_path)
+    buffer = BytesIO()
+    image.save(buffer, format="JPEG", quality=jpeg_quality)
+    return image.width, image.height, buffer.getvalue()
+
+
+def _pdf_number(value: float) -> str:
+    """Format a PDF real number without exponent notation."""
+    return f"{value:.4f}".rstrip("0").rstrip(".")
+
+
+class _PdfWriter:
+    """Minimal streaming PDF writer: one full-page JPEG image per page.
+
+    Why: Pillow's PDF save needs every page image in memory at once.
+    How: Objects are written as pages arrive and their offsets recorded;
+         the page tree, cross-reference table and trailer go at the end.
+         Object 1 is the catalog and object 2 the page tree; each page
+         then takes three objects (image, content stream, page).
+    """
+
+    __slots__ = ("_handle", "_offsets", "_page_ids")
+
+    def __init__(self, handle: BinaryIO) -> None:
+        self._handle = handle
+        self._offsets: dict[int, int] = {}
+        self._page_ids: list[int] = []
+        handle.write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        self._write_object(1, b"<< /Type /Catalog /Pages 2 0 R >>")
+
+    def _write_object(self, obj_id: int, body: bytes, stream: bytes | None = None) -> None:
+        handle = self._handle
+        self._offsets[obj_id] = handle.tell()
+        handle.write(b"%d 0 obj\n" % obj_id)
+        handle.write(body)
+        if stream is not None:
+            handle.write(b"\nstream\n")
+            handle.write(stream)
+            handle.write(b"\nendstream")
+        handle.write(b"\nendobj\n")
+
+    def add_page(self, width: int, height: int, jpeg: bytes, dpi: int) -> None:
+        image_id = 3 + 3 * len(self._page_ids)
+        contents_id = image_id + 1
+        page_id = image_id + 2
+        page_w = _pdf_number(width * 72.0 / dpi)
+        page_h = _pdf_number(height * 72.0 / dpi)
+        self._write_object(
+            image_id,
+            b"<< /Type /XObject /Subtype /Image /Width %d /Height %d "
+            b"/ColorSpace /DeviceRGB /BitsPerComponent 8 /Filter /DCTDecode "
+            b"/Length %d >>" % (width, height, len(jpeg)),
+            jpeg,
+        )
+        contents = f"q {page_w} 0 0 {page_h} 0 0 cm /image Do Q".encode("ascii")
+        self._write_object(contents_id, b"<< /Length %d >>" % len(contents), contents)
+        self._write_object(
+            page_id,
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {page_w} {page_h}] "
+            f"/Resources << /ProcSet [/PDF /ImageC] /XObject << /image {image_id} 0 R >> >> "
+            f"/Contents {contents_id} 0 R >>".encode("ascii"),
+        )
+        self._page_ids.append(page_id)
+
+    def close(self) -> None:
+        kids = " ".join(f"{page_id} 0 R" for page_id in self._page_ids)
+        self._write_object(
+            2,
+            f"<< /Type /Pages /Kids [{kids}] /Count {len(self._page_ids)} >>".encode("ascii"),
+        )
+        handle = self._handle
+        size = max(self._offsets) + 1
+        xref_offset = handle.tell()
+        lines = [b"xref\n0 %d\n" % size, b"0000000000 65535 f \n"]
+        lines.extend(b"%010d 00000 n \n" % self._offsets[obj_id] for obj_id in range(1, size))
+        handle.write(b"".join(lines))
+        handle.write(
+            b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+            % (size, xref_offset)
+        )
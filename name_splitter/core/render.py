@@ -1,14 +1,14 @@
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable
 
+from . import _json
 from .config import Config
 from .grid import CellRect
 from .merge import MergeResult
-from .image_ops import ImageData
+from .image_ops import ImageData, save_pil_image
 from .image_read import ImageInfo
 
 
@@ -90,7 +90,7 @@ def write_plan(
     except ImportError:
         # Fallback to JSON if PyYAML not available
         manifest_path = out_dir / "plan.json"
-        manifest_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        manifest_path.write_bytes(_json.dumps(payload, indent=True))
     return RenderPlan(out_dir=out_dir, manifest_path=manifest_path)
 
 
@@ -128,12 +128,14 @@ def render_pages(
             if image is None:
                 # 指定レイヤーがない場合は透明で埋める
                 image = ImageData.blank(image_info.width, image_info.height)
-            cropped = image.crop(cell.x0, cell.y0, cell.x1, cell.y1)
+            size: tuple[int, int] | None = None
             if do_resize:
                 scale = output_dpi / source_dpi
-                new_w = max(1, round(cropped.width * scale))
-                new_h = max(1, round(cropped.height * scale))
-                cropped = cropped.resize(new_w, new_h)
+                new_w = max(1, round((cell.x1 - cell.x0) * scale))
+                new_h = max(1, round((cell.y1 - cell.y0) * scale))
+                size = (new_w, new_h)
+            # セルは保存するだけなので、ImageData を経由せず Pillow 画像として切り出す
+            cropped = image.crop_pil(cell.x0, cell.y0, cell.x1, cell.y1, size)
             if cfg.output.layout == "layers":
                 layer_dir = out_dir / layer_name
                 layer_dir.mkdir(parents=True, exist_ok=True)
@@ -141,7 +143,7 @@ def render_pages(
             else:
                 page_dir.mkdir(parents=True, exist_ok=True)
                 path = page_dir / f"{layer_name}.{cfg.output.raster_ext}"
-            cropped.save(path, dpi=target_dpi)
+            save_pil_image(cropped, path, dpi=target_dpi)
             layer_paths[layer_name] = path
         rendered = RenderedPage(page_index=page_index, page_dir=page_dir, layer_paths=layer_paths)
         pages.append(rendered)
@@ -1,15 +1,24 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from pathlib import Path
+from typing import Container, Iterable
 
 import pytest
+from PIL import Image
 
 from name_splitter.core.batch import (
+    BatchJobSpec,
+    BatchProgress,
+    clear_config_cache,
     find_config_for_image,
     find_images_in_directory,
+    iter_batch,
     prepare_batch_jobs,
+    run_batch,
 )
 from name_splitter.core.config import Config, GridConfig, load_default_config
+from name_splitter.core.job import CancelToken
 
 
 def test_find_images_in_directory(tmp_path: Path) -> None:
@@ -38,6 +47,20 @@ def test_find_images_in_directory(tmp_path: Path) -> None:
     assert len(images) == 3
 
 
+def test_find_images_in_directory_sorted_and_case_insensitive(tmp_path: Path) -> None:
+    """拡張子の大文字小文字を区別せず、パス順に整列して返すこと"""
+    (tmp_path / "b.PNG").write_text("dummy")
+    (tmp_path / "a.png").write_text("dummy")
+    (tmp_path / "notes.png.txt").write_text("dummy")
+    nested = tmp_path / "a" / "deep"
+    nested.mkdir(parents=True)
+    (nested / "c.png").write_text("dummy")
+
+    images = find_images_in_directory(tmp_path, recursive=True)
+    assert images == sorted(images)
+    assert [img.name for img in images] == ["c.png", "a.png", "b.PNG"]
+
+
 def test_find_config_for_image(tmp_path: Path) -> None:
     """画像に対応する設定ファイル検索テスト"""
     default_cfg = load_default_config()
@@ -63,6 +86,23 @@ grid:
     assert cfg.grid.cols == 2
 
 
+def test_find_config_for_image_shares_parsed_config(tmp_path: Path) -> None:
+    """同じ設定ファイルは1回だけ解析され、同一の Config が返ること"""
+    clear_config_cache()
+    default_cfg = load_default_config()
+    (tmp_path / "page.yaml").write_text("version: 1\ngrid:\n  rows: 3\n")
+    image_path = tmp_path / "page.png"
+
+    first = find_config_for_image(image_path, default_cfg)
+    assert first.grid.rows == 3
+    assert find_config_for_image(image_path, default_cfg) is first
+
+    clear_config_cache()
+    again = find_config_for_image(image_path, default_cfg)
+    assert again is not first
+    assert again == first
+
+
 def test_prepare_batch_jobs(tmp_path: Path) -> None:
     """バッチジョブ準備テスト"""
     default_cfg = load_default_config()
@@ -95,6 +135,13 @@ def test_prepare_batch_jobs(tmp_path: Path) -> None:
     # 再帰的
     job_specs = prepare_batch_jobs([tmp_path], default_cfg, recursive=True)
     assert len(job_specs) == 3
+    
+    # 存在しないパス・PNG 以外のファイルは無視
+    (tmp_path / "notes.txt").write_text("dummy")
+    job_specs = prepare_batch_jobs(
+        [tmp_path / "missing.png", tmp_path / "notes.txt", image1], default_cfg
+    )
+    assert [spec.input_image for spec in job_specs] == [image1]
 
 
 def test_prepare_batch_jobs_with_auto_config(tmp_path: Path) -> None:
@@ -121,3 +168,72 @@ grid:
     job_specs = prepare_batch_jobs([tmp_path], default_cfg, auto_config=False)
     assert len(job_specs) == 1
     assert job_specs[0].config.grid.rows == 4  # デフォルト値
+
+
+def _make_specs(
+    tmp_path: Path, names: Iterable[str], bad: Container[str] = ()
+) -> list[BatchJobSpec]:
+    """names ごとに入力画像を作り、2x2 グリッドのジョブ仕様を返す（bad の名前は壊れた PNG）"""
+    cfg = replace(load_default_config(), grid=GridConfig(rows=2, cols=2))
+    specs = []
+    for name in names:
+        path = tmp_path / name
+        if name in bad:
+            path.write_text("not a png")
+        else:
+            Image.new("RGBA", (80, 60), (255, 255, 255, 255)).save(path)
+        specs.append(
+            BatchJobSpec(input_image=path, config=cfg, out_dir=tmp_path / "out" / path.stem)
+        )
+    return specs
+
+
+def test_run_batch_parallel_keeps_input_order(tmp_path: Path) -> None:
+    """並列実行でも結果が入力順で、完了ごとに進捗が通知されることを確認"""
+    specs = _make_specs(tmp_path, ["a.png", "b.png", "c.png"], bad={"b.png"})
+    events: list[int] = []
+
+    result = run_batch(
+        specs,
+        on_progress=lambda ev: events.append(ev.current_job),
+        max_workers=2,
+    )
+
+    assert [r.input_image for r in result.results] == [s.input_image for s in specs]
+    assert [r.success for r in result.results] == [True, False, True]
+    assert (result.successful_jobs, result.failed_jobs) == (2, 1)
+    assert sorted(events) == [1, 2, 3]
+
+
+def test_run_batch_sequential_forwards_job_progress(tmp_path: Path) -> None:
+    """逐次実行でジョブ内の進捗が現在のジョブ番号・名前付きで通知されることを確認"""
+    specs = _make_specs(tmp_path, ["a.png", "b.png"])
+    events: list[BatchProgress] = []
+
+    result = run_batch(specs, on_progress=events.append)
+
+    assert result.successful_jobs == 2
+    job_events = [ev for ev in events if ev.job_progress is not None]
+    assert job_events
+    assert {(ev.current_job, ev.job_name) for ev in job_events} == {
+        (1, "a.png"),
+        (2, "b.png"),
+    }
+
+
+def test_iter_batch_streams_results_and_honours_cancel(tmp_path: Path) -> None:
+    """iter_batch が1件ずつ結果を返し、キャンセル後は残りを失敗として返すことを確認"""
+    specs = _make_specs(tmp_path, [f"p{i}.png" for i in range(3)])
+    images = [spec.input_image for spec in specs]
+    token = CancelToken()
+    stream = iter_batch(specs, cancel_token=token)
+
+    first = next(stream)
+    assert first.input_image == images[0]
+    assert first.success
+
+    token.cancel()
+    rest = list(stream)
+    assert [r.input_image for r in rest] == images[1:]
+    assert not any(r.success for r in rest)
+    assert not (tmp_path / "out" / "p1").exists()
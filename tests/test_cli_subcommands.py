@@ -77,6 +77,13 @@ class TestBatchSubcommand:
         args = parser.parse_args(["batch", "/some/dir"])
         assert args.subcommand == "batch"
         assert args.input_dir == "/some/dir"
+        assert args.workers == 1
+
+    def test_batch_workers_option_parses(self) -> None:
+        """--workers sets the number of parallel batch workers."""
+        parser = _build_subcommand_parser()
+        args = parser.parse_args(["batch", "/some/dir", "--workers", "4"])
+        assert args.workers == 4
 
     def test_batch_missing_dir_exits(self) -> None:
         """TC-A4-008: batch without input_dir exits with error."""
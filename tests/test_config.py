@@ -3,7 +3,14 @@ from pathlib import Path
 import tempfile
 import os
 
-from name_splitter.core.config import GridConfig, load_config
+from name_splitter.core.config import (
+    Config,
+    GridConfig,
+    clear_config_cache,
+    load_config,
+    validate_config,
+)
+from name_splitter.core.errors import ConfigError
 from name_splitter.app.gui_utils import mm_to_px
 
 
@@ -113,6 +120,73 @@ limits:
         finally:
             os.unlink(temp_path)
 
+    def test_load_config_reuses_parsed_config_until_file_changes(self) -> None:
+        """Unchanged files return the cached Config; edits are picked up."""
+        clear_config_cache()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "cfg.yaml"
+            path.write_text("version: 1\ngrid:\n  rows: 2\n", encoding="utf-8")
+            first = load_config(path)
+            self.assertIs(load_config(str(path)), first)
+
+            path.write_text("version: 1\ngrid:\n  rows: 5\n", encoding="utf-8")
+            stat = path.stat()
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            self.assertEqual(load_config(path).grid.rows, 5)
+
+    def test_load_config_json_with_and_without_orjson(self) -> None:
+        """JSON configs parse the same with orjson and the stdlib fallback."""
+        from unittest import mock
+
+        from name_splitter.core import _json
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "cfg.json"
+            path.write_text('{"version": 1, "grid": {"rows": 6, "cols": 2}}', encoding="utf-8")
+            clear_config_cache()
+            fast = load_config(path)
+            clear_config_cache()
+            with mock.patch.object(_json, "_orjson", None):
+                fallback = load_config(path)
+        self.assertEqual(fast, fallback)
+        self.assertEqual((fast.grid.rows, fast.grid.cols), (6, 2))
+
+    def test_load_config_missing_file_raises(self) -> None:
+        """A missing file raises ConfigError naming the given path."""
+        with self.assertRaisesRegex(ConfigError, "missing.yaml"):
+            load_config("missing.yaml")
+
+    def test_load_config_parses_merge_rules(self) -> None:
+        """Merge rules are coerced to str and invalid entries report their index."""
+        clear_config_cache()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "cfg.yaml"
+            path.write_text(
+                "merge:\n"
+                "  layer_rules:\n"
+                "    - {layer_name: 12, output_layer: ' lines '}\n"
+                "    - {group_name: BG, layer_name: null, output_layer: bg}\n",
+                encoding="utf-8",
+            )
+            rules = load_config(path).merge.layer_rules
+            self.assertEqual((rules[0].layer_name, rules[0].output_layer), ("12", "lines"))
+            self.assertEqual((rules[1].group_name, rules[1].layer_name), ("BG", None))
+
+            path.write_text(
+                "merge:\n  group_rules:\n    - {output_layer: bg}\n", encoding="utf-8"
+            )
+            clear_config_cache()
+            with self.assertRaisesRegex(ConfigError, r"merge.group_rules\[0\] requires"):
+                load_config(path)
+
+    def test_validate_config_reports_first_violation(self) -> None:
+        """The first failing rule wins and dynamic values appear in the message."""
+        validate_config(Config())
+        with self.assertRaisesRegex(ConfigError, "Unsupported config version: 2"):
+            validate_config(Config(version=2, grid=GridConfig(rows=0)))
+        with self.assertRaisesRegex(ConfigError, "grid.order must be one of"):
+            validate_config(Config(grid=GridConfig(order="zigzag")))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,32 @@
+"""name_splitter.core の遅延 import のテスト。
+
+Why: core/__init__ は PEP 562 の __getattr__ で公開名を遅延解決するため、
+     従来どおり import できることと、未知の名前が AttributeError になることを保証する。
+How: 公開名をサブモジュールの実体と同一性比較し、__all__ 全件を解決する。
+"""
+from __future__ import annotations
+
+import pytest
+
+import name_splitter.core as core
+from name_splitter.core import config, job
+
+
+def test_lazy_names_resolve_to_submodule_objects() -> None:
+    """公開名がサブモジュールの定義と同一のオブジェクトを返すこと。"""
+    assert core.Config is config.Config
+    assert core.run_job is job.run_job
+    assert "Config" in vars(core)
+
+
+def test_all_public_names_resolve() -> None:
+    """__all__ の全ての名前が解決でき、dir() に含まれること。"""
+    for name in core.__all__:
+        assert getattr(core, name) is not None
+    assert set(core.__all__) <= set(dir(core))
+
+
+def test_unknown_name_raises_attribute_error() -> None:
+    """未定義の名前は AttributeError になること。"""
+    with pytest.raises(AttributeError):
+        core.no_such_name  # noqa: B018
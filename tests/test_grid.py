@@ -25,6 +25,13 @@ class GridTests(unittest.TestCase):
         self.assertEqual((cells[0].x0, cells[0].x1), (1, 3))
         self.assertEqual((cells[1].x0, cells[1].x1), (4, 6))
 
+    def test_cell_rect_has_no_instance_dict(self) -> None:
+        # slots=True によりセル矩形がインスタンス辞書を持たないことを確認
+        grid = GridConfig(rows=1, cols=1, margin_px=0, gutter_px=0)
+        cell = compute_cells(2, 2, grid)[0]
+        self.assertFalse(hasattr(cell, "__dict__"))
+        self.assertFalse(hasattr(grid, "__dict__"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,46 @@
+"""GUI ログ表示 (ListView 行追加) のテスト。
+
+Why: ログは 1 行ごとに ListView の行として追加されるため、
+     追加・クリアが行リストを正しく操作することを保証する。
+How: GuiHandlers を __new__ で生成し、w.ui を MagicMock で差し替えて
+     add_log / on_clear_log を直接呼び出す。
+"""
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from name_splitter.app.gui_handlers import GuiHandlers
+
+
+def _make_handlers() -> GuiHandlers:
+    """ログ行を SimpleNamespace で表す最小限の GuiHandlers を生成する。"""
+    handlers = GuiHandlers.__new__(GuiHandlers)
+    ui = MagicMock()
+    ui.log_field.controls = []
+    ui.log_line = lambda line: SimpleNamespace(value=line)
+    handlers.w = SimpleNamespace(ui=ui)  # type: ignore[assignment]
+    handlers.page = MagicMock()
+    return handlers
+
+
+def test_add_log_appends_one_row_per_line() -> None:
+    """add_log は呼び出しごとに 1 行を追加し、既存行を変更しないこと。"""
+    handlers = _make_handlers()
+    handlers.add_log("first")
+    first_row = handlers.w.ui.log_field.controls[0]
+    handlers.add_log("second")
+
+    rows = handlers.w.ui.log_field.controls
+    assert len(rows) == 2
+    assert rows[0] is first_row
+    assert rows[0].value.endswith(" first")
+    assert rows[1].value.endswith(" second")
+
+
+def test_clear_log_removes_all_rows() -> None:
+    """on_clear_log で全行が削除されること。"""
+    handlers = _make_handlers()
+    handlers.add_log("line")
+    handlers.on_clear_log(None)
+    assert handlers.w.ui.log_field.controls == []
@@ -33,12 +33,15 @@ class TestParsers:
         assert parse_int("42", "TestField") == 42
         assert parse_int("0", "TestField") == 0
         assert parse_int("-10", "TestField") == -10
+        assert parse_int(" 7 ", "TestField") == 7
     
     def test_parse_int_invalid(self):
         with pytest.raises(ValueError, match="TestField must be an integer"):
             parse_int("abc", "TestField")
         with pytest.raises(ValueError, match="TestField must be an integer"):
             parse_int("3.14", "TestField")
+        with pytest.raises(ValueError, match="TestField must be an integer"):
+            parse_int("1,000", "TestField")
     
     def test_parse_float_valid(self):
         assert parse_float("3.14", "TestField") == pytest.approx(3.14)
@@ -65,6 +68,10 @@ class TestUnitConversion:
         # A4 width @ 600dpi
         assert mm_to_px(210, 600) == 4961
     
+    def test_mm_to_px_rounds_half_up(self):
+        # 120.65mm @ 150dpi = 712.5px exactly
+        assert mm_to_px(120.65, 150) == 713
+    
     def test_px_to_mm_300dpi(self):
         assert px_to_mm(300, 300) == pytest.approx(25.4)
         assert px_to_mm(2480, 300) == pytest.approx(210, abs=0.5)
@@ -96,6 +103,11 @@ class TestUnitConversion:
     def test_convert_unit_value_same_unit(self):
         result = convert_unit_value("100", "px", "px", 300)
         assert result == "100"
+    
+    def test_convert_unit_value_non_numeric_unchanged(self):
+        assert convert_unit_value("abc", "px", "mm", 300) == "abc"
+        assert convert_unit_value("1,000", "mm", "px", 300) == "1,000"
+        assert convert_unit_value("", "px", "mm", 300) == ""
 
 
 class TestPageSizeComputation:
@@ -278,6 +290,18 @@ class TestGridConfigBuilder:
         assert grid.gutter_px == 5
         assert grid.dpi == 300
     
+    def test_build_grid_config_reuses_result_for_equal_params(self):
+        def make_params():
+            return GridConfigParams(
+                rows="3", cols="2", order="rtl_ttb",
+                margin_top="0", margin_bottom="0", margin_left="0", margin_right="0",
+                margin_unit="px", gutter="0", gutter_unit="px", dpi="300",
+                page_size_name="A4", orientation="portrait",
+                page_width_px=0, page_height_px=0, page_size_unit="px",
+            )
+        
+        assert build_grid_config(make_params()) is build_grid_config(make_params())
+    
     def test_build_grid_config_mm_unit(self):
         params = GridConfigParams(
             rows="2",
@@ -352,6 +376,43 @@ class TestTemplateStyleBuilder:
         assert style.finish_offset_y_mm == 0.0
         assert style.basic_offset_x_mm == 5.0
         assert style.basic_offset_y_mm == 5.0
+    
+    def test_build_template_style_disabled_frame_skips_parsing(self):
+        params = TemplateStyleParams(
+            grid_color="#FF5030",
+            grid_alpha="170",
+            grid_width="1",
+            finish_color="#FFFFFF",
+            finish_alpha="200",
+            finish_line_width="bad",
+            finish_size_mode="Custom mm",
+            finish_width="bad",
+            finish_height="",
+            finish_offset_x="bad",
+            finish_offset_y="0",
+            draw_finish=False,
+            basic_color="#00AAFF",
+            basic_alpha="200",
+            basic_line_width="2",
+            basic_size_mode="Use per-page size",
+            basic_width="",
+            basic_height="",
+            basic_offset_x="0",
+            basic_offset_y="0",
+            draw_basic=True,
+            dpi=300,
+            orientation="portrait",
+            page_width_px=2480,
+            page_height_px=3508,
+        )
+        
+        style = build_template_style(params)
+        
+        assert style.draw_finish is False
+        assert style.finish_width == 0
+        assert style.finish_width_mm == 0.0
+        assert style.basic_width == 2
+        assert style.basic_width_mm == pytest.approx(210, abs=0.5)
 
 
 if __name__ == "__main__":
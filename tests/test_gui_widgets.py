@@ -0,0 +1,91 @@
+"""WidgetBuilder のキャッシュ・遅延構築のテスト。
+
+Why: WidgetBuilder はフィールド群のキャッシュとタブの遅延構築を持つが、
+     flet 非依存で検証できるロジックなので単体テストで動作を固定する。
+How: flet モジュールを MagicMock で代替し、戻り値の同一性と
+     build コールバックの呼び出し回数を観察する。
+"""
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from name_splitter.app.gui_widgets import WidgetBuilder
+
+
+def test_create_fields_returns_cached_group() -> None:
+    """同じ builder で create_* を再度呼ぶと同じフィールド群オブジェクトが返ること。"""
+    builder = WidgetBuilder(MagicMock())
+    first = builder.create_common_fields()
+    assert builder.create_common_fields() is first
+    assert builder.create_template_fields() is builder.create_template_fields()
+
+
+def test_lazy_tab_builds_once_on_first_activation() -> None:
+    """lazy_tab の build は初回の ensure_tab_built でのみ呼ばれること。"""
+    builder = WidgetBuilder(MagicMock())
+    build = MagicMock(return_value="layout")
+    placeholder = builder.lazy_tab(2, build)
+    build.assert_not_called()
+
+    assert builder.ensure_tab_built(2) is True
+    assert builder.ensure_tab_built(2) is False
+    assert builder.ensure_tab_built(0) is False
+    build.assert_called_once_with()
+    assert placeholder.content == "layout"
+
+
+def test_widget_builder_has_no_instance_dict() -> None:
+    """__slots__ によりインスタンス辞書を持たないこと。"""
+    builder = WidgetBuilder(MagicMock())
+    assert not hasattr(builder, "__dict__")
+
+
+def test_lazy_field_properties_build_on_first_access() -> None:
+    """batch_fields プロパティは初回アクセスまでウィジェットを生成しないこと。"""
+    ft = MagicMock()
+    builder = WidgetBuilder(ft)
+    ft.OutlinedButton.assert_not_called()
+
+    fields = builder.batch_fields
+    assert builder.batch_fields is fields
+    assert builder.create_batch_fields() is fields
+    ft.OutlinedButton.assert_called_once()
+
+
+def test_update_recent_dropdown_mutates_only_on_change() -> None:
+    """update_recent_dropdown は内容が変わったときだけ options を差し替えること。"""
+    ft = MagicMock()
+    ft.dropdown.Option.side_effect = lambda key: MagicMock(key=key)
+    builder = WidgetBuilder(ft)
+    dropdown = MagicMock(options=[])
+    options = dropdown.options
+
+    assert builder.update_recent_dropdown(dropdown, ["a.png", "b.png"]) is True
+    assert dropdown.options is options
+    assert [o.key for o in options] == ["a.png", "b.png"]
+
+    assert builder.update_recent_dropdown(dropdown, ["a.png", "b.png"]) is False
+    assert builder.update_recent_dropdown(dropdown, ["b.png", "a.png"]) is True
+    assert [o.key for o in options] == ["b.png", "a.png"]
+
+
+def test_frame_panel_body_built_on_first_toggle() -> None:
+    """テンプレート枠パネルの本体は初回の開閉時にのみ生成されること。"""
+    ft = MagicMock()
+    ft.ExpansionPanel.side_effect = lambda **kw: SimpleNamespace(**kw)
+    ft.ExpansionPanelList.side_effect = lambda **kw: SimpleNamespace(**kw)
+    builder = WidgetBuilder(ft)
+    panel_list = builder._make_frame_panel(
+        builder.create_template_fields(), "finish", "Finish frame"
+    )
+    panel = panel_list.controls[0]
+    assert panel.content is None
+    ft.Column.assert_not_called()
+
+    panel_list.on_change(None)
+    body = panel.content
+    assert body is not None
+    panel_list.on_change(None)
+    assert panel.content is body
+    ft.Column.assert_called_once()
@@ -1,31 +1,113 @@
 import unittest
 
-from name_splitter.core.image_ops import ImageData
+from name_splitter.core.image_ops import ImageData, composite_layers
 
 
 class ImageOpsTests(unittest.TestCase):
     def test_composite_overlays_pixels(self) -> None:
         # 1ピクセルのオーバーレイ合成を確認
         base = ImageData.blank(2, 1)
-        overlay = ImageData(width=1, height=1, pixels=[[(255, 0, 0, 255)]])
+        overlay = ImageData.from_rows([[(255, 0, 0, 255)]])
         base.composite_over(overlay, 1, 0)
-        self.assertEqual(base.pixels[0][0], (0, 0, 0, 0))
-        self.assertEqual(base.pixels[0][1], (255, 0, 0, 255))
+        self.assertEqual(base.pixel(0, 0), (0, 0, 0, 0))
+        self.assertEqual(base.pixel(1, 0), (255, 0, 0, 255))
+
+    def test_composite_clips_negative_offset(self) -> None:
+        # 範囲外にはみ出すオーバーレイは重なり部分だけ合成されることを確認
+        base = ImageData.blank(2, 2, (0, 0, 255, 255))
+        overlay = ImageData.blank(2, 2, (255, 0, 0, 255))
+        base.composite_over(overlay, -1, 1)
+        self.assertEqual(base.pixel(0, 0), (0, 0, 255, 255))
+        self.assertEqual(base.pixel(0, 1), (255, 0, 0, 255))
+        self.assertEqual(base.pixel(1, 1), (0, 0, 255, 255))
+
+    def test_composite_blends_semi_transparent(self) -> None:
+        # 半透明の合成結果が "over" 合成の値になることを確認
+        base = ImageData.blank(1, 1, (0, 0, 255, 255))
+        overlay = ImageData.blank(1, 1, (255, 0, 0, 128))
+        base.composite_over(overlay, 0, 0)
+        r, g, b, a = base.pixel(0, 0)
+        self.assertEqual(a, 255)
+        self.assertAlmostEqual(r, 128, delta=1)
+        self.assertEqual(g, 0)
+        self.assertAlmostEqual(b, 127, delta=1)
+
+    def test_composite_transparent_overlay_is_noop(self) -> None:
+        # 完全透明なオーバーレイでは合成先が変わらないことを確認
+        base = ImageData.blank(2, 1, (1, 2, 3, 4))
+        before = bytes(base.data)
+        base.composite_over(ImageData.blank(2, 1), 0, 0)
+        self.assertEqual(bytes(base.data), before)
 
     def test_crop_bounds(self) -> None:
         # 切り出し範囲の結果を確認
-        image = ImageData(
-            width=2,
-            height=2,
-            pixels=[
-                [(1, 1, 1, 255), (2, 2, 2, 255)],
-                [(3, 3, 3, 255), (4, 4, 4, 255)],
-            ],
-        )
+        image = ImageData.from_rows([
+            [(1, 1, 1, 255), (2, 2, 2, 255)],
+            [(3, 3, 3, 255), (4, 4, 4, 255)],
+        ])
         cropped = image.crop(1, 0, 2, 1)
         self.assertEqual(cropped.width, 1)
         self.assertEqual(cropped.height, 1)
-        self.assertEqual(cropped.pixels[0][0], (2, 2, 2, 255))
+        self.assertEqual(cropped.pixel(0, 0), (2, 2, 2, 255))
+
+    def test_crop_full_width_rows(self) -> None:
+        # 全幅の切り出しは行をそのまま返すことを確認
+        image = ImageData.from_rows([
+            [(1, 1, 1, 255), (2, 2, 2, 255)],
+            [(3, 3, 3, 255), (4, 4, 4, 255)],
+        ])
+        cropped = image.crop(0, 1, 2, 2)
+        self.assertEqual((cropped.width, cropped.height), (2, 1))
+        self.assertEqual(cropped.pixel(1, 0), (4, 4, 4, 255))
+        self.assertEqual(len(cropped.data), 2 * 4)
+
+    def test_pil_round_trip(self) -> None:
+        # Pillow との相互変換でピクセル値が保たれることを確認
+        image = ImageData.from_rows([
+            [(1, 2, 3, 4), (5, 6, 7, 8)],
+            [(9, 10, 11, 12), (13, 14, 15, 16)],
+        ])
+        restored = ImageData.from_pil(image.to_pil())
+        self.assertEqual(restored, image)
+
+    def test_crop_pil_matches_crop_and_resize(self) -> None:
+        # crop_pil が crop → resize と同じ画素を返し、元画像を変更しないことを確認
+        image = ImageData.from_rows([
+            [(x * 10, y * 10, 0, 255) for x in range(4)] for y in range(3)
+        ])
+        before = bytes(image.data)
+        cell = image.crop_pil(1, 1, 3, 3)
+        self.assertEqual(ImageData.from_pil(cell), image.crop(1, 1, 3, 3))
+        resized = image.crop_pil(0, 0, 4, 3, (2, 2))
+        self.assertEqual(ImageData.from_pil(resized), image.crop(0, 0, 4, 3).resize(2, 2))
+        self.assertEqual(bytes(image.data), before)
+
+    def test_to_pil_does_not_share_the_buffer(self) -> None:
+        # to_pil の結果は元バッファの変更の影響を受けないことを確認
+        image = ImageData.blank(1, 1, (1, 2, 3, 255))
+        pil_image = image.to_pil()
+        image.data[0] = 200
+        self.assertEqual(pil_image.getpixel((0, 0)), (1, 2, 3, 255))
+
+    def test_from_pil_converts_non_rgba_modes(self) -> None:
+        # RGBA 以外のモードは RGBA に変換して取り込まれることを確認
+        from PIL import Image
+
+        gray = Image.new("L", (2, 1), 7)
+        image = ImageData.from_pil(gray)
+        self.assertEqual(image.pixel(1, 0), (7, 7, 7, 255))
+        self.assertEqual(len(image.data), 2 * 4)
+
+    def test_composite_layers_matches_sequential_composite(self) -> None:
+        # 一括合成が composite_over を順に適用した結果と一致することを確認
+        opaque = ImageData.blank(2, 2, (200, 0, 0, 255))
+        half = ImageData.blank(3, 2, (0, 0, 200, 128))
+        clear = ImageData.blank(2, 2, (9, 9, 9, 0))
+        layers = [(opaque, (-1, 0)), (half, (0, 1)), (clear, (1, 1)), (opaque, (9, 9))]
+        expected = ImageData.blank(3, 3)
+        for image, (x0, y0) in layers:
+            expected.composite_over(image, x0, y0)
+        self.assertEqual(composite_layers((3, 3), layers), expected)
 
 
 if __name__ == "__main__":
@@ -12,7 +12,9 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
+from PIL import Image
 
+from name_splitter.core import job
 from name_splitter.core.config import Config, GridConfig, LimitsConfig, OutputConfig
 from name_splitter.core.errors import LimitExceededError
 from name_splitter.core.image_read import ImageInfo
@@ -138,3 +140,38 @@ class TestEnforceLimits:
         info = ImageInfo(width=2000, height=2000)
         cfg = Config(limits=LimitsConfig(max_dim_px=2000))
         _enforce_limits(info, cfg)
+
+
+# ------------------------------------------------------------------
+# run_job render progress throttling
+# ------------------------------------------------------------------
+
+class TestRenderProgressThrottle:
+    @staticmethod
+    def _make_strip(tmp_path: Path, cols: int) -> tuple[Path, Config]:
+        """Build a cols x 1 image and a config that splits it into 1px pages."""
+        image_path = tmp_path / "strip.png"
+        Image.new("RGBA", (cols, 1), (0, 0, 0, 255)).save(image_path)
+        cfg = Config(
+            grid=GridConfig(rows=1, cols=cols, order="ltr_ttb", margin_px=0, gutter_px=0),
+            output=OutputConfig(raster_ext="ppm", layer_stack=("flat",)),
+        )
+        return image_path, cfg
+
+    def test_reports_percent_steps_and_last_page(self, tmp_path: Path) -> None:
+        image_path, cfg = self._make_strip(tmp_path, 300)
+        events: list[ProgressEvent] = []
+        with patch.object(job, "_PAGE_REPORT_INTERVAL", float("inf")):
+            job.run_job(
+                str(image_path), cfg, out_dir=str(tmp_path / "out"), on_progress=events.append
+            )
+
+        done = [e.done for e in events if e.message.startswith("Rendered page")]
+        assert done == list(range(3, 301, 3))
+
+    def test_no_progress_events_built_without_listener(self, tmp_path: Path) -> None:
+        image_path, cfg = self._make_strip(tmp_path, 2)
+        with patch.object(job, "ProgressEvent") as event_cls:
+            result = job.run_job(str(image_path), cfg, out_dir=str(tmp_path / "out"))
+        assert result.page_count == 2
+        event_cls.assert_not_called()
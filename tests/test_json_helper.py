@@ -0,0 +1,28 @@
+"""core._json（orjson / 標準 json 切り替え）のテスト。
+
+Why: plan.json と JSON 設定は orjson の有無で経路が変わるため、
+     どちらでも同じ内容を読み書きできることを保証する。
+How: _orjson を None に差し替えて標準 json 経路と出力を比較する。
+"""
+from __future__ import annotations
+
+from unittest import mock
+
+from name_splitter.core import _json
+
+_PAYLOAD = {"source": {"width": 4, "height": 2}, "name": "ページ", "pages": [], "dpi": 300}
+
+
+def test_dumps_matches_stdlib_fallback() -> None:
+    """orjson 経路と標準 json 経路で同じ UTF-8 バイト列になること。"""
+    fast = _json.dumps(_PAYLOAD, indent=True)
+    with mock.patch.object(_json, "_orjson", None):
+        fallback = _json.dumps(_PAYLOAD, indent=True)
+        assert _json.loads(fallback) == _PAYLOAD
+    assert fast == fallback
+    assert "ページ".encode("utf-8") in fast
+
+
+def test_loads_round_trips_compact_output() -> None:
+    """indent なしの出力を loads で元に戻せること。"""
+    assert _json.loads(_json.dumps(_PAYLOAD)) == _PAYLOAD
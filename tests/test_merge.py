@@ -2,7 +2,8 @@ import unittest
 
 from name_splitter.core.config import MergeConfig, MergeRule
 from name_splitter.core.merge import apply_merge_rules
-from name_splitter.core.image_read import LayerNode
+from name_splitter.core.image_ops import ImageData
+from name_splitter.core.image_read import LayerNode, LayerPixels
 
 
 class MergeTests(unittest.TestCase):
@@ -47,6 +48,69 @@ class MergeTests(unittest.TestCase):
         self.assertNotIn("notes", result.outputs)
         self.assertEqual(len(result.unmatched), 0)
 
+    def test_apply_merge_rules_first_rule_wins(self) -> None:
+        # 同名のルールが複数ある場合は先に定義したルールが使われることを確認
+        layers = (LayerNode(name="Lines", kind="layer", visible=True),)
+        cfg = MergeConfig(
+            layer_rules=(
+                MergeRule(layer_name="Lines", output_layer="first"),
+                MergeRule(layer_name="Lines", output_layer="second"),
+            ),
+        )
+        result = apply_merge_rules(layers, cfg)
+        self.assertEqual(list(result.outputs.keys()), ["first"])
+
+    def test_deeply_nested_groups_do_not_recurse(self) -> None:
+        # 再帰上限を超える深さのグループでもレイヤー参照を列挙できることを確認
+        node = LayerNode(name="Lines", kind="layer", visible=True)
+        for depth in range(3000):
+            node = LayerNode(name=f"G{depth}", kind="group", visible=True, children=(node,))
+        cfg = MergeConfig(layer_rules=(MergeRule(layer_name="Lines", output_layer="lines"),))
+        result = apply_merge_rules((node,), cfg)
+        (ref,) = result.outputs["lines"]
+        self.assertEqual(len(ref.path), 3001)
+        self.assertEqual(ref.path[0], "G2999")
+
+    def test_unused_rules_are_reported(self) -> None:
+        # どのレイヤーにも一致しなかったルールだけが警告されることを確認
+        layers = (LayerNode(name="Lines", kind="layer", visible=True),)
+        cfg = MergeConfig(
+            group_rules=(MergeRule(group_name="Missing", output_layer="text"),),
+            layer_rules=(MergeRule(layer_name="Lines", output_layer="lines"),),
+        )
+        result = apply_merge_rules(layers, cfg)
+        self.assertEqual(result.warnings, ["merge.group_rules: no match for Missing"])
+
+    def test_group_rule_composites_nested_leaves(self) -> None:
+        # グループルールは入れ子の子孫レイヤーも合成対象にすることを確認
+        def leaf(name: str, x0: int, color: tuple[int, int, int, int]) -> LayerNode:
+            pixels = LayerPixels(bbox=(x0, 0, x0 + 1, 1), image=ImageData.blank(1, 1, color))
+            return LayerNode(name=name, kind="layer", visible=True, pixels=pixels)
+
+        layers = (
+            LayerNode(
+                name="Outer",
+                kind="group",
+                visible=True,
+                children=(
+                    LayerNode(
+                        name="Inner",
+                        kind="group",
+                        visible=True,
+                        children=(leaf("A", 0, (255, 0, 0, 255)),),
+                    ),
+                    leaf("B", 1, (0, 255, 0, 255)),
+                ),
+            ),
+            leaf("C", 2, (0, 0, 255, 255)),
+        )
+        cfg = MergeConfig(group_rules=(MergeRule(group_name="Outer", output_layer="flat"),))
+        result = apply_merge_rules(layers, cfg, canvas_size=(3, 1))
+        image = result.output_images["flat"]
+        self.assertEqual(image.pixel(0, 0), (255, 0, 0, 255))
+        self.assertEqual(image.pixel(1, 0), (0, 255, 0, 255))
+        self.assertEqual(image.pixel(2, 0), (0, 0, 0, 0))
+
 
 if __name__ == "__main__":
     unittest.main()
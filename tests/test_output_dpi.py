@@ -30,7 +30,7 @@ def _make_simple_scene(
         [(i * 10, i * 10, i * 10, 255) for i in range(width)]
         for _ in range(height)
     ]
-    image = ImageData(width=width, height=height, pixels=pixels)
+    image = ImageData.from_rows(pixels)
     layers = (
         LayerNode(
             name="BG",
@@ -134,7 +134,7 @@ class TestImageDataResize(unittest.TestCase):
 
     def test_resize_identity(self) -> None:
         """Same dimensions should return self."""
-        img = ImageData(width=2, height=2, pixels=[
+        img = ImageData.from_rows([
             [(255, 0, 0, 255), (0, 255, 0, 255)],
             [(0, 0, 255, 255), (255, 255, 0, 255)],
         ])
@@ -143,7 +143,7 @@ class TestImageDataResize(unittest.TestCase):
 
     def test_resize_downscale(self) -> None:
         """Downscale should produce smaller image."""
-        img = ImageData(width=4, height=4, pixels=[
+        img = ImageData.from_rows([
             [(100, 100, 100, 255)] * 4 for _ in range(4)
         ])
         result = img.resize(2, 2)
@@ -152,7 +152,7 @@ class TestImageDataResize(unittest.TestCase):
 
     def test_resize_upscale(self) -> None:
         """Upscale should produce larger image."""
-        img = ImageData(width=2, height=2, pixels=[
+        img = ImageData.from_rows([
             [(50, 50, 50, 255)] * 2 for _ in range(2)
         ])
         result = img.resize(4, 4)
@@ -161,7 +161,7 @@ class TestImageDataResize(unittest.TestCase):
 
     def test_resize_zero_returns_blank(self) -> None:
         """Zero or negative dimensions should return 1x1 blank."""
-        img = ImageData(width=2, height=2, pixels=[
+        img = ImageData.from_rows([
             [(50, 50, 50, 255)] * 2 for _ in range(2)
         ])
         result = img.resize(0, 0)
@@ -174,7 +174,7 @@ class TestImageDataSaveDpi(unittest.TestCase):
 
     def test_save_png_with_dpi(self) -> None:
         """Saving with dpi > 0 should embed DPI metadata."""
-        img = ImageData(width=2, height=2, pixels=[
+        img = ImageData.from_rows([
             [(100, 100, 100, 255)] * 2 for _ in range(2)
         ])
         with tempfile.TemporaryDirectory() as tmp:
@@ -188,7 +188,7 @@ class TestImageDataSaveDpi(unittest.TestCase):
 
     def test_save_png_without_dpi(self) -> None:
         """Saving with dpi=0 should not embed DPI metadata."""
-        img = ImageData(width=2, height=2, pixels=[
+        img = ImageData.from_rows([
             [(100, 100, 100, 255)] * 2 for _ in range(2)
         ])
         with tempfile.TemporaryDirectory() as tmp:
@@ -204,12 +204,12 @@ class TestImageDataSaveDpi(unittest.TestCase):
 
 
 def _read_ppm_size(path: Path) -> tuple[int, int]:
-    """Read width/height from a PPM P3 header."""
-    with path.open("r", encoding="utf-8") as f:
-        if f.readline().strip() != "P3":
-            raise AssertionError("Not a P3 PPM file")
+    """Read width/height from a PPM P6 header."""
+    with path.open("rb") as f:
+        if f.readline().strip() != b"P6":
+            raise AssertionError("Not a P6 PPM file")
         line = f.readline().strip()
-        while line.startswith("#") or not line:
+        while line.startswith(b"#") or not line:
             line = f.readline().strip()
         w, h = line.split()
         return int(w), int(h)
@@ -98,11 +98,7 @@ class TestPageNumberOffset(unittest.TestCase):
 
     def test_start_from_3(self) -> None:
         """page_number_start=3 should produce page_003, page_004, ..."""
-        image = ImageData(
-            width=4,
-            height=2,
-            pixels=[[(10, 10, 10, 255)] * 4 for _ in range(2)],
-        )
+        image = ImageData.from_rows([[(10, 10, 10, 255)] * 4 for _ in range(2)])
         layers = (
             LayerNode(
                 name="BG",
@@ -133,11 +129,7 @@ class TestPageNumberOffset(unittest.TestCase):
 
     def test_default_start_from_1(self) -> None:
         """Default page_number_start=1 should produce page_001, page_002."""
-        image = ImageData(
-            width=4,
-            height=2,
-            pixels=[[(10, 10, 10, 255)] * 4 for _ in range(2)],
-        )
+        image = ImageData.from_rows([[(10, 10, 10, 255)] * 4 for _ in range(2)])
         layers = (
             LayerNode(
                 name="BG",
@@ -72,6 +72,56 @@ class TestExportPdf(unittest.TestCase):
                 header = f.read(5)
             self.assertEqual(header, b"%PDF-")
 
+    def test_pages_keep_input_order(self) -> None:
+        """Concurrent page loading still writes pages in rendered order."""
+        import re
+
+        widths = [3, 1, 4, 1, 5, 9, 2, 6]
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_path = Path(tmp)
+            pages = [
+                RenderedPage(
+                    page_index=i,
+                    page_dir=tmp_path,
+                    layer_paths={"flat": _create_test_png(tmp_path, f"p{i}.png", w, 2)},
+                )
+                for i, w in enumerate(widths)
+            ]
+            pdf_path = tmp_path / "output.pdf"
+
+            # Why: At 72 dpi the MediaBox width equals the pixel width
+            export_pdf(pages, pdf_path, layer_name="flat", dpi=72)
+
+            boxes = re.findall(rb"/MediaBox \[ ?0 0 ([\d.]+)", pdf_path.read_bytes())
+        self.assertEqual([int(float(w)) for w in boxes], widths)
+
+    def test_streamed_pdf_is_readable(self) -> None:
+        """The streamed PDF has a valid cross-reference table and page tree."""
+        from PIL import PdfParser
+
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_path = Path(tmp)
+            pages = [
+                RenderedPage(
+                    page_index=i,
+                    page_dir=tmp_path,
+                    layer_paths={"flat": _create_test_png(tmp_path, f"p{i}.png")},
+                )
+                for i in range(6)
+            ]
+            pdf_path = tmp_path / "output.pdf"
+            export_pdf(pages, pdf_path, layer_name="flat")
+
+            data = pdf_path.read_bytes()
+            pdf = PdfParser.PdfParser(str(pdf_path))
+            try:
+                self.assertEqual(len(pdf.pages), 6)
+                for obj_id in range(1, pdf.trailer_dict[b"Size"]):
+                    offset, _ = pdf.xref_table[obj_id]
+                    self.assertTrue(data[offset:].startswith(b"%d 0 obj" % obj_id))
+            finally:
+                pdf.close()
+
     def test_rgba_converted_to_rgb(self) -> None:
         """RGBA images are converted to RGB with white background for PDF."""
         with tempfile.TemporaryDirectory() as tmp:
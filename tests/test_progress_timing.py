@@ -146,6 +146,12 @@ class TestSelectPages:
         # 1-based: 2,4 → 0-indexed: 1,3
         assert pages == [1, 3]
 
+    def test_odd_even_after_skip(self) -> None:
+        """odd/even counts positions among the pages left after skipping."""
+        # remaining 1-based pages: 2,3,5,6 → odd positions: 2,5 → 0-indexed: 1,4
+        assert _select_pages(6, None, skip=(1, 4), odd_even="odd") == [1, 4]
+        assert _select_pages(6, None, skip=(1, 4), odd_even="even") == [2, 5]
+
 
 # ------------------------------------------------------------------ #
 #  Speed/ETA calculation in run_job's report() helper
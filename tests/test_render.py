@@ -13,8 +13,8 @@ from name_splitter.core.render import render_pages
 class RenderTests(unittest.TestCase):
     def test_merge_builds_output_images(self) -> None:
         # マージ結果が合成画像を生成することを確認
-        red_pixel = ImageData(width=1, height=1, pixels=[[(255, 0, 0, 255)]])
-        blue_pixel = ImageData(width=1, height=1, pixels=[[(0, 0, 255, 255)]])
+        red_pixel = ImageData.from_rows([[(255, 0, 0, 255)]])
+        blue_pixel = ImageData.from_rows([[(0, 0, 255, 255)]])
         layers = (
             LayerNode(
                 name="Red",
@@ -39,19 +39,15 @@ class RenderTests(unittest.TestCase):
         result = apply_merge_rules(layers, cfg, canvas_size=(2, 1))
         self.assertIn("lines", result.output_images)
         merged = result.output_images["lines"]
-        self.assertEqual(merged.pixels[0][0], (255, 0, 0, 255))
-        self.assertEqual(merged.pixels[0][1], (0, 0, 255, 255))
+        self.assertEqual(merged.pixel(0, 0), (255, 0, 0, 255))
+        self.assertEqual(merged.pixel(1, 0), (0, 0, 255, 255))
 
     def test_render_pages_writes_ppm(self) -> None:
         # PPM出力でページ分割が行えることを確認
-        image = ImageData(
-            width=2,
-            height=2,
-            pixels=[
-                [(10, 10, 10, 255), (20, 20, 20, 255)],
-                [(30, 30, 30, 255), (40, 40, 40, 255)],
-            ],
-        )
+        image = ImageData.from_rows([
+            [(10, 10, 10, 255), (20, 20, 20, 255)],
+            [(30, 30, 30, 255), (40, 40, 40, 255)],
+        ])
         layers = (
             LayerNode(
                 name="BG",
@@ -81,11 +77,11 @@ class RenderTests(unittest.TestCase):
 
 def _read_ppm_size(path: Path) -> tuple[int, int]:
     # PPMヘッダからサイズを読み取る簡易関数
-    with path.open("r", encoding="utf-8") as handle:
-        if handle.readline().strip() != "P3":
+    with path.open("rb") as handle:
+        if handle.readline().strip() != b"P6":
             raise AssertionError("Unexpected PPM format")
         line = handle.readline().strip()
-        while line.startswith("#") or not line:
+        while line.startswith(b"#") or not line:
             line = handle.readline().strip()
         width_str, height_str = line.split()
         return int(width_str), int(height_str)
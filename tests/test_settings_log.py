@@ -49,16 +49,30 @@ class TestLogFileSetup:
 
     def test_setup_logging_creates_file(self, tmp_path: Path) -> None:
         """setup_logging creates a log file when log_file is specified."""
-        from name_splitter.core.logging import setup_logging, get_logger
+        from name_splitter.core.logging import setup_logging, get_logger, shutdown_logging
         log_path = tmp_path / "test.log"
         setup_logging(log_file=log_path, console=False)
         logger = get_logger()
         logger.info("test message")
-        # Clean up handlers to avoid side effects
-        for handler in logger.handlers[:]:
-            if hasattr(handler, "baseFilename"):
-                handler.close()
-                logger.removeHandler(handler)
+        # Clean up the listener thread and handlers to avoid side effects
+        shutdown_logging()
+        logger.handlers.clear()
+
+    def test_setup_logging_writes_through_background_listener(self, tmp_path: Path) -> None:
+        """Records go through a QueueHandler and reach the file on shutdown."""
+        from logging.handlers import QueueHandler
+
+        from name_splitter.core.logging import get_logger, setup_logging, shutdown_logging
+
+        log_path = tmp_path / "queued.log"
+        logger = setup_logging(log_file=log_path, console=False)
+        try:
+            assert [type(h) for h in logger.handlers] == [QueueHandler]
+            get_logger().info("queued message")
+        finally:
+            shutdown_logging()
+            logger.handlers.clear()
+        assert "[INFO] queued message" in log_path.read_text(encoding="utf-8")
 
     def test_log_capture_records_messages(self) -> None:
         """LogCapture captures log messages via attach/detach."""
@@ -74,6 +88,14 @@ class TestLogFileSetup:
         logger.setLevel(original_level)
         assert any("hello" in line for line in cap.lines)
 
+    def test_log_capture_keeps_most_recent_lines(self) -> None:
+        """LogCapture drops the oldest lines once max_lines is exceeded."""
+        from name_splitter.core.logging import LogCapture
+        cap = LogCapture(max_lines=3)
+        for index in range(5):
+            cap.write(f"line {index}\n")
+        assert cap.get_log() == "line 2\nline 3\nline 4"
+
 
 # ------------------------------------------------------------------ #
 #  C-2: Config export includes B-1/B-2 output fields
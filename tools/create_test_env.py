@@ -17,7 +17,7 @@ def write_sample_png(path: Path, width: int = 16, height: int = 16) -> None:
       else:
         row.append((30, 30, 30, 255))
     pixels.append(row)
-  image = ImageData(width=width, height=height, pixels=pixels)
+  image = ImageData.from_rows(pixels)
   image.save(path)
 
 